@@ -0,0 +1,151 @@
+"""
+Uploaded asset resolution for DJ Brand Guide Generator.
+Indexes upload directories once and maps image prompts to files by identity.
+"""
+
+import os
+
+# Locations where container_upload places files in the sandbox, in priority order
+DEFAULT_UPLOAD_ROOTS = ("/mnt/user/uploads", "/mnt/user", "/uploads", ".")
+
+IMAGE_EXTENSIONS = {".png", ".jpg", ".jpeg"}
+
+
+class AssetResolver:
+    """
+    Index of image files in a set of upload roots.
+
+    Each root is scanned with os.scandir (non-recursively) and re-scanned only
+    when the directory's mtime changes, i.e. when files are added, removed or
+    renamed. Files are indexed by filename and by stem, so a prompt's
+    "file_id" or path can be matched to its upload directly.
+    """
+
+    def __init__(self, roots=DEFAULT_UPLOAD_ROOTS):
+        self.roots = tuple(roots)
+        self._scans = {}  # root -> ((abspath, mtime_ns), [paths])
+        self._by_name = {}
+        self._images = []
+        self._signature = None
+
+    def _scan_root(self, root):
+        """Return image paths in root, reusing the last scan if the directory is unchanged."""
+        try:
+            # Relative roots (".") follow the process cwd, so the absolute path is part of the stamp
+            stamp = (os.path.abspath(root), os.stat(root).st_mtime_ns)
+        except OSError:
+            self._scans.pop(root, None)
+            return []
+
+        cached = self._scans.get(root)
+        if cached and cached[0] == stamp:
+            return cached[1]
+
+        paths = []
+        try:
+            with os.scandir(root) as entries:
+                for entry in entries:
+                    if os.path.splitext(entry.name)[1].lower() in IMAGE_EXTENSIONS and entry.is_file():
+                        paths.append(os.path.normpath(os.path.join(root, entry.name)))
+        except OSError:
+            paths = []
+
+        self._scans[root] = (stamp, paths)
+        return paths
+
+    def refresh(self):
+        """Bring the index up to date, rebuilding it only if a root changed."""
+        scans = [self._scan_root(root) for root in self.roots]
+        signature = tuple(self._scans.get(root, (None,))[0] for root in self.roots)
+        if signature == self._signature:
+            return
+
+        by_name = {}
+        images = set()
+        # Earlier roots win when the same name is uploaded to several places
+        for paths in reversed(scans):
+            for path in paths:
+                name = os.path.basename(path)
+                by_name[name] = path
+                by_name[os.path.splitext(name)[0]] = path
+                images.add(path)
+
+        self._by_name = by_name
+        self._images = sorted(images)
+        self._signature = signature
+
+    def images(self):
+        """Return all indexed image paths, sorted for consistent ordering."""
+        self.refresh()
+        return list(self._images)
+
+    def lookup(self, name):
+        """Return the indexed path for a filename, stem or file_id, or None."""
+        if not name:
+            return None
+        self.refresh()
+        return self._by_name.get(name) or self._by_name.get(os.path.basename(name))
+
+    def resolve(self, prompt):
+        """
+        Find the image for a single prompt by identity.
+
+        Checks, in order: the prompt's "file_id" in the index, an explicit
+        "path"/"image_path" that exists, and that path's filename in the index.
+
+        Args:
+            prompt: Image prompt dict
+
+        Returns:
+            str or None: Image path
+        """
+        path = self.lookup(prompt.get("file_id"))
+        if path:
+            return path
+
+        for key in ("path", "image_path"):
+            candidate = prompt.get(key)
+            if candidate and os.path.exists(candidate):
+                return candidate
+            path = self.lookup(candidate)
+            if path:
+                return path
+        return None
+
+    def resolve_prompts(self, image_prompts, positional_fallback=False):
+        """
+        Map each prompt to an image path.
+
+        Prompts are matched by identity only, so a prompt without a matching
+        upload keeps its text placeholder. With positional_fallback, prompts
+        left unmatched instead receive the remaining unclaimed uploads in
+        sorted order (the legacy behaviour, for callers that know every
+        upload belongs to this deck).
+
+        Args:
+            image_prompts: List of image prompt dicts
+            positional_fallback: Assign leftover uploads to unmatched prompts
+
+        Returns:
+            list: Image path or None for each prompt
+        """
+        resolved = [self.resolve(prompt) for prompt in image_prompts]
+
+        if positional_fallback and None in resolved:
+            claimed = set(resolved)
+            leftovers = iter([path for path in self.images() if path not in claimed])
+            resolved = [path or next(leftovers, None) for path in resolved]
+
+        return resolved
+
+
+_resolvers = {}
+
+
+def get_resolver(roots=None):
+    """Return the process-wide resolver for a set of upload roots."""
+    roots = tuple(roots) if roots else DEFAULT_UPLOAD_ROOTS
+    resolver = _resolvers.get(roots)
+    if resolver is None:
+        resolver = _resolvers[roots] = AssetResolver(roots)
+    return resolver
@@ -0,0 +1,180 @@
+"""
+Async PowerPoint generation for DJ Brand Guide Generator.
+Builds decks on a bounded executor so an event loop is never blocked.
+"""
+
+from concurrent.futures import ThreadPoolExecutor
+import asyncio
+import io
+import os
+import threading
+import uuid
+import weakref
+
+from pptx_generator import create_brand_guide
+
+# Default number of decks built at once per builder
+DEFAULT_MAX_CONCURRENCY = min(8, os.cpu_count() or 1)
+
+# Default builder per event loop (used by create_brand_guide_async); all share one thread pool
+_default_builders = weakref.WeakKeyDictionary()
+_default_executor = None
+_default_lock = threading.Lock()
+
+
+def _build_deck(dj_input, image_prompts, colors, options):
+    """Build a deck in memory inside an executor worker; returns the .pptx bytes."""
+    buffer = io.BytesIO()
+    create_brand_guide(dj_input, image_prompts, colors, buffer, **options)
+    return buffer.getvalue()
+
+
+def _remove_quietly(path):
+    """Delete a file if it exists."""
+    try:
+        os.remove(path)
+    except FileNotFoundError:
+        pass
+
+
+def _write_temp(tmp_path, data, abandoned):
+    """Write deck bytes to a temporary file, removing it if the request was abandoned meanwhile."""
+    try:
+        with open(tmp_path, "wb") as f:
+            f.write(data)
+    finally:
+        if abandoned.is_set():
+            _remove_quietly(tmp_path)
+
+
+class AsyncDeckBuilder:
+    """
+    Builds brand guides for async code on a bounded executor.
+
+    At most max_concurrency decks are built at once; further requests wait
+    (without blocking the event loop) for a free slot. Asset discovery,
+    image reads, slide building and the zip save all run on the executor.
+
+    Cancelling a request that is still waiting for a slot means its deck is
+    never built. A deck already being built runs to completion in its worker
+    (builds take tens of milliseconds), but its result is discarded and its
+    output file is never written: the deck is written to a temporary file
+    that is renamed into place on the event loop only if the request is
+    still live, and removed otherwise.
+
+    Args:
+        max_concurrency: Maximum decks in flight
+        executor: Optional concurrent.futures executor (default: a thread pool
+            of max_concurrency workers, owned and shut down by this builder).
+            A ProcessPoolExecutor builds decks in parallel across cores; a
+            tracer passed to a process pool does not receive its spans.
+
+    Example:
+        >>> async with AsyncDeckBuilder(max_concurrency=4) as builder:
+        ...     deck = await builder.create_brand_guide(dj_input, prompts, colors)
+    """
+
+    def __init__(self, max_concurrency=DEFAULT_MAX_CONCURRENCY, executor=None):
+        if max_concurrency < 1:
+            raise ValueError("max_concurrency must be at least 1")
+        self.max_concurrency = max_concurrency
+        self._owns_executor = executor is None
+        self._executor = executor or ThreadPoolExecutor(
+            max_workers=max_concurrency, thread_name_prefix="brand-guide"
+        )
+        self._semaphore = asyncio.Semaphore(max_concurrency)
+
+    async def create_brand_guide(self, dj_input, image_prompts, colors, output_path=None, visual_pillars=None,
+                                 **options):
+        """
+        Build a brand guide without blocking the event loop.
+
+        Args:
+            dj_input, image_prompts, colors, visual_pillars: As for create_brand_guide
+            output_path: Optional file path to write; None returns the deck bytes
+            **options: Any other create_brand_guide keyword arguments
+
+        Returns:
+            bytes or str: Deck bytes, or output_path once written
+        """
+        loop = asyncio.get_running_loop()
+        options["visual_pillars"] = visual_pillars
+
+        async with self._semaphore:
+            data = await loop.run_in_executor(
+                self._executor, _build_deck, dj_input, image_prompts, colors, options
+            )
+            if output_path is None:
+                return data
+
+            tmp_path = f"{output_path}.{uuid.uuid4().hex}.tmp"
+            abandoned = threading.Event()
+            try:
+                await loop.run_in_executor(None, _write_temp, tmp_path, data, abandoned)
+            except BaseException:
+                # Cancelled or failed: the worker (or this) removes the temporary file
+                abandoned.set()
+                _remove_quietly(tmp_path)
+                raise
+            os.replace(tmp_path, output_path)
+            return output_path
+
+    def close(self):
+        """Shut down the executor if this builder created it; queued builds are cancelled."""
+        if self._owns_executor:
+            self._executor.shutdown(wait=False, cancel_futures=True)
+
+    async def __aenter__(self):
+        return self
+
+    async def __aexit__(self, *exc):
+        self.close()
+        return False
+
+
+def _default_builder(loop):
+    """Return the shared builder for an event loop, creating it on the process-wide pool."""
+    global _default_executor
+    with _default_lock:
+        builder = _default_builders.get(loop)
+        if builder is None:
+            # Builders hold their loop (through the semaphore), so drop those of closed loops
+            for closed in [other for other in _default_builders if other.is_closed()]:
+                del _default_builders[closed]
+            if _default_executor is None:
+                _default_executor = ThreadPoolExecutor(
+                    max_workers=DEFAULT_MAX_CONCURRENCY, thread_name_prefix="brand-guide"
+                )
+            builder = _default_builders[loop] = AsyncDeckBuilder(executor=_default_executor)
+        return builder
+
+
+async def create_brand_guide_async(dj_input, image_prompts, colors, output_path=None, visual_pillars=None,
+                                   builder=None, **options):
+    """
+    Async create_brand_guide for event-loop servers (e.g. FastAPI).
+
+    Uses a shared AsyncDeckBuilder per event loop (DEFAULT_MAX_CONCURRENCY
+    decks at once per loop) unless a builder is given. The shared builders
+    run on one process-wide thread pool, so short-lived loops do not each
+    leave idle threads behind; its threads are joined at interpreter exit.
+
+    Args:
+        dj_input, image_prompts, colors, visual_pillars: As for create_brand_guide
+        output_path: Optional file path to write; None returns the deck bytes
+        builder: Optional AsyncDeckBuilder (to set the concurrency limit or executor)
+        **options: Any other create_brand_guide keyword arguments
+
+    Returns:
+        bytes or str: Deck bytes, or output_path once written
+
+    Example:
+        >>> @app.post("/decks")
+        ... async def make_deck(request: DeckRequest):
+        ...     deck = await create_brand_guide_async(request.dj_input, request.prompts, request.colors)
+        ...     return Response(deck, media_type="application/vnd.openxmlformats-officedocument.presentationml.presentation")
+    """
+    if builder is None:
+        builder = _default_builder(asyncio.get_running_loop())
+    return await builder.create_brand_guide(dj_input, image_prompts, colors, output_path,
+                                            visual_pillars=visual_pillars, **options)
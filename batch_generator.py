@@ -0,0 +1,212 @@
+"""
+Batch PowerPoint generation for DJ Brand Guide Generator.
+Renders many brand guides across a process pool with per-job error isolation.
+"""
+
+from concurrent.futures import Future, ProcessPoolExecutor, as_completed
+import json
+import os
+import sys
+import time
+
+from pptx_generator import create_brand_guide, load_base_template
+
+
+def iter_jobs(source):
+    """
+    Yield batch jobs one at a time from a list, a JSONL file path, or an open JSONL stream.
+
+    Each job is a dict with "dj_input", "image_prompts" and "colors" keys,
+    plus optional "visual_pillars", "output_path" and "options" (extra
+    create_brand_guide keyword arguments) keys. "image_prompts" may also be
+    given in the {"prompts": [...]} form of the example prompts files.
+
+    JSONL lines are yielded unparsed (see parse_job), so a malformed line
+    can be reported as its own failed job. Blank lines are skipped.
+
+    Args:
+        source: List of job dicts, path to a .jsonl file, or iterable of lines
+
+    Yields:
+        dict or str: Job dicts, or stripped JSONL lines, in input order
+    """
+    if isinstance(source, (list, tuple)):
+        yield from source
+        return
+
+    if isinstance(source, (str, os.PathLike)):
+        with open(source, encoding="utf-8") as f:
+            yield from iter_jobs(f)
+        return
+
+    for line in source:
+        line = line.strip()
+        if line:
+            yield line
+
+
+def parse_job(line):
+    """
+    Parse one JSONL job line.
+
+    Raises:
+        ValueError: If the line is not valid JSON or not a JSON object
+    """
+    job = json.loads(line)
+    if not isinstance(job, dict):
+        raise ValueError("Job must be a JSON object")
+    return job
+
+
+def load_jobs(source):
+    """
+    Load every batch job up front (see iter_jobs for the accepted sources).
+
+    Returns:
+        list: Job dicts in input order
+
+    Raises:
+        ValueError: If a JSONL line is not a JSON object
+    """
+    return [parse_job(job) if isinstance(job, str) else job for job in iter_jobs(source)]
+
+
+def render_job(index, job, output_dir):
+    """
+    Render a single job (in a pool worker or a resident worker).
+
+    Any exception is caught and returned as an error string so one bad job
+    never takes down the rest of the batch.
+
+    Returns:
+        dict: {"index", "output_path", "error", "seconds"}
+    """
+    start = time.perf_counter()
+    output_path = job.get("output_path") or os.path.join(output_dir, f"brand_guide_{index:04d}.pptx")
+    try:
+        image_prompts = job["image_prompts"]
+        if isinstance(image_prompts, dict):
+            image_prompts = image_prompts["prompts"]
+        result = create_brand_guide(
+            job["dj_input"],
+            image_prompts,
+            job["colors"],
+            output_path,
+            visual_pillars=job.get("visual_pillars"),
+            **job.get("options", {}),
+        )
+        error = None
+    except Exception as e:
+        result = None
+        error = f"{type(e).__name__}: {e}"
+
+    return {
+        "index": index,
+        "output_path": result,
+        "error": error,
+        "seconds": time.perf_counter() - start,
+    }
+
+
+def iter_brand_guides(jobs, output_dir=".", max_workers=None, ordered=True):
+    """
+    Render brand guides across a process pool, yielding results as they finish.
+
+    JSONL lines are parsed as they are submitted; a malformed line is
+    reported as a failed job and the rest of the batch still runs.
+
+    Args:
+        jobs: List of job dicts, JSONL path or JSONL stream (see iter_jobs)
+        output_dir: Directory for jobs without an explicit "output_path"
+        max_workers: Pool size (default: os.cpu_count())
+        ordered: Yield in input order if True, otherwise as jobs complete
+
+    Yields:
+        dict: {"index", "output_path", "error", "seconds"} per job
+    """
+    os.makedirs(output_dir, exist_ok=True)
+
+    # Import python-pptx and parse the default template once here, so forked
+    # workers inherit them instead of each paying the cold start
+    load_base_template()
+
+    with ProcessPoolExecutor(max_workers=max_workers) as executor:
+        futures = []
+        for index, job in enumerate(iter_jobs(jobs)):
+            try:
+                job = parse_job(job) if isinstance(job, str) else job
+            except ValueError as e:
+                future = Future()
+                future.set_result({"index": index, "output_path": None, "error": f"{type(e).__name__}: {e}",
+                                   "seconds": 0.0})
+            else:
+                future = executor.submit(render_job, index, job, output_dir)
+            futures.append(future)
+        if ordered:
+            for future in futures:
+                yield future.result()
+        else:
+            for future in as_completed(futures):
+                yield future.result()
+
+
+def generate_brand_guides(jobs, output_dir=".", max_workers=None, ordered=True):
+    """
+    Render a batch of brand guides and report throughput.
+
+    Args:
+        jobs: List of job dicts, JSONL path or JSONL stream (see iter_jobs)
+        output_dir: Directory for jobs without an explicit "output_path"
+        max_workers: Pool size (default: os.cpu_count())
+        ordered: Return results in input order if True, else completion order
+
+    Returns:
+        dict: {
+            "results": list of per-job result dicts,
+            "succeeded": int,
+            "failed": int,
+            "elapsed": float seconds,
+            "decks_per_second": float
+        }
+    """
+    start = time.perf_counter()
+    results = list(iter_brand_guides(jobs, output_dir, max_workers, ordered))
+    elapsed = time.perf_counter() - start
+
+    failed = sum(1 for r in results if r["error"])
+    return {
+        "results": results,
+        "succeeded": len(results) - failed,
+        "failed": failed,
+        "elapsed": elapsed,
+        "decks_per_second": len(results) / elapsed if elapsed > 0 else 0.0,
+    }
+
+
+def main(argv=None):
+    """Command-line entry point: python3 batch_generator.py jobs.jsonl [output_dir] [workers]"""
+    argv = sys.argv[1:] if argv is None else argv
+    if not argv:
+        print("Usage: python3 batch_generator.py jobs.jsonl [output_dir] [workers]")
+        return 1
+
+    source = sys.stdin if argv[0] == "-" else argv[0]
+    output_dir = argv[1] if len(argv) > 1 else "."
+    max_workers = int(argv[2]) if len(argv) > 2 else None
+
+    summary = generate_brand_guides(source, output_dir, max_workers, ordered=False)
+    for r in summary["results"]:
+        if r["error"]:
+            print(f"✗ job {r['index']}: {r['error']}")
+        else:
+            print(f"✓ job {r['index']}: {r['output_path']} ({r['seconds']:.2f}s)")
+
+    print(
+        f"\n{summary['succeeded']} succeeded, {summary['failed']} failed in "
+        f"{summary['elapsed']:.2f}s ({summary['decks_per_second']:.2f} decks/sec)"
+    )
+    return 1 if summary["failed"] else 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
@@ -0,0 +1,282 @@
+#!/usr/bin/env python3
+"""
+Benchmark suite for DJ Brand Guide Generator.
+Generates synthetic inputs at several scales and reports per-slide latency,
+total deck time, output size and peak RSS, with baseline comparison.
+
+Usage:
+    python3 benchmark.py                          # Run and print results
+    python3 benchmark.py --save benchmark_baseline.json
+    python3 benchmark.py --compare benchmark_baseline.json [--tolerance 0.25]
+    python3 benchmark.py --renderer ooxml --compare benchmark_baseline.json
+"""
+
+from concurrent.futures import ProcessPoolExecutor
+import argparse
+import io
+import json
+import multiprocessing
+import os
+import platform
+import resource
+import statistics
+import sys
+import tempfile
+import time
+
+sys.path.insert(0, os.path.dirname(os.path.abspath(__file__)))
+
+# (image prompts, palette colors) scales; each runs with and without real image files
+SCALES = [(4, 6), (16, 16), (64, 64)]
+
+# Synthetic render size (Fal.ai 2K output)
+IMAGE_SIZE = (2048, 1152)
+
+SLIDE_STAGES = ("create_visual_pillars_slide", "create_moodboard_slide", "create_color_palette_slide")
+
+# Metrics compared against a baseline (lower is better)
+COMPARED_METRICS = ("total_seconds", "output_bytes", "peak_rss_bytes")
+
+
+def make_inputs(n_prompts, n_colors, image_dir=None):
+    """
+    Build synthetic create_brand_guide inputs.
+
+    Args:
+        n_prompts: Number of image prompts
+        n_colors: Number of palette colors
+        image_dir: If given, write one distinct JPEG render per prompt here
+
+    Returns:
+        tuple: (dj_input, image_prompts, colors, visual_pillars)
+    """
+    dj_input = {
+        "dj_name": "Benchmark Artist",
+        "music_style": "Deep house, progressive, techno",
+        "core_descriptors": ["oceanic", "mysterious", "hypnotic"],
+        "emotional_target": "Like exploring an alien underwater world",
+        "physical_place": "Deep ocean, but not Earth's ocean",
+        "brand_positioning": "otherworldly explorer of sonic depths",
+    }
+
+    image_prompts = []
+    for i in range(n_prompts):
+        prompt = {
+            "label": f"IMAGE {i:02d}",
+            "prompt": "Ethereal bioluminescent forms drifting through a deep, dark ocean. " * 2,
+            "file_id": None,
+        }
+        if image_dir:
+            prompt["path"] = _write_render(image_dir, i)
+        image_prompts.append(prompt)
+
+    palette = [{"name": f"Color {i}", "hex": "#{:06X}".format((i * 2654435761) & 0xFFFFFF)}
+               for i in range(max(n_colors - 2, 0))]
+    palette += [{"name": "Black", "hex": "#000000"}, {"name": "White", "hex": "#FFFFFF"}]
+    colors = {
+        "primary": {"name": "Deep Ocean Blue", "hex": "#0A1F44"},
+        "palette": palette,
+        "description": "Deep Ocean Blue anchors the atmosphere. " * 12,
+    }
+
+    visual_pillars = [{"name": name} for name in
+                      ("DOCUMENTED REALITY", "LIQUID GEOMETRY", "SENSORY ARCHAEOLOGY", "POST-EXTRACTIVE AESTHETICS")]
+    return dj_input, image_prompts, colors, visual_pillars
+
+
+def _write_render(image_dir, index):
+    """Write a distinct, photo-like JPEG (gradient + colored blocks + noise)."""
+    path = os.path.join(image_dir, f"render_{index:03d}.jpg")
+    if os.path.exists(path):
+        return path
+
+    import numpy as np
+    from PIL import Image
+
+    rng = np.random.default_rng(index)
+    width, height = IMAGE_SIZE
+    pixels = np.empty((height, width, 3), dtype=np.float32)
+    pixels[:] = np.linspace(0, 1, width, dtype=np.float32)[None, :, None] * rng.integers(40, 200, 3)
+    for _ in range(6):
+        x, y = rng.integers(0, width - 200), rng.integers(0, height - 200)
+        pixels[y:y + rng.integers(100, 600), x:x + rng.integers(100, 900)] = rng.integers(0, 256, 3)
+    pixels += rng.normal(0, 6, pixels.shape).astype(np.float32)
+    Image.fromarray(pixels.clip(0, 255).astype(np.uint8)).save(path, quality=90)
+    return path
+
+
+def _peak_rss_bytes():
+    """
+    Peak resident set size of this process.
+
+    On Linux, VmHWM is read from /proc because ru_maxrss survives exec and
+    would report the launching parent's peak for a freshly spawned worker.
+    """
+    try:
+        with open("/proc/self/status", encoding="ascii") as f:
+            for line in f:
+                if line.startswith("VmHWM:"):
+                    return int(line.split()[1]) * 1024
+    except OSError:
+        pass
+
+    # ru_maxrss is KB on Linux, bytes on macOS
+    peak = resource.getrusage(resource.RUSAGE_SELF).ru_maxrss
+    return peak if sys.platform == "darwin" else peak * 1024
+
+
+def run_case(n_prompts, n_colors, with_images, repeats=3, image_dir=None, renderer="pptx"):
+    """
+    Benchmark one scale in the current process.
+
+    The first build warms caches and is discarded; the median of `repeats`
+    timed builds is reported.
+
+    Args:
+        renderer: create_brand_guide renderer ("pptx" or "ooxml")
+
+    Returns:
+        dict: Case description and metrics
+    """
+    from instrumentation import Tracer
+    from pptx_generator import create_brand_guide
+
+    with tempfile.TemporaryDirectory() as tmp:
+        dj_input, prompts, colors, pillars = make_inputs(
+            n_prompts, n_colors, (image_dir or tmp) if with_images else None
+        )
+
+        totals, stages, output_bytes = [], {stage: [] for stage in SLIDE_STAGES}, 0
+        for i in range(repeats + 1):
+            tracer = Tracer()
+            output = io.BytesIO()
+            start = time.perf_counter()
+            create_brand_guide(dj_input, prompts, colors, output, visual_pillars=pillars, tracer=tracer,
+                               upload_roots=[tmp], renderer=renderer)
+            elapsed = time.perf_counter() - start
+            if i == 0:
+                continue  # Warm-up
+            totals.append(elapsed)
+            output_bytes = len(output.getvalue())
+            stage_totals = tracer.totals()
+            for stage in SLIDE_STAGES:
+                stages[stage].append(stage_totals.get(stage, 0.0))
+
+    return {
+        "case": f"{n_prompts}p-{n_colors}c-{'images' if with_images else 'text'}",
+        "prompts": n_prompts,
+        "colors": n_colors,
+        "images": with_images,
+        "total_seconds": statistics.median(totals),
+        "slide_seconds": {stage: statistics.median(values) for stage, values in stages.items()},
+        "output_bytes": output_bytes,
+        "peak_rss_bytes": _peak_rss_bytes(),
+    }
+
+
+def run_suite(scales=SCALES, repeats=3, renderer="pptx"):
+    """
+    Run every scale with and without images, each in a fresh process so
+    peak RSS is measured per case.
+
+    Returns:
+        list: Result dicts from run_case
+    """
+    results = []
+    with tempfile.TemporaryDirectory() as image_dir:
+        # Render synthetic images up front so their generation is not measured
+        make_inputs(max(n for n, _ in scales), 0, image_dir)
+
+        for n_prompts, n_colors in scales:
+            for with_images in (False, True):
+                # One freshly spawned worker per case: ru_maxrss is a per-process
+                # high-water mark, and a forked child would inherit the parent's
+                with ProcessPoolExecutor(max_workers=1, mp_context=multiprocessing.get_context("spawn")) as executor:
+                    results.append(executor.submit(
+                        run_case, n_prompts, n_colors, with_images, repeats, image_dir, renderer
+                    ).result())
+    return results
+
+
+def compare(results, baseline, tolerance=0.25):
+    """
+    Compare results with a saved baseline.
+
+    Args:
+        results: Current result dicts
+        baseline: Baseline document (from save) or its "results" list
+        tolerance: Allowed relative increase per metric (0.25 = 25%)
+
+    Returns:
+        list: Regression descriptions (empty if none)
+    """
+    baseline_results = baseline["results"] if isinstance(baseline, dict) else baseline
+    by_case = {result["case"]: result for result in baseline_results}
+
+    regressions = []
+    for result in results:
+        base = by_case.get(result["case"])
+        if not base:
+            continue
+        for metric in COMPARED_METRICS:
+            if base[metric] and result[metric] > base[metric] * (1 + tolerance):
+                regressions.append(
+                    f"{result['case']}: {metric} {result[metric]:.4g} vs baseline {base[metric]:.4g} "
+                    f"(+{(result[metric] / base[metric] - 1) * 100:.0f}%)"
+                )
+    return regressions
+
+
+def format_results(results):
+    """Format results as a fixed-width table."""
+    lines = [
+        f"{'case':<22}{'total ms':>10}{'pillars':>10}{'moodboard':>11}{'palette':>10}{'size KB':>10}{'RSS MB':>9}",
+    ]
+    for r in results:
+        slide = r["slide_seconds"]
+        lines.append(
+            f"{r['case']:<22}{r['total_seconds'] * 1000:>10.1f}"
+            f"{slide['create_visual_pillars_slide'] * 1000:>10.1f}"
+            f"{slide['create_moodboard_slide'] * 1000:>11.1f}"
+            f"{slide['create_color_palette_slide'] * 1000:>10.1f}"
+            f"{r['output_bytes'] / 1024:>10.0f}{r['peak_rss_bytes'] / 1024 / 1024:>9.0f}"
+        )
+    return "\n".join(lines)
+
+
+def main(argv=None):
+    parser = argparse.ArgumentParser(description="Benchmark brand guide generation across input scales.")
+    parser.add_argument("--repeats", type=int, default=3, help="Timed builds per case (median reported)")
+    parser.add_argument("--save", metavar="PATH", help="Save results as a baseline JSON file")
+    parser.add_argument("--compare", metavar="PATH", help="Compare against a baseline JSON file")
+    parser.add_argument("--tolerance", type=float, default=0.25, help="Allowed relative regression")
+    parser.add_argument("--renderer", choices=("pptx", "ooxml"), default="pptx",
+                        help="Renderer for the fixed-layout slides")
+    args = parser.parse_args(argv)
+
+    results = run_suite(repeats=args.repeats, renderer=args.renderer)
+    print(format_results(results))
+
+    if args.save:
+        with open(args.save, "w", encoding="utf-8") as f:
+            json.dump({
+                "python": platform.python_version(),
+                "platform": platform.platform(),
+                "results": results,
+            }, f, indent=2)
+        print(f"\nBaseline saved to {args.save}")
+
+    if args.compare:
+        with open(args.compare, encoding="utf-8") as f:
+            regressions = compare(results, json.load(f), args.tolerance)
+        if regressions:
+            print("\n✗ Performance regressions:")
+            for regression in regressions:
+                print(f"  - {regression}")
+            return 1
+        print(f"\n✓ No regressions beyond {args.tolerance:.0%} of {args.compare}")
+    return 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
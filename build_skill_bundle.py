@@ -0,0 +1,387 @@
+#!/usr/bin/env python3
+"""
+Skill bundle builder for DJ Brand Guide Generator.
+Packs only the modules the skill imports, with precompiled bytecode, for upload.
+
+The bundle holds SKILL.md, the docs it links to, and the import closure of
+the entry modules (function-local imports included, since the generator
+defers most of its imports). Tests, example data and server-side tools are
+left out, and so are the doc sections, paragraphs and list items that refer
+to them, so code that follows the bundled docs never hits an ImportError.
+
+Bytecode is written as checked hash-based .pyc files: they stay valid after
+upload and unpacking reset file modification times, which would invalidate
+ordinary timestamp-based .pyc files. Python only loads .pyc files compiled
+for its own version, so build with the sandbox's Python version; any other
+version ignores them and compiles from source as before.
+
+Usage:
+    python3 build_skill_bundle.py [output_dir] [--entry MODULE ...] [--no-compile]
+"""
+
+from collections import deque
+from pathlib import Path
+import argparse
+import ast
+import importlib.machinery
+import importlib.util
+import py_compile
+import re
+import shutil
+import statistics
+import subprocess
+import sys
+import tempfile
+import time
+
+from upload_skill import SKILL_FOLDER_NAME, collect_skill_files
+
+SKILL_DIR = Path(__file__).resolve().parent
+
+# Modules the skill's instructions import
+DEFAULT_ENTRY_POINTS = ("pptx_generator",)
+
+DEFAULT_OUTPUT_DIR = SKILL_DIR / "dist" / SKILL_FOLDER_NAME
+
+# Skill instructions; bundled with every Markdown file they link to
+SKILL_DOC = "SKILL.md"
+
+# Timing runs per measurement (the median and range are reported)
+IMPORT_TIME_RUNS = 15
+
+_MARKDOWN_LINK = re.compile(r"\]\(([^)#\s]+\.md)\)")
+
+# Ways a doc refers to a module: a section heading, an import, a command line or inline code
+_MODULE_MENTION = re.compile(
+    r"^#{1,6} +`?(\w+)`?\s*$|^\s*(?:>>> )?(?:from|import) +(\w+)|\bpython3? +(\w+)\.py\b|`(\w+)(?:\.py)?`",
+    re.MULTILINE,
+)
+
+_HEADING = re.compile(r"^(#{1,6}) +`?(\w+)?")
+_LIST_ITEM = re.compile(r"^(?:[-*+]|\d+\.) ")
+
+
+def local_imports(path: Path, local_modules):
+    """
+    Names of the skill's own modules imported anywhere in a source file.
+
+    Args:
+        path: Python source file
+        local_modules: Names of the skill folder's modules
+
+    Returns:
+        set: Imported local module names
+    """
+    tree = ast.parse(path.read_bytes(), filename=str(path))
+    imported = set()
+    for node in ast.walk(tree):
+        if isinstance(node, ast.Import):
+            imported.update(alias.name.partition(".")[0] for alias in node.names)
+        elif isinstance(node, ast.ImportFrom) and node.level == 0 and node.module:
+            imported.add(node.module.partition(".")[0])
+    return imported & set(local_modules)
+
+
+def import_closure(entry_points=DEFAULT_ENTRY_POINTS, skill_dir: Path = SKILL_DIR):
+    """
+    Every skill module the entry modules can import, directly or indirectly.
+
+    Args:
+        entry_points: Module names to start from
+        skill_dir: Skill folder
+
+    Returns:
+        list: Module names, sorted
+
+    Raises:
+        ValueError: If an entry module is not in the skill folder
+    """
+    local_modules = {path.stem: path for path in skill_dir.glob("*.py")}
+    missing = [name for name in entry_points if name not in local_modules]
+    if missing:
+        raise ValueError(f"Entry modules not found in {skill_dir}: {', '.join(missing)}")
+
+    closure = set(entry_points)
+    queue = deque(entry_points)
+    while queue:
+        for name in local_imports(local_modules[queue.popleft()], local_modules) - closure:
+            closure.add(name)
+            queue.append(name)
+    return sorted(closure)
+
+
+def linked_docs(skill_dir: Path = SKILL_DIR):
+    """
+    SKILL.md and the Markdown files reachable from it through relative links.
+
+    Returns:
+        list: File names, SKILL.md first
+    """
+    docs = [SKILL_DOC]
+    queue = deque(docs)
+    while queue:
+        text = (skill_dir / queue.popleft()).read_text(encoding="utf-8")
+        for target in _MARKDOWN_LINK.findall(text):
+            if "/" not in target and target not in docs and (skill_dir / target).is_file():
+                docs.append(target)
+                queue.append(target)
+    return docs
+
+
+def mentioned_modules(text, local_modules):
+    """
+    Skill modules a doc refers to by heading, import, command line or inline code.
+
+    Args:
+        text: Markdown text
+        local_modules: Names of the skill folder's modules
+
+    Returns:
+        set: Mentioned module names
+    """
+    mentioned = set()
+    for match in _MODULE_MENTION.finditer(text):
+        mentioned.update(name for name in match.groups() if name)
+    return mentioned & set(local_modules)
+
+
+def _doc_blocks(text):
+    """Split Markdown into blocks: headings, fenced code, list items, paragraphs and blank lines."""
+    blocks, block, fenced = [], [], False
+    for line in text.splitlines(keepends=True):
+        if fenced:
+            block.append(line)
+            if line.lstrip().startswith("```"):
+                blocks.append(block)
+                block, fenced = [], False
+            continue
+        starts_block = (not line.strip() or line.startswith("#") or line.lstrip().startswith("```")
+                        or _LIST_ITEM.match(line) or (block and not block[-1].strip()))
+        if starts_block and block:
+            blocks.append(block)
+            block = []
+        block.append(line)
+        fenced = line.lstrip().startswith("```")
+        if line.startswith("#"):
+            blocks.append(block)
+            block = []
+    if block:
+        blocks.append(block)
+    return blocks
+
+
+def trim_doc(text, bundled_modules, local_modules):
+    """
+    Drop the parts of a doc that refer to skill modules left out of a bundle.
+
+    A heading naming an unbundled module drops its section, up to the next
+    heading of the same or a higher level or the next rule; elsewhere a
+    paragraph, code block or list item mentioning one is dropped on its own.
+
+    Args:
+        text: Markdown text
+        bundled_modules: Module names in the bundle
+        local_modules: Names of the skill folder's modules
+
+    Returns:
+        str: Trimmed Markdown
+    """
+    unbundled = set(local_modules) - set(bundled_modules)
+    kept, skip_level = [], None
+    for block in _doc_blocks(text):
+        heading = _HEADING.match(block[0])
+        if heading:
+            level = len(heading.group(1))
+            if skip_level is not None and level > skip_level:
+                continue
+            skip_level = level if heading.group(2) in unbundled else None
+        if block[0].strip() == "---":
+            skip_level = None  # a rule closes the section before it
+        if skip_level is not None:
+            continue
+        if not heading and mentioned_modules("".join(block), local_modules) & unbundled:
+            continue
+        if block[0].strip() == "---" and [line for line in kept if line.strip()][-1:] == [block[0]]:
+            continue  # the section between two rules was dropped
+        kept.extend(block)
+    return re.sub(r"\n{3,}", "\n\n", "".join(kept))
+
+
+def build_bundle(output_dir, entry_points=DEFAULT_ENTRY_POINTS, skill_dir: Path = SKILL_DIR, compile_bytecode=True):
+    """
+    Write a minimal skill bundle.
+
+    Args:
+        output_dir: Bundle directory (replaced if it holds an earlier bundle)
+        entry_points: Modules whose import closure is bundled
+        skill_dir: Skill folder
+        compile_bytecode: Add hash-based .pyc files for the running Python
+
+    Returns:
+        list: Bundle files, relative to output_dir
+
+    Raises:
+        ValueError: If output_dir is the skill folder or holds something other than a bundle
+    """
+    output_dir = Path(output_dir).resolve()
+    skill_dir = Path(skill_dir).resolve()
+    if output_dir == skill_dir or output_dir in skill_dir.parents:
+        raise ValueError(f"Refusing to build a bundle over {output_dir}")
+    if output_dir.exists():
+        if any(output_dir.iterdir()) and not (output_dir / SKILL_DOC).is_file():
+            raise ValueError(f"{output_dir} is not empty and is not a skill bundle")
+        shutil.rmtree(output_dir)
+    output_dir.mkdir(parents=True)
+
+    docs = linked_docs(skill_dir)
+    modules = import_closure(entry_points, skill_dir)
+    local_modules = [path.stem for path in skill_dir.glob("*.py")]
+    for name in docs:
+        text = (skill_dir / name).read_text(encoding="utf-8")
+        (output_dir / name).write_text(trim_doc(text, modules, local_modules), encoding="utf-8")
+    names = [f"{module}.py" for module in modules]
+    for name in names:
+        shutil.copyfile(skill_dir / name, output_dir / name)
+
+    files = docs + names
+    if compile_bytecode:
+        for name in names:
+            cfile = Path(importlib.util.cache_from_source(str(output_dir / name)))
+            py_compile.compile(str(output_dir / name), cfile=str(cfile), dfile=name, doraise=True,
+                               invalidation_mode=py_compile.PycInvalidationMode.CHECKED_HASH)
+            files.append(cfile.relative_to(output_dir).as_posix())
+    return files
+
+
+def directory_size(directory: Path):
+    """Total size in bytes of the files under a directory."""
+    return sum(path.stat().st_size for path in Path(directory).rglob("*") if path.is_file())
+
+
+def cold_import_seconds(directory: Path, modules):
+    """
+    Time importing modules from a directory in a fresh interpreter.
+
+    Bytecode writing is disabled, so every run starts from what the
+    directory ships, as a new sandbox does.
+
+    Returns:
+        float: Import time in seconds
+    """
+    code = f"import time; start = time.perf_counter(); import {', '.join(modules)}; print(time.perf_counter() - start)"
+    result = subprocess.run([sys.executable, "-B", "-c", code], cwd=directory,
+                            capture_output=True, text=True, check=True)
+    return float(result.stdout)
+
+
+def code_load_seconds(directory: Path, modules):
+    """
+    Time turning modules into code objects, without executing them.
+
+    This is the only step bytecode changes: sources are compiled, while
+    valid .pyc files are read and unmarshalled. It runs in-process, so it
+    is far less noisy than a cold import, which also pays for interpreter
+    startup and for executing each module.
+
+    Returns:
+        float: Seconds to load every module's code object
+    """
+    dont_write_bytecode = sys.dont_write_bytecode
+    sys.dont_write_bytecode = True
+    try:
+        start = time.perf_counter()
+        for name in modules:
+            importlib.machinery.SourceFileLoader(name, str(Path(directory) / f"{name}.py")).get_code(name)
+        return time.perf_counter() - start
+    finally:
+        sys.dont_write_bytecode = dont_write_bytecode
+
+
+def _summary(times):
+    """Median and range of a list of timings."""
+    return {"median": statistics.median(times), "min": min(times), "max": max(times)}
+
+
+def compare_with_folder(bundle_dir: Path, entry_points=DEFAULT_ENTRY_POINTS, skill_dir: Path = SKILL_DIR,
+                        runs=IMPORT_TIME_RUNS):
+    """
+    Compare a bundle with uploading the whole skill folder.
+
+    Cold imports of the folder and the bundle are interleaved, so drift in
+    machine load affects both alike.
+
+    Returns:
+        dict: "before" (folder upload) and "after" (bundle), each with
+            "files", "bytes", "load_seconds" (code-object loading) and
+            "import_seconds" (cold import of the entry modules' closure),
+            the timings as {"median", "min", "max"} over `runs` runs
+    """
+    modules = import_closure(entry_points, skill_dir)
+    skill_files = collect_skill_files(skill_dir)
+    bundle_files = [path for path in Path(bundle_dir).rglob("*") if path.is_file()]
+    with tempfile.TemporaryDirectory() as tmp:
+        for filepath, content, _ in skill_files:
+            (Path(tmp) / Path(filepath).name).write_bytes(content)
+
+        timings = {"before": ([], []), "after": ([], [])}
+        for _ in range(runs):
+            for label, directory in (("before", Path(tmp)), ("after", Path(bundle_dir))):
+                timings[label][0].append(code_load_seconds(directory, modules))
+                timings[label][1].append(cold_import_seconds(directory, modules))
+
+    sizes = {
+        "before": (len(skill_files), sum(len(content) for _, content, _ in skill_files)),
+        "after": (len(bundle_files), directory_size(bundle_dir)),
+    }
+    return {
+        label: {
+            "files": sizes[label][0],
+            "bytes": sizes[label][1],
+            "load_seconds": _summary(timings[label][0]),
+            "import_seconds": _summary(timings[label][1]),
+        }
+        for label in ("before", "after")
+    }
+
+
+def format_report(report):
+    """Format compare_with_folder's result as a table of medians with their min-max range."""
+    lines = [f"{'':<8} {'files':>6} {'size':>10} {'code load (range)':>22} {'cold import (range)':>24}"]
+    for label in ("before", "after"):
+        row = report[label]
+        load, cold = row["load_seconds"], row["import_seconds"]
+        lines.append(
+            f"{label:<8} {row['files']:>6} {row['bytes'] / 1024:>8.1f}KB"
+            f" {load['median'] * 1000:>7.1f}ms ({load['min'] * 1000:.1f}-{load['max'] * 1000:.1f})"
+            f" {cold['median'] * 1000:>8.1f}ms ({cold['min'] * 1000:.0f}-{cold['max'] * 1000:.0f})"
+        )
+    return "\n".join(lines)
+
+
+def main(argv=None):
+    parser = argparse.ArgumentParser(description="Build a minimal, precompiled skill bundle for upload.")
+    parser.add_argument("output_dir", nargs="?", default=str(DEFAULT_OUTPUT_DIR), help="Bundle directory")
+    parser.add_argument("--entry", action="append", metavar="MODULE",
+                        help="Entry module (repeatable; default: pptx_generator)")
+    parser.add_argument("--no-compile", action="store_true", help="Ship sources only")
+    parser.add_argument("--no-report", action="store_true", help="Skip the size and import-time comparison")
+    args = parser.parse_args(argv)
+
+    entry_points = tuple(args.entry or DEFAULT_ENTRY_POINTS)
+    try:
+        files = build_bundle(args.output_dir, entry_points, compile_bytecode=not args.no_compile)
+    except ValueError as e:
+        print(f"ERROR: {e}")
+        return 1
+
+    print(f"✓ Bundle written to {args.output_dir} ({len(files)} files):")
+    for name in files:
+        print(f"  - {name}")
+    if not args.no_report:
+        print()
+        print(format_report(compare_with_folder(Path(args.output_dir), entry_points)))
+    return 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
@@ -1,8 +1,24 @@
 """
 Color utility functions for DJ Brand Guide Generator.
 Handles color conversions and formatting.
+
+Scalar helpers are memoized per hex code. The *_array functions convert
+whole sequences of hex codes at once with NumPy (imported on first use).
 """
 
+from functools import lru_cache
+
+
+@lru_cache(maxsize=4096)
+def _parse_hex(hex_color):
+    """Parse a hex color once; shared by all scalar conversions."""
+    hex_color = hex_color.lstrip('#')
+    return (
+        int(hex_color[0:2], 16),
+        int(hex_color[2:4], 16),
+        int(hex_color[4:6], 16)
+    )
+
 
 def hex_to_cmyk(hex_color):
     """
@@ -18,13 +34,16 @@ def hex_to_cmyk(hex_color):
         >>> hex_to_cmyk("#0A1F44")
         {'c': 85, 'm': 54, 'y': 0, 'k': 73}
     """
-    # Strip the hash prefix if present (supports both "#RRGGBB" and "RRGGBB" formats)
-    hex_color = hex_color.lstrip('#')
+    c, m, y, k = _cmyk(hex_color)
+    return {'c': c, 'm': m, 'y': y, 'k': k}
+
 
+@lru_cache(maxsize=4096)
+def _cmyk(hex_color):
+    """Memoized CMYK percentages as an immutable tuple."""
     # Parse hex string into RGB components, normalized to 0-1 range for CMYK math
-    r = int(hex_color[0:2], 16) / 255.0
-    g = int(hex_color[2:4], 16) / 255.0
-    b = int(hex_color[4:6], 16) / 255.0
+    # (supports both "#RRGGBB" and "RRGGBB" formats)
+    r, g, b = (v / 255.0 for v in _parse_hex(hex_color))
 
     # K (key/black) is derived from the brightest RGB channel
     k = 1 - max(r, g, b)
@@ -38,22 +57,12 @@ def hex_to_cmyk(hex_color):
         y = (1 - b - k) / (1 - k)
 
     # Return as percentages (0-100)
-    return {
-        'c': round(c * 100),
-        'm': round(m * 100),
-        'y': round(y * 100),
-        'k': round(k * 100)
-    }
+    return (round(c * 100), round(m * 100), round(y * 100), round(k * 100))
 
 
 def hex_to_rgb(hex_color):
     """Convert hex color code to RGB tuple."""
-    hex_color = hex_color.lstrip('#')
-    return (
-        int(hex_color[0:2], 16),
-        int(hex_color[2:4], 16),
-        int(hex_color[4:6], 16)
-    )
+    return _parse_hex(hex_color)
 
 
 def rgb_to_hex(r, g, b):
@@ -61,10 +70,11 @@ def rgb_to_hex(r, g, b):
     return "#{:02x}{:02x}{:02x}".format(r, g, b).upper()
 
 
+@lru_cache(maxsize=4096)
 def is_light_color(hex_color):
     """
-    Determine if a color is light (for text color selection).
-    Uses luminance calculation to determine if white or black text should be used.
+    Determine if a color is light by perceived brightness (Rec. 601 luma).
+    For text color choices, contrast.best_text_color uses WCAG contrast instead.
 
     Args:
         hex_color: Hex color string (e.g., "#FFFFFF")
@@ -80,9 +90,153 @@ def is_light_color(hex_color):
     """
     r, g, b = hex_to_rgb(hex_color)
 
-    # Calculate relative luminance
-    # https://www.w3.org/TR/WCAG20-TECHS/G17.html
+    # Calculate perceived brightness
     luminance = (0.299 * r + 0.587 * g + 0.114 * b) / 255
 
     # Return True if luminance > 0.5 (light color)
     return luminance > 0.5
+
+
+def hex_to_rgb_array(hex_colors):
+    """
+    Convert a sequence of hex color codes to RGB in one vectorized pass.
+
+    Args:
+        hex_colors: Sequence of hex strings (e.g., ["#0A1F44", "00D9FF"])
+
+    Returns:
+        numpy.ndarray: uint8 array of shape (N, 3)
+
+    Raises:
+        ValueError: If any entry is not a 6-digit hex code
+    """
+    import numpy as np
+
+    stripped = [h.lstrip('#') for h in hex_colors]
+    if any(len(h) != 6 for h in stripped):
+        raise ValueError("Hex colors must have exactly 6 hex digits")
+    if not stripped:
+        return np.zeros((0, 3), dtype=np.uint8)
+
+    try:
+        codes = np.frombuffer(''.join(stripped).encode('ascii'), dtype=np.uint8)
+    except UnicodeEncodeError:
+        raise ValueError("Hex colors must be ASCII")
+
+    # ASCII -> nibble lookup; 255 marks invalid characters
+    nibble = np.full(256, 255, dtype=np.uint8)
+    nibble[np.frombuffer(b'0123456789', dtype=np.uint8)] = np.arange(10)
+    nibble[np.frombuffer(b'abcdef', dtype=np.uint8)] = np.arange(10, 16)
+    nibble[np.frombuffer(b'ABCDEF', dtype=np.uint8)] = np.arange(10, 16)
+
+    values = nibble[codes]
+    if (values == 255).any():
+        raise ValueError("Hex colors may only contain 0-9 and A-F")
+
+    values = values.reshape(-1, 3, 2)
+    return values[:, :, 0] * 16 + values[:, :, 1]
+
+
+def rgb_to_cmyk_array(rgb):
+    """
+    Convert an (N, 3) RGB array to CMYK percentages.
+
+    Uses the same formula and rounding as hex_to_cmyk.
+
+    Returns:
+        numpy.ndarray: int array of shape (N, 4) with columns c, m, y, k
+    """
+    import numpy as np
+
+    rgb = np.asarray(rgb, dtype=np.float64) / 255.0
+    k = 1 - rgb.max(axis=1)
+    denom = 1 - k
+    safe = np.where(denom == 0, 1.0, denom)
+    cmy = (1 - rgb - k[:, None]) / safe[:, None]
+    cmy[denom == 0] = 0  # Pure black
+
+    cmyk = np.empty((len(rgb), 4), dtype=np.float64)
+    cmyk[:, :3] = cmy
+    cmyk[:, 3] = k
+    return np.round(cmyk * 100).astype(int)
+
+
+def rgb_luminance_array(rgb):
+    """
+    Compute the luminance used by is_light_color for an (N, 3) RGB array.
+
+    Returns:
+        numpy.ndarray: float array of shape (N,) in the 0-1 range
+    """
+    import numpy as np
+
+    rgb = np.asarray(rgb, dtype=np.float64)
+    return (0.299 * rgb[:, 0] + 0.587 * rgb[:, 1] + 0.114 * rgb[:, 2]) / 255
+
+
+def hex_to_cmyk_array(hex_colors):
+    """Convert a sequence of hex codes to an (N, 4) int array of CMYK percentages."""
+    return rgb_to_cmyk_array(hex_to_rgb_array(hex_colors))
+
+
+def convert_colors(hex_colors):
+    """
+    Convert a sequence of hex codes to RGB, CMYK and luminance in one pass.
+
+    Args:
+        hex_colors: Sequence of hex strings
+
+    Returns:
+        dict: {
+            "rgb": (N, 3) uint8 array,
+            "cmyk": (N, 4) int array of percentages,
+            "luminance": (N,) float array,
+            "is_light": (N,) bool array (same threshold as is_light_color)
+        }
+
+    Example:
+        >>> convert_colors(["#0A1F44"])["cmyk"].tolist()
+        [[85, 54, 0, 73]]
+    """
+    rgb = hex_to_rgb_array(hex_colors)
+    luminance = rgb_luminance_array(rgb)
+    return {
+        "rgb": rgb,
+        "cmyk": rgb_to_cmyk_array(rgb),
+        "luminance": luminance,
+        "is_light": luminance > 0.5,
+    }
+
+
+def rgb_to_lab_array(rgb):
+    """
+    Convert an (N, 3) sRGB array (0-255) to CIE L*a*b* (D65).
+
+    Lab distances track perceived color difference far better than RGB,
+    which makes it the working space for palette clustering.
+
+    Returns:
+        numpy.ndarray: float array of shape (N, 3) with columns L, a, b
+    """
+    import numpy as np
+
+    srgb = np.asarray(rgb, dtype=np.float64) / 255.0
+    linear = np.where(srgb <= 0.04045, srgb / 12.92, ((srgb + 0.055) / 1.055) ** 2.4)
+
+    # Linear sRGB -> XYZ, pre-divided by the D65 white point
+    to_xyz = np.array([
+        [0.4124564, 0.3575761, 0.1804375],
+        [0.2126729, 0.7151522, 0.0721750],
+        [0.0193339, 0.1191920, 0.9503041],
+    ]) / np.array([0.95047, 1.0, 1.08883])[:, None]
+    xyz = linear @ to_xyz.T
+
+    epsilon = 216 / 24389
+    kappa = 24389 / 27
+    f = np.where(xyz > epsilon, np.cbrt(xyz), (kappa * xyz + 16) / 116)
+
+    lab = np.empty_like(f)
+    lab[:, 0] = 116 * f[:, 1] - 16
+    lab[:, 1] = 500 * (f[:, 0] - f[:, 1])
+    lab[:, 2] = 200 * (f[:, 1] - f[:, 2])
+    return lab
@@ -0,0 +1,208 @@
+"""
+Contrast checks for DJ Brand Guide Generator.
+Scores palettes by WCAG 2.x contrast ratio and picks readable text colors.
+
+Scalar helpers (used while building slides) are memoized per hex code and
+never import NumPy. The vectorized functions score whole palettes, or
+stacks of thousands of candidate palettes, in one NumPy pass.
+"""
+
+from functools import lru_cache
+
+from color_utils import hex_to_rgb, hex_to_rgb_array
+
+# WCAG 2.x minimum contrast ratios
+AA_NORMAL = 4.5  # Body text
+AA_LARGE = 3.0  # Large text (18pt, or 14pt bold) and non-text elements such as swatch outlines
+AAA_NORMAL = 7.0
+
+# Text colors the deck chooses between, in order of preference on a tie
+TEXT_COLORS = ("#000000", "#FFFFFF")
+
+# Slide background the swatches sit on
+SLIDE_BACKGROUND = "#FFFFFF"
+
+# Luminance weights of linear sRGB channels
+_WEIGHTS = (0.2126, 0.7152, 0.0722)
+
+
+def _linear(channel):
+    """Linearize one 0-255 sRGB channel value."""
+    c = channel / 255.0
+    return c / 12.92 if c <= 0.04045 else ((c + 0.055) / 1.055) ** 2.4
+
+
+@lru_cache(maxsize=4096)
+def relative_luminance(hex_color):
+    """
+    WCAG relative luminance of a color.
+
+    Args:
+        hex_color: Hex color string (e.g., "#0A1F44")
+
+    Returns:
+        float: Luminance from 0 (black) to 1 (white)
+    """
+    r, g, b = hex_to_rgb(hex_color)
+    return _WEIGHTS[0] * _linear(r) + _WEIGHTS[1] * _linear(g) + _WEIGHTS[2] * _linear(b)
+
+
+def contrast_ratio(hex_a, hex_b):
+    """
+    WCAG contrast ratio between two colors.
+
+    Returns:
+        float: Ratio from 1 (identical luminance) to 21 (black on white)
+
+    Example:
+        >>> round(contrast_ratio("#000000", "#FFFFFF"), 1)
+        21.0
+    """
+    a, b = relative_luminance(hex_a), relative_luminance(hex_b)
+    return (max(a, b) + 0.05) / (min(a, b) + 0.05)
+
+
+@lru_cache(maxsize=4096)
+def best_text_color(background, candidates=TEXT_COLORS):
+    """
+    The candidate text color with the highest contrast on a background.
+
+    Args:
+        background: Background hex color
+        candidates: Tuple of text hex colors (earlier ones win ties)
+
+    Returns:
+        str: The chosen candidate
+
+    Example:
+        >>> best_text_color("#808080")
+        '#000000'
+    """
+    return max(candidates, key=lambda text: contrast_ratio(text, background))
+
+
+def needs_outline(hex_color, background=SLIDE_BACKGROUND):
+    """True if a swatch is too close to the slide background to stand out without an outline (under 3:1)."""
+    return contrast_ratio(hex_color, background) < AA_LARGE
+
+
+@lru_cache(maxsize=1)
+def _linear_table():
+    """Linearized value of every 0-255 channel value, as a NumPy lookup table."""
+    import numpy as np
+
+    return np.array([_linear(value) for value in range(256)])
+
+
+def _as_rgb(colors):
+    """An (..., 3) uint8 RGB array from hex strings or an RGB array."""
+    import numpy as np
+
+    if isinstance(colors, np.ndarray):
+        return colors.astype(np.uint8, copy=False)
+    if len(colors) == 0 or isinstance(colors[0], str):
+        return hex_to_rgb_array(colors)
+    return np.asarray(colors, dtype=np.uint8)
+
+
+def relative_luminance_array(colors):
+    """
+    WCAG relative luminance of many colors at once.
+
+    Args:
+        colors: Hex strings, or a uint8 RGB array of shape (..., 3)
+
+    Returns:
+        numpy.ndarray: float array of shape (...)
+    """
+    import numpy as np
+
+    return _linear_table()[_as_rgb(colors)] @ np.array(_WEIGHTS)
+
+
+def contrast_matrix(colors):
+    """
+    Pairwise WCAG contrast ratios of a palette, or of a stack of palettes.
+
+    Args:
+        colors: Hex strings, or a uint8 RGB array of shape (N, 3) or (P, N, 3)
+
+    Returns:
+        numpy.ndarray: Symmetric ratios of shape (N, N) or (P, N, N); the diagonal is 1
+    """
+    import numpy as np
+
+    luminance = relative_luminance_array(colors)[..., :, None] + 0.05
+    other = np.swapaxes(luminance, -1, -2)
+    return np.maximum(luminance, other) / np.minimum(luminance, other)
+
+
+def best_text_colors(backgrounds, candidates=TEXT_COLORS):
+    """
+    Choose the highest-contrast text color for every background at once.
+
+    Args:
+        backgrounds: Hex strings, or a uint8 RGB array of shape (..., 3)
+        candidates: Text hex colors (earlier ones win ties)
+
+    Returns:
+        tuple: (indices into candidates, contrast ratios), both of shape (...)
+    """
+    import numpy as np
+
+    background = relative_luminance_array(backgrounds)[..., None] + 0.05
+    text = relative_luminance_array(list(candidates)) + 0.05
+    ratios = np.maximum(background, text) / np.minimum(background, text)
+    choice = ratios.argmax(axis=-1)
+    return choice, np.take_along_axis(ratios, choice[..., None], axis=-1)[..., 0]
+
+
+def failing_pairs(hex_colors, threshold=AA_NORMAL):
+    """
+    Pairs of palette colors that are unreadable as text on each other.
+
+    Args:
+        hex_colors: Sequence of hex strings
+        threshold: Minimum acceptable contrast ratio
+
+    Returns:
+        list: (hex_a, hex_b, ratio) for each pair below threshold, lowest ratio first
+    """
+    import numpy as np
+
+    ratios = contrast_matrix(hex_colors)
+    first, second = np.triu_indices(len(hex_colors), k=1)
+    failing = ratios[first, second] < threshold
+    pairs = [(hex_colors[i], hex_colors[j], float(ratios[i, j])) for i, j in zip(first[failing], second[failing])]
+    return sorted(pairs, key=lambda pair: pair[2])
+
+
+def score_palettes(palettes, threshold=AA_NORMAL, candidates=TEXT_COLORS):
+    """
+    Score a stack of candidate palettes in one vectorized pass.
+
+    Args:
+        palettes: uint8 RGB array of shape (P, N, 3), N >= 2
+        threshold: Minimum acceptable contrast ratio between palette colors
+        candidates: Text colors available for labels
+
+    Returns:
+        dict: Arrays of shape (P,): {
+            "min_contrast": lowest contrast between any two colors,
+            "failing_pairs": number of color pairs below threshold,
+            "min_text_contrast": lowest label contrast over the swatches,
+                with each swatch using its best text color
+        }
+    """
+    import numpy as np
+
+    ratios = contrast_matrix(palettes)
+    count = ratios.shape[-1]
+    upper = np.triu(np.ones((count, count), dtype=bool), k=1)
+    pair_ratios = ratios[..., upper]
+    _, text_ratios = best_text_colors(palettes, candidates)
+    return {
+        "min_contrast": pair_ratios.min(axis=-1),
+        "failing_pairs": (pair_ratios < threshold).sum(axis=-1),
+        "min_text_contrast": text_ratios.min(axis=-1),
+    }
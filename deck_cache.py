@@ -0,0 +1,199 @@
+"""
+Deck output cache for DJ Brand Guide Generator.
+Serves repeat requests with unchanged inputs from a content-addressed store.
+"""
+
+from contextlib import contextmanager
+from functools import lru_cache
+import hashlib
+import json
+import mmap
+import os
+import threading
+
+# Default size bound for cached decks on disk
+DEFAULT_MAX_BYTES = 512 * 1024 * 1024
+
+# Bump when a code change alters the decks produced for the same inputs
+CACHE_FORMAT_VERSION = 1
+
+DECK_SUFFIX = ".pptx"
+
+# Read size for files that cannot be memory-mapped
+CHUNK_BYTES = 1024 * 1024
+
+
+@contextmanager
+def open_mapped(path):
+    """
+    Open a file for reading through a read-only memory map.
+
+    The map reads pages straight from the page cache, without copying the
+    file onto the heap. Files that cannot be mapped (empty files, some
+    special filesystems) are yielded as ordinary binary files instead.
+
+    Yields:
+        mmap.mmap or file: Readable, seekable binary stream
+    """
+    with open(path, "rb") as f:
+        try:
+            mapped = mmap.mmap(f.fileno(), 0, access=mmap.ACCESS_READ)
+        except (ValueError, OSError):
+            yield f
+            return
+        with mapped:
+            yield mapped
+
+
+def file_digest(path, algorithm="sha256"):
+    """
+    Return the hex digest of a file's contents.
+
+    Digests are memoized per (path, mtime, size), so unchanged files are
+    hashed once per process. Files are hashed through a memory map, or in
+    chunks, never read whole onto the heap.
+
+    Args:
+        path: File path
+        algorithm: hashlib algorithm name
+    """
+    stat = os.stat(path)
+    return _file_digest(os.path.abspath(path), stat.st_mtime_ns, stat.st_size, algorithm)
+
+
+@lru_cache(maxsize=1024)
+def _file_digest(path, mtime_ns, size, algorithm="sha256"):
+    digest = hashlib.new(algorithm)
+    with open_mapped(path) as stream:
+        if isinstance(stream, mmap.mmap):
+            digest.update(stream)
+        else:
+            for chunk in iter(lambda: stream.read(CHUNK_BYTES), b""):
+                digest.update(chunk)
+    return digest.hexdigest()
+
+
+def content_key(material):
+    """
+    Hash JSON-serializable inputs into a stable hex key.
+
+    Dict key order does not matter; values that are not JSON types are
+    hashed by their str().
+    """
+    encoded = json.dumps({"version": CACHE_FORMAT_VERSION, "material": material}, sort_keys=True,
+                         separators=(",", ":"), ensure_ascii=False, default=str)
+    return hashlib.sha256(encoded.encode("utf-8")).hexdigest()
+
+
+class DeckCache:
+    """
+    Content-addressed on-disk cache of generated decks.
+
+    Keys hash the deck inputs together with the contents of every image and
+    template the deck embeds, so a changed upload produces a new key even if
+    its path is unchanged. Entries are evicted least recently used first once
+    the directory exceeds max_bytes. Several processes may share a directory.
+
+    Args:
+        cache_dir: Directory holding cached decks (created on first store)
+        max_bytes: Size bound for all cached decks
+
+    Example:
+        >>> cache = DeckCache("/tmp/deck-cache")
+        >>> create_brand_guide(dj_input, prompts, colors, "deck.pptx", cache=cache)  # Builds
+        >>> create_brand_guide(dj_input, prompts, colors, "deck.pptx", cache=cache)  # Copies cached deck
+    """
+
+    def __init__(self, cache_dir, max_bytes=DEFAULT_MAX_BYTES):
+        self.cache_dir = cache_dir
+        self.max_bytes = max_bytes
+
+    def key(self, dj_input, image_prompts, colors, visual_pillars=None, image_paths=(), template_path=None,
+            **options):
+        """
+        Compute the cache key for a deck request.
+
+        Args:
+            dj_input, image_prompts, colors, visual_pillars: As for create_brand_guide
+            image_paths: Resolved image path (or None) for each prompt
+            template_path: Optional template .pptx (its contents are hashed)
+            **options: Other output-affecting create_brand_guide options (e.g. image_dpi)
+
+        Returns:
+            str: Hex digest identifying the deck
+        """
+        return content_key({
+            "dj_input": dj_input,
+            "image_prompts": image_prompts,
+            "colors": colors,
+            "visual_pillars": visual_pillars,
+            "images": [file_digest(path) if path else None for path in image_paths],
+            "template": file_digest(template_path) if template_path else None,
+            "options": options,
+        })
+
+    def path(self, key):
+        """Return the file path for a key (whether or not it is cached)."""
+        return os.path.join(self.cache_dir, key + DECK_SUFFIX)
+
+    def lookup(self, key):
+        """
+        Return the path of a cached deck, or None on a miss.
+
+        A hit refreshes the entry's modification time, which orders eviction.
+        """
+        path = self.path(key)
+        try:
+            os.utime(path)
+        except FileNotFoundError:
+            return None
+        return path
+
+    def store(self, key, data):
+        """
+        Store deck bytes under a key, then evict entries over max_bytes.
+
+        Returns:
+            str: Path of the cached deck
+        """
+        os.makedirs(self.cache_dir, exist_ok=True)
+        path = self.path(key)
+        tmp_path = os.path.join(self.cache_dir, f".{key}.{os.getpid()}.{threading.get_ident()}.tmp")
+        with open(tmp_path, "wb") as f:
+            f.write(data)
+        os.replace(tmp_path, path)
+        self._evict(keep=path)
+        return path
+
+    def _evict(self, keep=None):
+        """Delete least recently used decks until the cache fits in max_bytes."""
+        entries = []
+        total = 0
+        with os.scandir(self.cache_dir) as it:
+            for entry in it:
+                if entry.name.endswith(DECK_SUFFIX) and entry.is_file():
+                    stat = entry.stat()
+                    entries.append((stat.st_mtime_ns, entry.path, stat.st_size))
+                    total += stat.st_size
+
+        if total <= self.max_bytes:
+            return
+        for _, path, size in sorted(entries):
+            if path == keep:
+                continue
+            try:
+                os.remove(path)
+            except FileNotFoundError:
+                pass  # Evicted concurrently by another process
+            total -= size
+            if total <= self.max_bytes:
+                break
+
+    def clear(self):
+        """Delete every cached deck."""
+        if not os.path.isdir(self.cache_dir):
+            return
+        with os.scandir(self.cache_dir) as it:
+            for entry in it:
+                if entry.name.endswith(DECK_SUFFIX):
+                    os.remove(entry.path)
@@ -0,0 +1,310 @@
+"""
+Image preprocessing for DJ Brand Guide Generator.
+Downsizes media to its placed box before it is embedded in the deck.
+"""
+
+from collections import OrderedDict
+from contextlib import contextmanager
+import io
+import math
+import os
+import struct
+import threading
+
+from deck_cache import file_digest, open_mapped
+
+# EMU per inch (python-pptx lengths are in EMU)
+EMU_PER_INCH = 914400
+
+# Target resolution for embedded images; 150 DPI is sharp on screen and in draft print
+DEFAULT_DPI = 150
+DEFAULT_JPEG_QUALITY = 85
+MIN_JPEG_QUALITY = 50
+
+# In-memory derivative cache bound (bytes of encoded output)
+MAX_CACHE_BYTES = 64 * 1024 * 1024
+
+# Default cap on images decoded at once in a process; each holds a full-resolution bitmap
+DEFAULT_MAX_DECODES = 4
+
+_decode_slots = threading.BoundedSemaphore(DEFAULT_MAX_DECODES)
+
+_derivatives = OrderedDict()
+_derivative_bytes = 0
+_lock = threading.Lock()
+
+# Probed (width, height) per file, keyed by (path, mtime_ns, size)
+_dimensions = {}
+
+PNG_SIGNATURE = b"\x89PNG\r\n\x1a\n"
+
+# JPEG start-of-frame markers carry the image size (C4/C8/CC are DHT/JPG/DAC)
+JPEG_SOF_MARKERS = {0xC0, 0xC1, 0xC2, 0xC3, 0xC5, 0xC6, 0xC7, 0xC9, 0xCA, 0xCB, 0xCD, 0xCE, 0xCF}
+
+# EXIF orientation tag, and the orientations that display the image rotated a quarter turn
+EXIF_ORIENTATION = 0x0112
+TRANSPOSED_ORIENTATIONS = {5, 6, 7, 8}
+
+
+def image_size(image_path):
+    """
+    Return an image's displayed pixel dimensions by reading only its header.
+
+    PNG and JPEG headers are parsed directly; other formats fall back to
+    Pillow, which also stops after the header. Width and height are swapped
+    for JPEGs whose EXIF orientation turns them a quarter turn, as cameras
+    and phones record portrait photos. Results are cached per file and
+    invalidated when the file's mtime or size changes.
+
+    Args:
+        image_path: Path to the image file
+
+    Returns:
+        tuple: (width_px, height_px)
+    """
+    st = os.stat(image_path)
+    key = (image_path, st.st_mtime_ns, st.st_size)
+    size = _dimensions.get(key)
+    if size is None:
+        with open(image_path, "rb") as f:
+            size = _probe_png(f) or _probe_jpeg(f)
+        if size is None:
+            from PIL import Image
+
+            with Image.open(image_path) as img:
+                size = img.size
+        _dimensions[key] = size
+    return size
+
+
+def _probe_png(f):
+    """Read width/height from the IHDR chunk, or None if not a PNG."""
+    f.seek(0)
+    header = f.read(24)
+    if len(header) == 24 and header.startswith(PNG_SIGNATURE) and header[12:16] == b"IHDR":
+        return struct.unpack(">II", header[16:24])
+    return None
+
+
+def _exif_orientation(segment):
+    """Read the orientation tag from an APP1 segment's EXIF data (1, upright, if absent)."""
+    if not segment.startswith(b"Exif\x00\x00") or len(segment) < 14:
+        return 1
+    tiff = segment[6:]
+    order = {b"II": "<", b"MM": ">"}.get(tiff[:2])
+    if order is None:
+        return 1
+    ifd = struct.unpack(order + "I", tiff[4:8])[0]
+    if ifd + 2 > len(tiff):
+        return 1
+    count = struct.unpack(order + "H", tiff[ifd:ifd + 2])[0]
+    for entry in range(ifd + 2, min(ifd + 2 + 12 * count, len(tiff) - 11), 12):
+        tag, _, _, value = struct.unpack(order + "HHIH", tiff[entry:entry + 10])
+        if tag == EXIF_ORIENTATION:
+            return value
+    return 1
+
+
+def _probe_jpeg(f):
+    """Walk JPEG markers up to the first start-of-frame segment, or None if not a JPEG."""
+    f.seek(0)
+    if f.read(2) != b"\xff\xd8":
+        return None
+
+    orientation = 1
+
+    while True:
+        byte = f.read(1)
+        while byte and byte != b"\xff":
+            byte = f.read(1)
+        while byte == b"\xff":  # Markers may be padded with fill bytes
+            byte = f.read(1)
+        if not byte:
+            return None
+
+        marker = byte[0]
+        if marker == 0x01 or 0xD0 <= marker <= 0xD9:
+            continue  # Standalone markers have no length field
+
+        length_bytes = f.read(2)
+        if len(length_bytes) != 2:
+            return None
+        length = struct.unpack(">H", length_bytes)[0]
+
+        if marker in JPEG_SOF_MARKERS:
+            segment = f.read(5)
+            if len(segment) != 5:
+                return None
+            height, width = struct.unpack(">HH", segment[1:5])
+            return (height, width) if orientation in TRANSPOSED_ORIENTATIONS else (width, height)
+
+        if marker == 0xE1 and orientation == 1:
+            orientation = _exif_orientation(f.read(length - 2))
+        else:
+            f.seek(length - 2, os.SEEK_CUR)
+
+
+def set_max_decodes(limit):
+    """
+    Cap how many images may be decoded at once in this process.
+
+    Decodes beyond the cap wait for a slot, so peak memory depends on the
+    cap rather than on how many decks are being built concurrently.
+
+    Args:
+        limit: Maximum concurrent decodes (at least 1)
+
+    Raises:
+        ValueError: If limit is less than 1
+    """
+    global _decode_slots
+    if limit < 1:
+        raise ValueError(f"Decode limit must be at least 1, got {limit}")
+    _decode_slots = threading.BoundedSemaphore(limit)
+
+
+@contextmanager
+def decode_slot():
+    """Hold one of the process's decode slots (see set_max_decodes) while decoding an image."""
+    slots = _decode_slots
+    with slots:
+        yield
+
+
+def target_pixels(width, height, dpi=DEFAULT_DPI):
+    """
+    Convert a placed box size to the pixel size needed at the given DPI.
+
+    Args:
+        width, height: Box dimensions in EMU
+        dpi: Target resolution in dots per inch
+
+    Returns:
+        tuple: (width_px, height_px)
+    """
+    return (
+        max(1, math.ceil(width * dpi / EMU_PER_INCH)),
+        max(1, math.ceil(height * dpi / EMU_PER_INCH)),
+    )
+
+
+def prepare_image(image_path, width, height, dpi=DEFAULT_DPI, quality=DEFAULT_JPEG_QUALITY,
+                  max_bytes=None, cache_dir=None):
+    """
+    Resample an image to the resolution of its placed box and re-encode it.
+
+    Images are turned upright according to their EXIF orientation first.
+    Upright images that already fit the box (and the byte budget) are
+    returned untouched. Derivatives are cached in memory, and optionally on disk, keyed
+    by content hash plus target size and encoding settings.
+
+    Args:
+        image_path: Path to the source image
+        width, height: Placed box dimensions in EMU
+        dpi: Target resolution in dots per inch
+        quality: Starting JPEG quality for opaque images
+        max_bytes: Optional size budget; JPEG quality steps down to meet it
+        cache_dir: Optional directory for persistent derivatives
+
+    Returns:
+        str or BytesIO: Original path, or an in-memory stream of the derivative
+    """
+    target_w, target_h = target_pixels(width, height, dpi)
+    key = f"{file_digest(image_path)}_{target_w}x{target_h}_q{quality}_b{max_bytes or 0}"
+
+    derivative = _cache_get(key, cache_dir)
+    if derivative is None:
+        # Only a miss reads the file; the digest is memoized per path, mtime and size
+        with decode_slot(), open_mapped(image_path) as source:
+            derivative = _resample(source, os.path.getsize(image_path), target_w, target_h, quality, max_bytes)
+        _cache_put(key, derivative, cache_dir)
+
+    if not derivative:
+        # Empty derivative marks "original is already optimal"
+        return image_path
+    return io.BytesIO(derivative)
+
+
+def _resample(source, source_bytes, target_w, target_h, quality, max_bytes):
+    """Return re-encoded bytes of a binary stream, or b"" when the original should be embedded as-is."""
+    from PIL import Image, ImageOps
+
+    with Image.open(source) as img:
+        orientation = img.getexif().get(EXIF_ORIENTATION, 1)
+        transposed = orientation in TRANSPOSED_ORIENTATIONS
+        width, height = (img.height, img.width) if transposed else img.size
+        fits = width <= target_w and height <= target_h
+        if orientation == 1 and fits and (max_bytes is None or source_bytes <= max_bytes):
+            return b""
+
+        # JPEG draft mode decodes at a reduced scale, skipping most of the work
+        img.draft("RGB", (target_h, target_w) if transposed else (target_w, target_h))
+        img = ImageOps.exif_transpose(img)
+        has_alpha = img.mode in ("RGBA", "LA", "PA") or (img.mode == "P" and "transparency" in img.info)
+        img = img.convert("RGBA" if has_alpha else "RGB")
+        img.thumbnail((target_w, target_h), Image.LANCZOS)
+
+    out = io.BytesIO()
+    if has_alpha:
+        img.save(out, format="PNG", optimize=True)
+    else:
+        q = quality
+        while True:
+            out.seek(0)
+            out.truncate()
+            img.save(out, format="JPEG", quality=q, optimize=True, progressive=True)
+            if max_bytes is None or out.tell() <= max_bytes or q <= MIN_JPEG_QUALITY:
+                break
+            q = max(MIN_JPEG_QUALITY, q - 10)
+
+    encoded = out.getvalue()
+    # A rotated original is never embedded as-is: not every viewer applies EXIF orientation
+    return encoded if orientation != 1 or len(encoded) < source_bytes else b""
+
+
+def _cache_get(key, cache_dir):
+    """Look up a derivative in memory, then on disk."""
+    with _lock:
+        derivative = _derivatives.get(key)
+        if derivative is not None:
+            _derivatives.move_to_end(key)
+            return derivative
+
+    if cache_dir:
+        path = os.path.join(cache_dir, key)
+        if os.path.exists(path):
+            with open(path, "rb") as f:
+                derivative = f.read()
+            _cache_put(key, derivative, None)
+            return derivative
+    return None
+
+
+def _cache_put(key, derivative, cache_dir):
+    """Store a derivative, evicting least recently used entries over MAX_CACHE_BYTES."""
+    global _derivative_bytes
+
+    with _lock:
+        previous = _derivatives.pop(key, None)
+        if previous is not None:
+            _derivative_bytes -= len(previous)
+        _derivatives[key] = derivative
+        _derivative_bytes += len(derivative)
+        while _derivative_bytes > MAX_CACHE_BYTES and len(_derivatives) > 1:
+            _, evicted = _derivatives.popitem(last=False)
+            _derivative_bytes -= len(evicted)
+
+    if cache_dir:
+        os.makedirs(cache_dir, exist_ok=True)
+        tmp_path = os.path.join(cache_dir, f".{key}.{os.getpid()}.{threading.get_ident()}.tmp")
+        with open(tmp_path, "wb") as f:
+            f.write(derivative)
+        os.replace(tmp_path, os.path.join(cache_dir, key))
+
+
+def clear_cache():
+    """Drop all in-memory derivatives."""
+    global _derivative_bytes
+    with _lock:
+        _derivatives.clear()
+        _derivative_bytes = 0
@@ -0,0 +1,222 @@
+"""
+Performance instrumentation for DJ Brand Guide Generator.
+Records timing and memory spans for each stage of deck generation.
+"""
+
+from contextlib import contextmanager
+from contextvars import ContextVar
+import json
+import time
+import tracemalloc
+
+# Tracer for the deck currently being generated (None = instrumentation off)
+_current_tracer = ContextVar("current_tracer", default=None)
+
+
+class Span:
+    """
+    One timed stage of deck generation.
+
+    Attributes:
+        name: Stage name (e.g., "create_moodboard_slide")
+        parent: Name of the enclosing span, or None
+        seconds: Wall time
+        bytes: Bytes written or embedded during the stage (set by the stage)
+        peak_bytes: tracemalloc peak above the level at span start (None if not tracing)
+        attrs: Extra stage-specific fields
+    """
+
+    __slots__ = ("name", "parent", "seconds", "bytes", "peak_bytes", "attrs",
+                 "_start", "_start_memory", "_peak_seen")
+
+    def __init__(self, name, parent, attrs):
+        self.name = name
+        self.parent = parent
+        self.seconds = 0.0
+        self.bytes = 0
+        self.peak_bytes = None
+        self.attrs = attrs
+
+    def set(self, **attrs):
+        """Attach extra fields to the span (e.g., counts discovered by the stage)."""
+        self.attrs.update(attrs)
+
+    def to_dict(self):
+        """Return the span as a JSON-serializable dict."""
+        record = {
+            "name": self.name,
+            "parent": self.parent,
+            "seconds": self.seconds,
+            "bytes": self.bytes,
+            "peak_bytes": self.peak_bytes,
+        }
+        record.update(self.attrs)
+        return record
+
+
+class Tracer:
+    """
+    Collects spans for one or more deck builds.
+
+    Args:
+        trace_memory: Record tracemalloc peaks per span (slower; for profiling)
+        callback: Optional callable invoked with each finished span's dict
+
+    Example:
+        >>> tracer = Tracer(trace_memory=True)
+        >>> create_brand_guide(dj_input, prompts, colors, "deck.pptx", tracer=tracer)
+        >>> print(tracer.to_json())
+    """
+
+    def __init__(self, trace_memory=False, callback=None):
+        self.trace_memory = trace_memory
+        self.callback = callback
+        self.spans = []
+        self._stack = []
+        self._started_tracemalloc = False
+
+    @contextmanager
+    def span(self, name, **attrs):
+        """Time a stage; yields the Span so the stage can record bytes."""
+        parent = self._stack[-1] if self._stack else None
+        span = Span(name, parent.name if parent else None, attrs)
+
+        if self.trace_memory:
+            if not tracemalloc.is_tracing():
+                tracemalloc.start()
+                self._started_tracemalloc = True
+            # Resetting the peak would hide the parent's peak so far; carry it over first
+            current, peak = tracemalloc.get_traced_memory()
+            if parent is not None:
+                parent._peak_seen = max(parent._peak_seen, peak)
+            tracemalloc.reset_peak()
+            span._start_memory = current
+            span._peak_seen = current
+
+        self._stack.append(span)
+        span._start = time.perf_counter()
+        try:
+            yield span
+        finally:
+            span.seconds = time.perf_counter() - span._start
+            self._stack.pop()
+
+            if self.trace_memory:
+                peak = max(tracemalloc.get_traced_memory()[1], span._peak_seen)
+                span.peak_bytes = peak - span._start_memory
+                if parent is not None:
+                    parent._peak_seen = max(parent._peak_seen, peak)
+                elif self._started_tracemalloc:
+                    tracemalloc.stop()
+                    self._started_tracemalloc = False
+
+            self.spans.append(span)
+            if self.callback is not None:
+                self.callback(span.to_dict())
+
+    def to_list(self):
+        """Return all finished spans as dicts, in completion order."""
+        return [span.to_dict() for span in self.spans]
+
+    def to_json(self, **kwargs):
+        """Return all finished spans as a JSON array string."""
+        return json.dumps(self.to_list(), **kwargs)
+
+    def totals(self):
+        """Return total seconds per span name (e.g., all embed_image spans summed)."""
+        totals = {}
+        for span in self.spans:
+            totals[span.name] = totals.get(span.name, 0.0) + span.seconds
+        return totals
+
+
+class _NullSpan:
+    """Stand-in yielded when instrumentation is off; attribute writes are ignored."""
+
+    __slots__ = ()
+    bytes = 0
+
+    def __setattr__(self, name, value):
+        pass
+
+    def set(self, **attrs):
+        pass
+
+    def __enter__(self):
+        return self
+
+    def __exit__(self, *exc):
+        return False
+
+
+_NULL_SPAN = _NullSpan()
+
+
+def trace(name, **attrs):
+    """
+    Open a span on the active tracer, or a no-op when none is active.
+
+    Usage:
+        with trace("create_moodboard_slide") as span:
+            ...
+            span.bytes = written
+    """
+    tracer = _current_tracer.get()
+    if tracer is None:
+        return _NULL_SPAN
+    return tracer.span(name, **attrs)
+
+
+def is_tracing():
+    """Return True if a tracer is active (use to skip work only needed for spans)."""
+    return _current_tracer.get() is not None
+
+
+@contextmanager
+def use_tracer(tracer):
+    """Make tracer the active tracer for code run inside the block."""
+    token = _current_tracer.set(tracer)
+    try:
+        yield tracer
+    finally:
+        _current_tracer.reset(token)
+
+
+def measure_peak_memory(func, *args, **kwargs):
+    """
+    Call a function and measure its peak Python heap allocation above the
+    level at the time of the call.
+
+    Uses tracemalloc, so the figure covers memory allocated through Python
+    (including image blobs and the in-memory zip) but not native buffers
+    that bypass the Python allocator. Tracing slows the call down; use it
+    for profiling, not in production paths.
+
+    Args:
+        func: Callable to measure (e.g., create_brand_guide_bytes)
+        *args, **kwargs: Arguments for func
+
+    Returns:
+        tuple: (result, {"peak_bytes": int, "seconds": float})
+
+    Example:
+        >>> deck, stats = measure_peak_memory(create_brand_guide_bytes, dj_input, prompts, colors)
+        >>> stats["peak_bytes"]
+    """
+    already_tracing = tracemalloc.is_tracing()
+    if already_tracing:
+        tracemalloc.reset_peak()
+    else:
+        tracemalloc.start()
+
+    baseline, _ = tracemalloc.get_traced_memory()
+    start = time.perf_counter()
+    try:
+        result = func(*args, **kwargs)
+        seconds = time.perf_counter() - start
+        _, peak = tracemalloc.get_traced_memory()
+    finally:
+        if not already_tracing:
+            tracemalloc.stop()
+
+    return result, {"peak_bytes": peak - baseline, "seconds": seconds}
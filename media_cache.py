@@ -0,0 +1,264 @@
+"""
+Media cache for DJ Brand Guide Generator.
+Shares embeddable image payloads across decks built in the same process.
+
+Images embedded unchanged (originals, and files already small enough for
+their box) are not held in memory: they are hashed through a memory map and
+copied from disk in chunks when the deck is saved, so a deck's memory does
+not grow with the size or number of its original images.
+"""
+
+from collections import OrderedDict
+import os
+import shutil
+import threading
+import weakref
+
+from pptx.opc.constants import RELATIONSHIP_TYPE as RT
+from pptx.opc.packuri import PackURI
+from pptx.parts.image import Image, ImagePart
+from pptx.util import lazyproperty
+
+from deck_cache import CHUNK_BYTES, file_digest
+from image_pipeline import prepare_image, target_pixels
+
+# Bound on cached image payloads (bytes of in-memory blobs; file-backed images cost nothing)
+MAX_MEDIA_BYTES = 256 * 1024 * 1024
+
+# (content digest, file mtime_ns and size, target pixels or None, filename) -> python-pptx Image or FileImage
+_images = OrderedDict()
+_image_bytes = 0
+_lock = threading.Lock()
+
+# Package -> _PackageImages, so adding a picture never walks the whole package
+_package_images = weakref.WeakKeyDictionary()
+
+
+class FileImage(Image):
+    """
+    A python-pptx Image whose bytes stay on disk until they are needed.
+
+    The SHA-1 is computed by a streaming hash and the format from the file
+    header; the blob is read only when something asks for it. The file must
+    not change while a deck using it is being built and saved.
+    """
+
+    def __init__(self, path):
+        super().__init__(None, os.path.basename(path))
+        self.path = os.path.abspath(path)
+        stat = os.stat(self.path)
+        self._stat = (stat.st_mtime_ns, stat.st_size)
+
+    def _check_stat(self, stat):
+        if (stat.st_mtime_ns, stat.st_size) != self._stat:
+            raise ValueError(f"{self.path} changed after it was added to a deck")
+
+    def check(self):
+        """
+        Check that the image file is unchanged, without opening it.
+
+        Raises:
+            ValueError: If the file changed since the image was created
+        """
+        self._check_stat(os.stat(self.path))
+
+    def open(self):
+        """
+        Open the image file for reading.
+
+        Raises:
+            ValueError: If the file changed since the image was created
+        """
+        f = open(self.path, "rb")
+        try:
+            self._check_stat(os.fstat(f.fileno()))
+        except ValueError:
+            f.close()
+            raise
+        return f
+
+    @property
+    def blob(self):
+        with self.open() as f:
+            return f.read()
+
+    @lazyproperty
+    def sha1(self):
+        return file_digest(self.path, "sha1")
+
+    @lazyproperty
+    def _pil_props(self):
+        from PIL import Image as PILImage
+
+        with PILImage.open(self.path) as img:
+            return img.format, img.size, img.info.get("dpi")
+
+
+class FileImagePart(ImagePart):
+    """An image part backed by a FileImage, written to the package by streaming its file."""
+
+    def __init__(self, partname, content_type, package, image):
+        super().__init__(partname, content_type, package, None, image.filename)
+        self._image = image
+
+    @property
+    def blob(self):
+        return self._image.blob
+
+    @property
+    def image(self):
+        return self._image
+
+    @lazyproperty
+    def sha1(self):
+        return self._image.sha1
+
+    @property
+    def _dpi(self):
+        return self._image.dpi
+
+    @property
+    def _px_size(self):
+        return self._image.size
+
+    def write_to(self, stream):
+        """Copy the image into a writable binary stream, a chunk at a time."""
+        with self._image.open() as f:
+            shutil.copyfileobj(f, stream, CHUNK_BYTES)
+
+
+def _cached_bytes(image):
+    """Memory an image payload holds (file-backed images hold only their path)."""
+    return 0 if isinstance(image, FileImage) else len(image.blob)
+
+
+def payload_bytes(image):
+    """Size in bytes of an image payload, without reading a file-backed image."""
+    return image._stat[1] if isinstance(image, FileImage) else len(image.blob)
+
+
+def get_image(image_path, width, height, dpi, max_bytes=None, cache_dir=None):
+    """
+    Return the python-pptx Image to embed for a file placed at a given size.
+
+    The first request for a file and size resamples it (via prepare_image)
+    and computes the payload's SHA-1 and format once. Later requests, from
+    any deck in the process, only stat the file; a file rewritten since
+    (even with the same bytes) gets a fresh entry. Files embedded unchanged
+    are returned as a FileImage, read from disk only when the deck is saved.
+
+    Args:
+        image_path: Path to the source image
+        width, height: Placed size in EMU
+        dpi: Target resolution (None embeds the original file)
+        max_bytes: Optional size budget for the resampled image
+        cache_dir: Optional directory for persistent resampled images
+
+    Returns:
+        pptx.parts.image.Image: Shared, read-only image payload
+    """
+    global _image_bytes
+
+    filename = os.path.basename(image_path)
+    stat = os.stat(image_path)
+    key = (file_digest(image_path), (stat.st_mtime_ns, stat.st_size),
+           (target_pixels(width, height, dpi), max_bytes) if dpi else None, filename)
+    with _lock:
+        image = _images.get(key)
+        if image is not None:
+            _images.move_to_end(key)
+            return image
+
+    source = (prepare_image(image_path, width, height, dpi, max_bytes=max_bytes, cache_dir=cache_dir)
+              if dpi else image_path)
+    # Pictures keep the source filename as their description, as add_picture(path) does
+    image = FileImage(source) if isinstance(source, str) else Image.from_blob(source.getvalue(), filename)
+    # Resolve lazy properties now so every deck reuses them
+    image.sha1, image.ext
+
+    with _lock:
+        if key not in _images:
+            _images[key] = image
+            _image_bytes += _cached_bytes(image)
+            while _image_bytes > MAX_MEDIA_BYTES and len(_images) > 1:
+                _, evicted = _images.popitem(last=False)
+                _image_bytes -= _cached_bytes(evicted)
+    return image
+
+
+class _PackageImages:
+    """
+    The image parts of one package by SHA-1, plus its used media part numbers.
+
+    python-pptx finds a duplicate image and the next free part name by walking
+    every relationship in the package, which makes a deck of N pictures cost
+    O(N^2). This index walks the package once, on its first add_picture.
+    """
+
+    def __init__(self, package):
+        self.by_sha1 = {}
+        for part in package._image_parts:
+            # Unsupported image types (e.g. SVG) have no sha1
+            if hasattr(part, "sha1"):
+                self.by_sha1.setdefault(part.sha1, part)
+        self.used = {
+            part.partname.idx for part in package.iter_parts()
+            if part.partname.startswith("/ppt/media/image") and part.partname.idx is not None
+        }
+        self.next_idx = 1
+
+    def partname(self, ext):
+        """Return the first free /ppt/media/imageN partname, as python-pptx would."""
+        while self.next_idx in self.used:
+            self.next_idx += 1
+        self.used.add(self.next_idx)
+        return PackURI(f"/ppt/media/image{self.next_idx}.{ext}")
+
+
+def add_picture(slide, image, x, y, width, height):
+    """
+    Add a picture from a cached Image (slide.shapes.add_picture for get_image results).
+
+    The deck's existing image part is reused when it already holds the same
+    bytes, as python-pptx does for files. Image parts are tracked per package
+    from its first add_picture on, so a deck's pictures should all be added
+    through this function.
+
+    Returns:
+        Picture: The new picture shape
+
+    Raises:
+        ValueError: If a file-backed image changed since it was created
+            (checked before the slide is related to any part)
+    """
+    if isinstance(image, FileImage):
+        image.check()
+
+    package = slide.part.package
+    with _lock:
+        index = _package_images.get(package)
+        if index is None:
+            index = _package_images[package] = _PackageImages(package)
+
+    image_part = index.by_sha1.get(image.sha1)
+    if image_part is None:
+        partname = index.partname(image.ext)
+        if isinstance(image, FileImage):
+            image_part = FileImagePart(partname, image.content_type, package, image)
+        else:
+            image_part = ImagePart(partname, image.content_type, package, image.blob, image.filename)
+        index.by_sha1[image.sha1] = image_part
+    rId = slide.part.relate_to(image_part, RT.IMAGE)
+
+    shapes = slide.shapes
+    pic = shapes._add_pic_from_image_part(image_part, rId, x, y, width, height)
+    shapes._recalculate_extents()
+    return shapes._shape_factory(pic)
+
+
+def clear_cache():
+    """Drop all cached image payloads."""
+    global _image_bytes
+    with _lock:
+        _images.clear()
+        _image_bytes = 0
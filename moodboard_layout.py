@@ -0,0 +1,90 @@
+"""
+Moodboard layout engine for DJ Brand Guide Generator.
+Flows any number of image prompts across as many moodboard slides as needed.
+
+The whole layout is computed up front in one pass: each page type (the
+first page, which carries the brand narrative, and full-width continuation
+pages) has its grid geometry worked out once, then prompts are dealt into
+cells in order. All positions are in EMU, ready for python-pptx.
+"""
+
+# EMU per inch (python-pptx lengths are in EMU)
+EMU_PER_INCH = 914400
+
+# Slide size (16:9, as pptx_generator.SLIDE_WIDTH / SLIDE_HEIGHT)
+SLIDE_WIDTH = 10 * EMU_PER_INCH
+SLIDE_HEIGHT = int(5.625 * EMU_PER_INCH)
+
+# Default grid density: (columns, rows) of image cells per moodboard slide
+DEFAULT_GRID = (2, 2)
+
+# Page geometry
+MARGIN = int(0.5 * EMU_PER_INCH)                 # Left and right slide margin
+CONTENT_TOP = int(1.0 * EMU_PER_INCH)            # Below the slide title
+CONTENT_BOTTOM = SLIDE_HEIGHT - int(0.3 * EMU_PER_INCH)
+COLUMN_GAP = int(0.3 * EMU_PER_INCH)
+ROW_GAP = int(0.2 * EMU_PER_INCH)
+NARRATIVE_WIDTH = int(2.75 * EMU_PER_INCH)       # Narrative column on the first page
+
+# Each cell is a label strip above the image (or text fallback) box
+LABEL_HEIGHT = int(0.3 * EMU_PER_INCH)
+LABEL_SPACING = int(0.35 * EMU_PER_INCH)         # Cell top to image box top
+
+# Smallest cell that still reads at presentation distance
+MIN_CELL_WIDTH = int(1.0 * EMU_PER_INCH)
+MIN_IMAGE_HEIGHT = int(0.5 * EMU_PER_INCH)
+
+
+def _grid_cells(left, width, columns, rows):
+    """Return the (x, y, width, height) of each cell in a grid, row by row."""
+    cell_width = (width - (columns - 1) * COLUMN_GAP) // columns
+    cell_height = (CONTENT_BOTTOM - CONTENT_TOP - (rows - 1) * ROW_GAP) // rows
+    if cell_width < MIN_CELL_WIDTH or cell_height - LABEL_SPACING < MIN_IMAGE_HEIGHT:
+        raise ValueError(f"Moodboard grid {columns}x{rows} is too dense to fit a slide")
+    return [
+        (left + col * (cell_width + COLUMN_GAP), CONTENT_TOP + row * (cell_height + ROW_GAP),
+         cell_width, cell_height)
+        for row in range(rows)
+        for col in range(columns)
+    ]
+
+
+def layout_moodboard(count, grid=DEFAULT_GRID):
+    """
+    Lay out `count` image prompts across moodboard slides.
+
+    The first slide holds columns x rows cells beside a narrative column;
+    continuation slides hold the same number of cells across the full width.
+    There is always at least one slide, so the narrative is placed even
+    when there are no prompts.
+
+    Args:
+        count: Number of image prompts
+        grid: (columns, rows) of cells per slide
+
+    Returns:
+        list: One dict per slide with "cells", a list of
+            (prompt index, x, y, width, height), and "narrative", the
+            (x, y, width, height) of the narrative column or None
+
+    Raises:
+        ValueError: If the grid is empty or too dense for its cells to be readable
+    """
+    columns, rows = grid
+    if columns < 1 or rows < 1:
+        raise ValueError(f"Moodboard grid must have at least one column and row, got {columns}x{rows}")
+
+    narrative_left = SLIDE_WIDTH - MARGIN - NARRATIVE_WIDTH
+    narrative = (narrative_left, CONTENT_TOP, NARRATIVE_WIDTH, CONTENT_BOTTOM - CONTENT_TOP)
+    first_cells = _grid_cells(MARGIN, narrative_left - COLUMN_GAP - MARGIN, columns, rows)
+    next_cells = _grid_cells(MARGIN, SLIDE_WIDTH - 2 * MARGIN, columns, rows)
+
+    per_page = columns * rows
+    pages = []
+    for start in range(0, max(count, 1), per_page):
+        cells = first_cells if start == 0 else next_cells
+        pages.append({
+            "cells": [(start + i, *cell) for i, cell in enumerate(cells[:count - start])],
+            "narrative": narrative if start == 0 else None,
+        })
+    return pages
@@ -0,0 +1,271 @@
+"""
+Direct OOXML rendering for DJ Brand Guide Generator.
+Fills pre-compiled shape XML templates for the fixed-layout slides.
+
+The visual pillars and color palette slides always have the same shapes in
+the same places; only their text and colors vary. Building them through the
+python-pptx object API walks and mutates the lxml tree once per property.
+This renderer formats the shape XML for a whole slide as one string and
+parses it in a single call, producing the same XML python-pptx would.
+"""
+
+from xml.sax.saxutils import escape
+import re
+
+from pptx.oxml import parse_xml
+from pptx.oxml.ns import nsdecls
+from pptx.util import Inches, Pt
+
+from color_utils import hex_to_cmyk, hex_to_rgb
+from contrast import TEXT_COLORS, best_text_color, needs_outline
+from text_metrics import fit_font_size
+
+# Characters python-pptx escapes as "_xHHHH_" in run text (all C0 controls but tab and line feed)
+_CONTROL_CHARS = re.compile(r"([\x00-\x08\x0B-\x1F])")
+
+# Text splits into runs at line feeds and vertical tabs (as python-pptx's paragraph.text)
+_LINE_BREAKS = re.compile("\n|\v")
+
+_SHAPES_TMPL = "<p:spTree %s>%%s</p:spTree>" % nsdecls("a", "p")
+
+_TEXTBOX_TMPL = (
+    '<p:sp><p:nvSpPr><p:cNvPr id="%d" name="TextBox %d"/><p:cNvSpPr txBox="1"/><p:nvPr/></p:nvSpPr>'
+    '<p:spPr><a:xfrm><a:off x="%d" y="%d"/><a:ext cx="%d" cy="%d"/></a:xfrm>'
+    '<a:prstGeom prst="rect"><a:avLst/></a:prstGeom><a:noFill/></p:spPr>'
+    '<p:txBody>%s<a:lstStyle/>%s</p:txBody></p:sp>'
+)
+
+_AUTOSHAPE_TMPL = (
+    '<p:sp><p:nvSpPr><p:cNvPr id="%d" name="%s %d"/><p:cNvSpPr/><p:nvPr/></p:nvSpPr>'
+    '<p:spPr><a:xfrm><a:off x="%d" y="%d"/><a:ext cx="%d" cy="%d"/></a:xfrm>'
+    '<a:prstGeom prst="%s"><a:avLst/></a:prstGeom>'
+    '<a:solidFill><a:srgbClr val="%s"/></a:solidFill>%s</p:spPr>'
+    '<p:style><a:lnRef idx="1"><a:schemeClr val="accent1"/></a:lnRef>'
+    '<a:fillRef idx="3"><a:schemeClr val="accent1"/></a:fillRef>'
+    '<a:effectRef idx="2"><a:schemeClr val="accent1"/></a:effectRef>'
+    '<a:fontRef idx="minor"><a:schemeClr val="lt1"/></a:fontRef></p:style>'
+    '<p:txBody><a:bodyPr rtlCol="0" anchor="ctr"/><a:lstStyle/><a:p><a:pPr algn="ctr"/></a:p></p:txBody></p:sp>'
+)
+
+# (preset geometry, shape name) as python-pptx names autoshapes
+_RECTANGLE = ("rect", "Rectangle")
+_ROUNDED_RECTANGLE = ("roundRect", "Rounded Rectangle")
+
+_NO_LINE = "<a:ln><a:noFill/></a:ln>"
+_LIGHT_BORDER = '<a:ln w="%d"><a:solidFill><a:srgbClr val="CCCCCC"/></a:solidFill></a:ln>' % Pt(1)
+
+_BODY_NO_WRAP = '<a:bodyPr wrap="none"><a:spAutoFit/></a:bodyPr>'
+_BODY_WRAP = '<a:bodyPr wrap="square"><a:spAutoFit/></a:bodyPr>'
+_BODY_TOP = '<a:bodyPr wrap="none" anchor="t"><a:spAutoFit/></a:bodyPr>'
+
+
+def _font(size, color, typeface, bold=False, italic=False, tag="a:rPr"):
+    """Return character properties XML (as set through python-pptx's font API)."""
+    attrs = ' sz="%d"' % (size.centipoints if hasattr(size, "centipoints") else size)
+    if bold:
+        attrs += ' b="1"'
+    if italic:
+        attrs += ' i="1"'
+    return '<%s%s><a:solidFill><a:srgbClr val="%s"/></a:solidFill><a:latin typeface="%s"/></%s>' % (
+        tag, attrs, color, typeface, tag
+    )
+
+
+def _paragraph_font(size, color, typeface, italic=False):
+    """Return paragraph properties XML setting the paragraph's default run font."""
+    return "<a:pPr>%s</a:pPr>" % _font(size, color, typeface, italic=italic, tag="a:defRPr")
+
+
+def _paragraphs(text, ppr="", rpr="", every_paragraph=False):
+    """
+    Return paragraph XML for text, split as python-pptx's text_frame.text does.
+
+    Args:
+        text: Text; "\\n" starts a new paragraph, "\\v" a line break
+        ppr: Paragraph properties XML for the first paragraph
+        rpr: Run properties XML for the first run
+        every_paragraph: Apply ppr to every paragraph, not just the first
+
+    Returns:
+        str: Concatenated <a:p> elements
+    """
+    paragraphs = []
+    for index, p_text in enumerate(text.split("\n")):
+        parts = [ppr if index == 0 or every_paragraph else ""]
+        for r_index, r_text in enumerate(_LINE_BREAKS.split(p_text)):
+            if r_index:
+                parts.append("<a:br/>")
+            if r_text:
+                r_text = escape(_CONTROL_CHARS.sub(lambda m: "_x%04X_" % ord(m.group(1)), r_text))
+                parts.append("<a:r>%s<a:t>%s</a:t></a:r>" % (rpr, r_text))
+                rpr = ""
+        paragraphs.append("<a:p>%s</a:p>" % "".join(parts))
+    return "".join(paragraphs)
+
+
+class _ShapeWriter:
+    """Accumulates shape XML for one slide, numbering shapes as python-pptx does."""
+
+    def __init__(self, slide):
+        self.slide = slide
+        self.next_id = slide.shapes._next_shape_id
+        self.parts = []
+
+    def textbox(self, x, y, width, height, paragraphs, body=_BODY_NO_WRAP):
+        shape_id = self._take_id()
+        self.parts.append(_TEXTBOX_TMPL % (shape_id, shape_id - 1, x, y, width, height, body, paragraphs))
+
+    def autoshape(self, geometry, x, y, width, height, fill, line=_NO_LINE):
+        shape_id = self._take_id()
+        prst, name = geometry
+        self.parts.append(_AUTOSHAPE_TMPL % (shape_id, name, shape_id - 1, x, y, width, height, prst, fill, line))
+
+    def _take_id(self):
+        shape_id = self.next_id
+        self.next_id += 1
+        return shape_id
+
+    def flush(self):
+        """Parse the accumulated XML once and append the shapes to the slide."""
+        sp_tree = self.slide.shapes._spTree
+        sp_tree.extend(list(parse_xml(_SHAPES_TMPL % "".join(self.parts))))
+        self.parts = []
+
+
+# Pre-rendered paragraphs for the fixed text on the visual pillars slide
+_PILLARS_TITLE = _paragraphs("BRAND VISUAL PILLARS", rpr=_font(Pt(24), "000000", "Fjalla One", bold=True))
+_PILLARS_LABEL = _paragraphs("[ VISUAL BRAND PILLARS ]", rpr=_font(Pt(10), "666666", "Fjalla One", bold=True))
+_PILLARS_DESC = _paragraphs(
+    "The visual themes and motifs that define the brand's aesthetic direction.",
+    ppr=_paragraph_font(Pt(9), "666666", "Helvetica Neue", italic=True),
+)
+_PILLARS_FOOTER = _paragraphs(
+    "These pillars guide all visual decision-making for the brand identity.",
+    ppr=_paragraph_font(Pt(8), "999999", "Helvetica Neue"),
+)
+_PILLARS_PAGE = _paragraphs("03", ppr='<a:pPr algn="r"/>', rpr=_font(Pt(10), "999999", "Helvetica Neue"))
+_PILLAR_PPR = ('<a:pPr algn="ctr"><a:spcBef><a:spcPts val="0"/></a:spcBef>'
+               '<a:spcAft><a:spcPts val="0"/></a:spcAft></a:pPr>')
+_PILLAR_RPR = _font(Pt(18), "000000", "Fjalla One", bold=True)
+
+# Pre-rendered paragraphs and run properties for the color palette slide
+_PALETTE_TITLE = _paragraphs("BRAND COLOR PALETTE", ppr='<a:pPr algn="ctr"/>',
+                             rpr=_font(Pt(24), "000000", "Fjalla One", bold=True))
+# Text runs per text color (contrast.TEXT_COLORS)
+_PRIMARY_LABEL = {
+    text: _paragraphs("[PRIMARY POP COLOR]", rpr=_font(Pt(20), text.lstrip("#"), "Fjalla One", bold=True))
+    for text in TEXT_COLORS
+}
+_PRIMARY_INFO_RPR = {text: _font(Pt(12), text.lstrip("#"), "Helvetica Neue") for text in TEXT_COLORS}
+_BAR_RPR = {text: _font(Pt(10), text.lstrip("#"), "Helvetica Neue") for text in TEXT_COLORS}
+
+
+def render_visual_pillars_slide(prs, layout, dj_input, visual_pillars):
+    """
+    Create the Brand Visual Pillars slide from XML templates.
+
+    Produces the same slide as pptx_generator.create_visual_pillars_slide.
+
+    Args:
+        prs: Presentation object
+        layout: Blank slide layout
+        dj_input: DJ questionnaire data
+        visual_pillars: List of pillar dicts with "name" key
+    """
+    slide = prs.slides.add_slide(layout)
+    shapes = _ShapeWriter(slide)
+
+    shapes.textbox(Inches(0.5), Inches(0.3), Inches(9), Inches(0.5), _PILLARS_TITLE)
+    shapes.textbox(Inches(0.5), Inches(0.9), Inches(3), Inches(0.3), _PILLARS_LABEL)
+    shapes.textbox(Inches(4.0), Inches(0.9), Inches(5.5), Inches(0.4), _PILLARS_DESC, _BODY_WRAP)
+
+    # 4-quadrant grid layout
+    grid_top = Inches(1.5)
+    grid_left = Inches(0.5)
+    grid_width = Inches(9)
+    grid_height = Inches(3.5)
+    quad_width = grid_width // 2
+    quad_height = grid_height // 2
+    center_x = grid_left + quad_width
+    center_y = grid_top + quad_height
+
+    # Divider lines
+    shapes.autoshape(_RECTANGLE, grid_left, center_y - Pt(0.5), grid_width, Pt(1), "C8C8C8")
+    shapes.autoshape(_RECTANGLE, center_x - Pt(0.5), grid_top, Pt(1), grid_height, "C8C8C8")
+
+    # Vertical centering by top margin, as the object-API slide does
+    pillar_body = '<a:bodyPr wrap="square" tIns="%d" bIns="0" lIns="%d" rIns="%d"><a:spAutoFit/></a:bodyPr>' % (
+        int(quad_height / 2 - Pt(12)), Inches(0.2), Inches(0.2)
+    )
+    positions = [(grid_left, grid_top), (center_x, grid_top), (grid_left, center_y), (center_x, center_y)]
+    for (x, y), pillar in zip(positions, visual_pillars):
+        pillar_name = pillar.get('name', pillar) if isinstance(pillar, dict) else str(pillar)
+        shapes.textbox(x, y, quad_width, quad_height,
+                       _paragraphs(pillar_name.upper(), _PILLAR_PPR, _PILLAR_RPR), pillar_body)
+
+    shapes.textbox(Inches(0.5), Inches(5.2), Inches(7), Inches(0.3), _PILLARS_FOOTER)
+    shapes.textbox(Inches(9.0), Inches(5.2), Inches(0.5), Inches(0.3), _PILLARS_PAGE)
+    shapes.flush()
+
+
+def render_color_palette_slide(prs, layout, dj_input, colors):
+    """
+    Create the Color Palette slide from XML templates.
+
+    Produces the same slide as pptx_generator.create_color_palette_slide.
+
+    Args:
+        prs: Presentation object
+        layout: Blank slide layout
+        dj_input: DJ questionnaire data
+        colors: Dict with "primary" and "palette" keys
+    """
+    slide = prs.slides.add_slide(layout)
+    shapes = _ShapeWriter(slide)
+
+    shapes.textbox(Inches(0.5), Inches(0.35), Inches(8), Inches(0.5), _PALETTE_TITLE)
+
+    # Primary color block with label and hex + CMYK overlay
+    primary_hex = colors['primary']['hex']
+    primary_cmyk = hex_to_cmyk(primary_hex)
+    primary_text = best_text_color(primary_hex)
+    shapes.autoshape(_ROUNDED_RECTANGLE, Inches(0.4), Inches(1.15), Inches(5.2), Inches(2.3),
+                     _hex_value(primary_hex))
+    shapes.textbox(Inches(0.6), Inches(1.45), Inches(4.8), Inches(0.35), _PRIMARY_LABEL[primary_text])
+    cmyk_text = f"{primary_hex} C: {primary_cmyk['c']}% M: {primary_cmyk['m']}% Y:{primary_cmyk['y']}% K:{primary_cmyk['k']}%"
+    shapes.textbox(Inches(0.6), Inches(1.82), Inches(4.8), Inches(0.25),
+                   _paragraphs(cmyk_text, rpr=_PRIMARY_INFO_RPR[primary_text]))
+
+    # Palette colors - stacked rounded rectangles on right
+    bar_width = Inches(3.6)
+    bar_height = Inches(0.42)
+    bar_gap = Inches(0.07)
+    start_x = Inches(6.0)
+    current_y = Inches(1.15)
+
+    for color_item in colors['palette']:
+        color_hex = color_item['hex']
+        cmyk = hex_to_cmyk(color_hex)
+
+        shapes.autoshape(_ROUNDED_RECTANGLE, start_x, current_y, bar_width, bar_height,
+                         _hex_value(color_hex), _LIGHT_BORDER if needs_outline(color_hex) else _NO_LINE)
+
+        bar_text = f"{color_hex} C: {cmyk['c']}% M: {cmyk['m']}% Y:{cmyk['y']}% K:{cmyk['k']}%"
+        shapes.textbox(start_x + Inches(0.12), current_y + Inches(0.08),
+                       bar_width - Inches(0.24), bar_height - Inches(0.16),
+                       _paragraphs(bar_text, rpr=_BAR_RPR[best_text_color(color_hex)]), _BODY_TOP)
+
+        current_y += bar_height + bar_gap
+
+    # Description blurb, shrunk to fit as in create_color_palette_slide
+    description = colors.get('description', '')
+    blurb_ppr = _paragraph_font(Pt(fit_font_size(description, Inches(5.2), Inches(1.35), 8.5, 6.5)),
+                                "000000", "Helvetica Neue")
+    shapes.textbox(Inches(0.4), Inches(3.6), Inches(5.2), Inches(1.35),
+                   _paragraphs(description, blurb_ppr, every_paragraph=True), _BODY_WRAP)
+    shapes.flush()
+
+
+def _hex_value(hex_color):
+    """Return the srgbClr value for a hex color, as python-pptx's RGBColor writes it."""
+    return "%02X%02X%02X" % hex_to_rgb(hex_color)
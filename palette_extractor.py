@@ -0,0 +1,224 @@
+"""
+Palette extraction for DJ Brand Guide Generator.
+Derives a colors dict (primary + palette) directly from moodboard images.
+"""
+
+import colorsys
+
+import numpy as np
+from PIL import Image
+
+from color_utils import rgb_to_hex, rgb_to_lab_array
+
+# Longest edge images are reduced to before sampling; palettes need color, not detail
+SAMPLE_EDGE = 128
+
+# Default number of pixels kept across all images (reservoir sample)
+DEFAULT_SAMPLE_SIZE = 20000
+
+# Clusters below this share of pixels are never chosen as the primary color
+MIN_PRIMARY_WEIGHT = 0.05
+
+KMEANS_ITERATIONS = 20
+
+# Clusters within this Lab distance of pure black/white duplicate the fixed palette entries
+NEUTRAL_DELTA_E = 10.0
+
+# Hue buckets (upper bound in degrees) for generated color names
+HUE_NAMES = [
+    (15, "Red"), (45, "Orange"), (70, "Yellow"), (160, "Green"), (185, "Teal"),
+    (205, "Cyan"), (255, "Blue"), (285, "Purple"), (330, "Magenta"), (345, "Pink"), (360, "Red"),
+]
+
+
+def load_pixels(image_path, edge=SAMPLE_EDGE):
+    """
+    Decode an image at reduced size and return its pixels.
+
+    JPEGs are decoded in draft mode straight at a fraction of full size.
+
+    Args:
+        image_path: Path to the image
+        edge: Longest edge in pixels after downsampling
+
+    Returns:
+        numpy.ndarray: uint8 array of shape (N, 3)
+    """
+    with Image.open(image_path) as img:
+        img.draft("RGB", (edge, edge))
+        img = img.convert("RGB")
+        img.thumbnail((edge, edge), Image.BILINEAR)
+        return np.asarray(img, dtype=np.uint8).reshape(-1, 3)
+
+
+def reservoir_sample(pixel_chunks, sample_size, rng):
+    """
+    Keep a uniform random sample of at most sample_size pixels (Algorithm R).
+
+    Memory stays bounded by sample_size however many pixels stream through.
+
+    Args:
+        pixel_chunks: Iterable of (N, 3) uint8 arrays
+        sample_size: Maximum pixels to keep
+        rng: numpy Generator
+
+    Returns:
+        numpy.ndarray: uint8 array of shape (min(total, sample_size), 3)
+    """
+    reservoir = np.empty((sample_size, 3), dtype=np.uint8)
+    seen = 0
+
+    for chunk in pixel_chunks:
+        # Fill any free slots first
+        fill = min(sample_size - min(seen, sample_size), len(chunk))
+        if fill:
+            reservoir[seen:seen + fill] = chunk[:fill]
+
+        rest = chunk[fill:]
+        if len(rest):
+            # Item with global index i replaces a random slot with probability sample_size / (i + 1)
+            indices = np.arange(seen + fill, seen + len(chunk))
+            slots = (rng.random(len(rest)) * (indices + 1)).astype(np.int64)
+            keep = slots < sample_size
+            reservoir[slots[keep]] = rest[keep]
+
+        seen += len(chunk)
+
+    return reservoir[:min(seen, sample_size)]
+
+
+def kmeans(points, k, rng, iterations=KMEANS_ITERATIONS):
+    """
+    Cluster points with k-means++ initialisation and vectorized Lloyd steps.
+
+    Args:
+        points: float array of shape (N, D)
+        k: Number of clusters (reduced if there are fewer distinct points)
+        rng: numpy Generator
+        iterations: Maximum Lloyd iterations
+
+    Returns:
+        tuple: (centers (k, D), labels (N,))
+    """
+    k = min(k, len(np.unique(points, axis=0)))
+
+    # k-means++ seeding: spread initial centers by squared distance
+    centers = [points[rng.integers(len(points))]]
+    closest = ((points - centers[0]) ** 2).sum(axis=1)
+    for _ in range(1, k):
+        index = rng.choice(len(points), p=closest / closest.sum())
+        centers.append(points[index])
+        closest = np.minimum(closest, ((points - points[index]) ** 2).sum(axis=1))
+    centers = np.array(centers)
+
+    labels = None
+    for _ in range(iterations):
+        distances = ((points[:, None, :] - centers[None, :, :]) ** 2).sum(axis=2)
+        new_labels = distances.argmin(axis=1)
+        if labels is not None and np.array_equal(labels, new_labels):
+            break
+        labels = new_labels
+
+        counts = np.bincount(labels, minlength=k)
+        for dim in range(points.shape[1]):
+            sums = np.bincount(labels, weights=points[:, dim], minlength=k)
+            # Empty clusters keep their previous center
+            centers[:, dim] = np.where(counts > 0, sums / np.maximum(counts, 1), centers[:, dim])
+
+    return centers, labels
+
+
+def color_name(rgb):
+    """Generate a short descriptive name (e.g., "Deep Blue") for an RGB color."""
+    r, g, b = (v / 255.0 for v in rgb)
+    hue, lightness, saturation = colorsys.rgb_to_hls(r, g, b)
+
+    if saturation < 0.15 or lightness < 0.06 or lightness > 0.96:
+        if lightness < 0.12:
+            return "Black"
+        if lightness > 0.9:
+            return "White"
+        return "Charcoal" if lightness < 0.35 else "Gray" if lightness < 0.7 else "Silver"
+
+    degrees = hue * 360
+    base = next(name for bound, name in HUE_NAMES if degrees < bound or bound == 360)
+    if lightness < 0.25:
+        return f"Deep {base}"
+    if lightness < 0.4:
+        return f"Dark {base}"
+    if lightness > 0.75:
+        return f"Pale {base}"
+    if saturation > 0.8 and lightness > 0.45:
+        return f"Electric {base}"
+    return base
+
+
+def extract_palette(image_paths, n_colors=7, sample_size=DEFAULT_SAMPLE_SIZE, seed=0):
+    """
+    Extract a brand palette from moodboard images.
+
+    Images are downsampled, pooled into a bounded reservoir sample and
+    clustered with k-means in CIE Lab. The most chromatic cluster covering
+    at least 5% of the pixels becomes the primary color; the remaining
+    clusters (by coverage) fill the palette, which always ends with black
+    and white as the colors schema requires.
+
+    Args:
+        image_paths: Paths to moodboard images
+        n_colors: Number of palette entries, including black and white (min 3)
+        sample_size: Maximum pixels kept in memory across all images
+        seed: Random seed (results are deterministic for a given seed)
+
+    Returns:
+        dict: {"primary": {"name", "hex"}, "palette": [{"name", "hex"}, ...],
+               "description": ""} in the create_brand_guide colors schema
+
+    Raises:
+        ValueError: If no images are given
+    """
+    if not image_paths:
+        raise ValueError("At least one image is required to extract a palette")
+
+    rng = np.random.default_rng(seed)
+    pixels = reservoir_sample((load_pixels(path) for path in image_paths), sample_size, rng)
+    lab = rgb_to_lab_array(pixels)
+
+    # Primary + palette colors; black/white are added explicitly, so over-cluster by one
+    # to leave room for near-black/near-white clusters that get dropped
+    centers, labels = kmeans(lab, max(n_colors, 2), rng)
+    weights = np.bincount(labels, minlength=len(centers)) / len(labels)
+    chroma = np.hypot(centers[:, 1], centers[:, 2])
+
+    # Report each cluster as the mean sRGB of its members
+    mean_rgb = np.stack([
+        np.bincount(labels, weights=pixels[:, c].astype(np.float64), minlength=len(centers))
+        for c in range(3)
+    ], axis=1) / np.maximum(np.bincount(labels, minlength=len(centers)), 1)[:, None]
+    mean_rgb = np.clip(np.rint(mean_rgb), 0, 255).astype(int)
+
+    eligible = np.where(weights >= MIN_PRIMARY_WEIGHT)[0]
+    primary = int(eligible[chroma[eligible].argmax()]) if len(eligible) else int(weights.argmax())
+
+    def entry(rgb):
+        return {"name": color_name(rgb), "hex": rgb_to_hex(*(int(v) for v in rgb))}
+
+    near_black = np.linalg.norm(centers - [0, 0, 0], axis=1) < NEUTRAL_DELTA_E
+    near_white = np.linalg.norm(centers - [100, 0, 0], axis=1) < NEUTRAL_DELTA_E
+
+    palette = []
+    seen_hex = {"#000000", "#FFFFFF"}
+    for index in np.argsort(-weights, kind="stable"):
+        if index == primary or near_black[index] or near_white[index]:
+            continue
+        item = entry(mean_rgb[index])
+        if item["hex"] not in seen_hex:
+            seen_hex.add(item["hex"])
+            palette.append(item)
+    palette = palette[:max(n_colors - 2, 0)]
+    palette += [{"name": "Black", "hex": "#000000"}, {"name": "White", "hex": "#FFFFFF"}]
+
+    return {
+        "primary": entry(mean_rgb[primary]),
+        "palette": palette,
+        "description": "",
+    }
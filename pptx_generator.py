@@ -1,62 +1,330 @@
 """
 PowerPoint generation for DJ Brand Guide Generator.
 Creates professional 2-slide presentations using python-pptx.
+
+python-pptx (and Pillow, through it) is imported inside the functions that
+build decks, so importing this module, color_utils or narrative_generator
+stays cheap for callers that never render a slide.
 """
 
-from pptx import Presentation
-from pptx.util import Inches, Pt
-from pptx.enum.shapes import MSO_SHAPE
-from pptx.dml.color import RGBColor
-from pptx.enum.text import PP_ALIGN
+from contextlib import nullcontext
+from functools import lru_cache
+import copy
+import io
+import logging
 import os
-import glob
+import shutil
+import threading
+import zipfile
+
+from asset_resolver import get_resolver
+from deck_cache import content_key, file_digest
+from color_utils import hex_to_cmyk, hex_to_rgb
+from contrast import best_text_color, needs_outline
+from image_pipeline import DEFAULT_DPI, image_size
+from instrumentation import is_tracing, trace, use_tracer
+from moodboard_layout import DEFAULT_GRID, LABEL_HEIGHT, LABEL_SPACING, layout_moodboard
+from text_metrics import fit_font_size
 
-from color_utils import hex_to_cmyk, hex_to_rgb, is_light_color
-from narrative_generator import generate_brand_narrative
+logger = logging.getLogger(__name__)
 
 
-def find_uploaded_images() -> list:
+def find_uploaded_images(upload_roots=None) -> list:
     """
     Find images uploaded to the sandbox filesystem via container_upload.
 
     Files uploaded via container_upload are placed in the sandbox's filesystem.
-    This function searches common locations to find them.
+    The upload roots are indexed once per process and re-scanned only when
+    a directory changes (see asset_resolver.AssetResolver).
+
+    Args:
+        upload_roots: Optional directories to search (default: sandbox upload locations)
 
     Returns:
         List of paths to found image files, sorted alphabetically for consistent ordering
     """
-    # Search patterns for uploaded images in the sandbox
-    patterns = [
-        "/mnt/user/uploads/*.png",
-        "/mnt/user/uploads/*.jpg",
-        "/mnt/user/uploads/*.jpeg",
-        "/mnt/user/*.png",
-        "/mnt/user/*.jpg",
-        "/mnt/user/*.jpeg",
-        "/uploads/*.png",
-        "/uploads/*.jpg",
-        "*.png",
-        "*.jpg",
-        "*.jpeg",
-    ]
+    unique_images = get_resolver(upload_roots).images()
 
-    images = []
-    for pattern in patterns:
-        found = glob.glob(pattern)
-        images.extend(found)
+    logger.debug("Found %d uploaded images: %s", len(unique_images), unique_images)
 
-    # Remove duplicates and sort for consistent ordering
-    unique_images = sorted(set(images))
+    return unique_images
 
-    # Debug: print what we found
-    print(f"[DEBUG] Found {len(unique_images)} uploaded images:")
-    for img in unique_images:
-        print(f"  - {img}")
 
-    return unique_images
+# Slide dimensions for all decks (16:9)
+SLIDE_WIDTH = 9144000  # 10 in (EMU)
+SLIDE_HEIGHT = 5143500  # 5.625 in (EMU)
+
+# Pre-sized base presentations, keyed by (template path, mtime); None is the python-pptx default.
+# Each entry is (shared base, private pristine copy, blank layout index)
+_base_templates = {}
+
+# lxml trees are copied one at a time
+_clone_lock = threading.Lock()
+
+
+def _load_base(template_path=None):
+    """Return the cached (base, pristine copy, blank layout index) for a template."""
+    key = (os.path.abspath(template_path), os.path.getmtime(template_path)) if template_path else None
+    cached = _base_templates.get(key)
+    if cached is None:
+        from pptx import Presentation
+
+        base = Presentation(template_path)
+        base.slide_width = SLIDE_WIDTH
+        base.slide_height = SLIDE_HEIGHT
+
+        sld_id_lst = base._element.sldIdLst
+        if sld_id_lst is not None:
+            for sld_id in list(sld_id_lst):
+                base.part.drop_rel(sld_id.rId)
+                sld_id_lst.remove(sld_id)
+
+        # Reopened from its saved package and never read, so none of python-pptx's
+        # cached collections exist on it (see new_presentation)
+        blob = io.BytesIO()
+        base.save(blob)
+        blob.seek(0)
+        pristine = Presentation(blob)
+
+        blank_index = list(base.slide_layouts).index(_find_blank_layout(base))
+        cached = _base_templates[key] = (base, pristine, blank_index)
+    return cached
+
+
+def load_base_template(template_path=None):
+    """
+    Load and pre-size a base presentation once per process.
+
+    The template package is parsed the first time it is requested and held
+    for the lifetime of the process. A custom template is reloaded if its
+    file changes on disk. Any slides in a custom template are removed so
+    only its masters, layouts and theme are reused.
+
+    Args:
+        template_path: Optional path to a branded .pptx template
+
+    Returns:
+        Presentation: Shared base presentation (do not modify; use new_presentation)
+    """
+    return _load_base(template_path)[0]
+
+
+def new_presentation(template_path=None):
+    """
+    Create a presentation for one deck by cloning the cached base template.
+
+    Decks are deep copies of a private copy of the base template that is
+    never read. Copying a presentation that has been used is unsafe:
+    python-pptx caches objects that hold XML sub-elements (slide lists,
+    masters, layouts), and copies of those are detached from the copied
+    tree. The private copy holds only package-level state, which copies
+    consistently, so a clone costs about a quarter of parsing the package.
+
+    Args:
+        template_path: Optional path to a branded .pptx template
+
+    Returns:
+        tuple: (Presentation, blank slide layout)
+    """
+    _, pristine, blank_index = _load_base(template_path)
+    with _clone_lock:
+        prs = copy.deepcopy(pristine)
+    return prs, prs.slide_layouts[blank_index]
+
+
+def _find_blank_layout(prs):
+    """Return the layout named "Blank", falling back to the default template's index 6."""
+    for layout in prs.slide_layouts:
+        if layout.name == "Blank":
+            return layout
+    return prs.slide_layouts[6]
+
+
+# Timestamp stamped on every zip entry so identical decks are byte-identical
+ZIP_TIMESTAMP = (1980, 1, 1, 0, 0, 0)
+
+
+class _StableZipWriter:
+    """Zip writer for PackageWriter that stamps entries with ZIP_TIMESTAMP instead of the time of saving."""
+
+    def __init__(self, pkg_file):
+        self._zipf = zipfile.ZipFile(pkg_file, "w", compression=zipfile.ZIP_DEFLATED)
+
+    def __enter__(self):
+        return self
+
+    def __exit__(self, *exc):
+        self._zipf.close()
+
+    def _info(self, pack_uri):
+        info = zipfile.ZipInfo(pack_uri.membername, date_time=ZIP_TIMESTAMP)
+        info.compress_type = zipfile.ZIP_DEFLATED
+        info.external_attr = 0o600 << 16
+        return info
+
+    def write(self, pack_uri, blob):
+        self._zipf.writestr(self._info(pack_uri), blob)
+
+    def write_part(self, part):
+        """Write a part, streaming it into the zip if it can copy itself (see media_cache.FileImagePart)."""
+        write_to = getattr(part, "write_to", None)
+        if write_to is None:
+            self.write(part.partname, part.blob)
+        else:
+            with self._zipf.open(self._info(part.partname), "w") as entry:
+                write_to(entry)
+
+
+@lru_cache(maxsize=None)
+def _stable_package_writer():
+    """Return python-pptx's package writer class, subclassed to write parts through _StableZipWriter.write_part."""
+    from pptx.opc.serialized import PackageWriter
+
+    class _StablePackageWriter(PackageWriter):
+        def _write(self):
+            with _StableZipWriter(self._pkg_file) as phys_writer:
+                self._write_content_types_stream(phys_writer)
+                self._write_pkg_rels(phys_writer)
+                self._write_parts(phys_writer)
+
+        def _write_parts(self, phys_writer):
+            for part in self._parts:
+                phys_writer.write_part(part)
+                if part._rels:
+                    phys_writer.write(part.partname.rels_uri, part.rels.xml)
+
+    return _StablePackageWriter
+
+
+def save_presentation(prs, output_path):
+    """
+    Save a presentation deterministically.
+
+    Parts are written in python-pptx's relationship-walk order with stable
+    part names; only the zip entry timestamps differ from prs.save(), so the
+    same inputs always produce the same bytes.
+
+    Args:
+        prs: Presentation object
+        output_path: File path or writable binary stream
+    """
+    package = prs.part.package
+    _stable_package_writer().write(output_path, package._rels, tuple(package.iter_parts()))
+
+
+# Deck sections in slide order; each slide is named "<section> <input hash>"
+SLIDE_SECTIONS = ("visual_pillars", "moodboard", "color_palette")
+
+
+def slide_keys(dj_input, image_prompts, colors, visual_pillars=None, image_paths=(), template_path=None,
+               image_dpi=DEFAULT_DPI, image_fit="contain", moodboard_grid=DEFAULT_GRID, image_max_bytes=None):
+    """
+    Hash the inputs of each slide separately.
+
+    A slide's key changes only when something that slide renders changes,
+    e.g. editing colors changes the color_palette key alone, while replacing
+    an image file (even under the same name) changes the moodboard key.
+
+    Args:
+        dj_input, image_prompts, colors, visual_pillars: As for create_brand_guide
+        image_paths: Resolved image path (or None) for each prompt
+        template_path: Optional template .pptx (a change invalidates every slide)
+        image_dpi, image_fit, moodboard_grid, image_max_bytes: Moodboard options
+
+    Returns:
+        dict: Section name -> hex key, for the sections the deck contains
+    """
+    template = file_digest(template_path) if template_path else None
+    keys = {}
+    if visual_pillars:
+        keys["visual_pillars"] = content_key({"template": template, "visual_pillars": visual_pillars})
+    keys["moodboard"] = content_key({
+        "template": template,
+        "dj_input": dj_input,
+        "image_prompts": image_prompts,
+        "images": [file_digest(path) if path else None for path in image_paths],
+        "image_dpi": image_dpi,
+        "image_fit": image_fit,
+        "grid": list(moodboard_grid),
+        "image_max_bytes": image_max_bytes,
+    })
+    keys["color_palette"] = content_key({"template": template, "colors": colors})
+    return keys
+
+
+def reuse_slides(previous_deck, keys, template_path=None):
+    """
+    Open a previously generated deck, keeping only slides whose inputs are unchanged.
+
+    Slides whose name no longer matches their section's key are removed
+    (their images are dropped with them); a section spanning several slides,
+    like a long moodboard, is kept or removed as a whole. If nothing can be reused, a fresh
+    presentation is returned instead.
+
+    Args:
+        previous_deck: Path, binary stream or bytes of a deck from create_brand_guide
+        keys: Section keys for the new deck (from slide_keys)
+        template_path: Template for the fresh presentation when nothing is reused
+
+    Returns:
+        tuple: (Presentation, blank slide layout, set of reused section names)
+    """
+    if isinstance(previous_deck, (bytes, bytearray)):
+        previous_deck = io.BytesIO(previous_deck)
+    from pptx import Presentation
+
+    prs = Presentation(previous_deck)
+
+    wanted = {f"{section} {key}" for section, key in keys.items()}
+    reused = set()
+    sld_id_lst = prs._element.sldIdLst
+    for sld_id in list(sld_id_lst if sld_id_lst is not None else ()):
+        name = prs.part.related_slide(sld_id.rId).name
+        if name in wanted:
+            reused.add(name.split(" ")[0])
+        else:
+            prs.part.drop_rel(sld_id.rId)
+            sld_id_lst.remove(sld_id)
+
+    if not reused:
+        return (*new_presentation(template_path), reused)
 
+    # New slides are named by slide count, so close any gaps left by removed slides
+    _renumber_slides(prs)
+    return prs, _find_blank_layout(prs), reused
 
-def create_brand_guide(dj_input, image_prompts, colors, output_path="brand_guide.pptx", visual_pillars=None):
+
+def _name_last_slides(prs, section, keys, count=1):
+    """Record the section and input key of the last `count` (newly built) slides as their slide names."""
+    slides = prs.slides
+    for index in range(len(slides) - count, len(slides)):
+        slides[index].name = f"{section} {keys[section]}"
+
+
+def _order_slides(prs):
+    """Put slides in SLIDE_SECTIONS order and renumber their parts to match."""
+    rank = {section: index for index, section in enumerate(SLIDE_SECTIONS)}
+    sld_id_lst = prs._element.sldIdLst
+    sld_ids = sorted(sld_id_lst, key=lambda sld_id: rank.get(
+        prs.part.related_slide(sld_id.rId).name.split(" ")[0], len(rank)
+    ))
+    for sld_id in sld_ids:
+        sld_id_lst.append(sld_id)
+    _renumber_slides(prs)
+
+
+def _renumber_slides(prs):
+    """Name slide parts slide1.xml, slide2.xml, ... in presentation order."""
+    from pptx.opc.packuri import PackURI
+
+    for number, slide in enumerate(prs.slides, 1):
+        slide.part.partname = PackURI(f"/ppt/slides/slide{number}.xml")
+
+
+def create_brand_guide(dj_input, image_prompts, colors, output_path="brand_guide.pptx", visual_pillars=None,
+                       template_path=None, image_dpi=DEFAULT_DPI, upload_roots=None, image_fit="contain",
+                       tracer=None, renderer="pptx", cache=None, previous_deck=None, moodboard_grid=DEFAULT_GRID,
+                       image_max_bytes=None, image_cache_dir=None):
     """
     Create a complete 3-slide DJ brand guide PowerPoint.
 
@@ -64,176 +332,364 @@ def create_brand_guide(dj_input, image_prompts, colors, output_path="brand_guide
         dj_input: Dict containing DJ questionnaire data
         image_prompts: List of dicts with "label", "prompt", and "file_id" keys
         colors: Dict with "primary" and "palette" keys
-        output_path: Output file path (default: "brand_guide.pptx")
+        output_path: Output file path or writable binary stream (default: "brand_guide.pptx")
         visual_pillars: Optional list of pillar dicts with "name" key for Slide 03
+        template_path: Optional branded .pptx whose masters/layouts are reused
+        image_dpi: Resolution images are resampled to for their placed box
+            (None embeds the original files)
+        upload_roots: Optional directories to resolve uploaded images from
+        image_fit: "contain" fits whole images in their boxes, "cover" centre-crops to fill them
+        tracer: Optional instrumentation.Tracer that records a span per stage
+        renderer: "pptx" builds the fixed-layout slides through the python-pptx object API,
+            "ooxml" fills pre-compiled XML templates instead (same output, several times faster)
+        cache: Optional deck_cache.DeckCache; a request whose inputs and images are
+            unchanged is served by copying the cached deck
+        previous_deck: Optional path, stream or bytes of an earlier deck from this function;
+            its slides whose inputs are unchanged are reused and only the others are rebuilt
+        moodboard_grid: (columns, rows) of images per moodboard slide; longer prompt
+            lists continue on further moodboard slides
+        image_max_bytes: Optional size budget per resampled image; JPEG quality
+            steps down to meet it
+        image_cache_dir: Optional directory that keeps resampled images across processes
 
     Returns:
-        str: Path to the created PowerPoint file
+        str: Path to the created PowerPoint file (or the stream it was written to)
+
+    Raises:
+        ValueError: If renderer is not "pptx" or "ooxml", image_fit is not "contain" or "cover",
+            or moodboard_grid is too dense
     """
-    # Create presentation
-    prs = Presentation()
-    prs.slide_width = Inches(10)
-    prs.slide_height = Inches(5.625)  # 16:9 aspect ratio
+    if renderer not in RENDERERS:
+        raise ValueError(f"Unknown renderer {renderer!r}; expected one of {sorted(RENDERERS)}")
+    _check_image_fit(image_fit)
+    pillars_builder, palette_builder = _slide_builders(renderer)
+
+    with use_tracer(tracer) if tracer is not None else nullcontext(), trace("create_brand_guide"):
+        image_paths = get_resolver(upload_roots).resolve_prompts(image_prompts)
+
+        if cache is not None:
+            with trace("cache_lookup") as span:
+                cache_key = cache.key(
+                    dj_input, image_prompts, colors, visual_pillars, image_paths=image_paths,
+                    template_path=template_path, image_dpi=image_dpi, image_fit=image_fit, renderer=renderer,
+                    moodboard_grid=list(moodboard_grid), image_max_bytes=image_max_bytes,
+                )
+                cached_path = cache.lookup(cache_key)
+                span.set(hit=cached_path is not None)
+
+            if cached_path is not None:
+                try:
+                    cached_file = open(cached_path, "rb")
+                except FileNotFoundError:
+                    # Evicted by another process since the lookup: build the deck instead
+                    cached_file = None
+                if cached_file is not None:
+                    with cached_file, trace("save") as span:
+                        span.bytes = _copy_file(cached_file, output_path)
+                    return output_path
+
+        keys = slide_keys(dj_input, image_prompts, colors, visual_pillars, image_paths=image_paths,
+                          template_path=template_path, image_dpi=image_dpi, image_fit=image_fit,
+                          moodboard_grid=moodboard_grid, image_max_bytes=image_max_bytes)
+
+        if previous_deck is not None:
+            # Start from the previous deck, keeping the slides whose inputs are unchanged
+            with trace("reuse_slides") as span:
+                prs, blank_layout, reused = reuse_slides(previous_deck, keys, template_path)
+                span.set(reused=sorted(reused))
+        else:
+            # Clone the pre-sized 16:9 base template (parsed once per process)
+            with trace("new_presentation"):
+                prs, blank_layout = new_presentation(template_path)
+            reused = set()
+
+        # Slide 1: Brand Visual Pillars (if provided)
+        if visual_pillars and "visual_pillars" not in reused:
+            with trace("create_visual_pillars_slide"):
+                pillars_builder(prs, blank_layout, dj_input, visual_pillars)
+                _name_last_slides(prs, "visual_pillars", keys)
+
+        # Slide 2: Brand Moodboard
+        if "moodboard" not in reused:
+            with trace("create_moodboard_slide", prompts=len(image_prompts)):
+                moodboard_slides = create_moodboard_slide(
+                    prs, blank_layout, dj_input, image_prompts, image_dpi=image_dpi,
+                    upload_roots=upload_roots, image_fit=image_fit, grid=moodboard_grid,
+                    image_paths=image_paths, image_max_bytes=image_max_bytes, image_cache_dir=image_cache_dir,
+                )
+                _name_last_slides(prs, "moodboard", keys, count=len(moodboard_slides))
+
+        # Slide 3: Color Palette
+        if "color_palette" not in reused:
+            with trace("create_color_palette_slide", colors=len(colors['palette'])):
+                palette_builder(prs, blank_layout, dj_input, colors)
+                _name_last_slides(prs, "color_palette", keys)
+
+        if reused:
+            _order_slides(prs)
+
+        # Save presentation (to a path or any writable binary stream)
+        with trace("save") as span:
+            if cache is not None:
+                buffer = io.BytesIO()
+                save_presentation(prs, buffer)
+                cache.store(cache_key, buffer.getvalue())
+                if hasattr(output_path, "write"):
+                    output_path.write(buffer.getvalue())
+                else:
+                    with open(output_path, "wb") as f:
+                        f.write(buffer.getvalue())
+            else:
+                save_presentation(prs, output_path)
+            if is_tracing():
+                span.bytes = output_path.tell() if hasattr(output_path, "tell") else os.path.getsize(output_path)
 
-    # Get blank slide layout
-    blank_layout = prs.slide_layouts[6]  # Blank layout
+    return output_path
 
-    # Slide 1: Brand Visual Pillars (if provided)
-    if visual_pillars:
-        create_visual_pillars_slide(prs, blank_layout, dj_input, visual_pillars)
 
-    # Slide 2: Brand Moodboard
-    create_moodboard_slide(prs, blank_layout, dj_input, image_prompts)
+def _copy_file(source, output_path):
+    """Copy an open binary file to a path or writable binary stream; returns the bytes copied."""
+    if hasattr(output_path, "write"):
+        shutil.copyfileobj(source, output_path)
+    else:
+        with open(output_path, "wb") as f:
+            shutil.copyfileobj(source, f)
+    return os.fstat(source.fileno()).st_size
 
-    # Slide 3: Color Palette
-    create_color_palette_slide(prs, blank_layout, dj_input, colors)
 
-    # Save presentation
-    prs.save(output_path)
-    return output_path
+def create_brand_guide_bytes(dj_input, image_prompts, colors, visual_pillars=None, **options):
+    """
+    Create a brand guide entirely in memory.
+
+    Use this to send a deck straight into an HTTP response or object-store
+    upload without writing a temporary file.
+
+    Args:
+        dj_input, image_prompts, colors, visual_pillars: As for create_brand_guide
+        **options: Any other create_brand_guide keyword arguments
+
+    Returns:
+        bytes: The .pptx file contents
+    """
+    buffer = io.BytesIO()
+    create_brand_guide(dj_input, image_prompts, colors, buffer, visual_pillars=visual_pillars, **options)
+    return buffer.getvalue()
 
 
-def create_moodboard_slide(prs, layout, dj_input, image_prompts):
+def create_moodboard_slide(prs, layout, dj_input, image_prompts, image_dpi=DEFAULT_DPI, upload_roots=None,
+                           image_fit="contain", grid=DEFAULT_GRID, image_paths=None, image_max_bytes=None,
+                           image_cache_dir=None):
     """
-    Create Slide 1: Brand Moodboard with 2x2 image grid and narrative.
+    Create the Brand Moodboard: image grid plus brand narrative.
+
+    Prompts flow across as many slides as needed (see moodboard_layout);
+    the default 2x2 grid puts up to four prompts on one slide beside the
+    narrative, and every further four on a continuation slide.
 
     Args:
         prs: Presentation object
         layout: Blank slide layout
         dj_input: DJ questionnaire data
         image_prompts: List of image prompt dicts with label and prompt
+        image_dpi: Resolution images are resampled to (None embeds originals)
+        upload_roots: Optional directories to resolve uploaded images from
+        image_fit: "contain" (letterbox) or "cover" (centre-crop) for each image
+        grid: (columns, rows) of images per slide
+        image_paths: Image path (or None) already resolved for each prompt;
+            resolved from upload_roots when omitted
+        image_max_bytes: Optional size budget per resampled image
+        image_cache_dir: Optional directory for persistent resampled images
+
+    Returns:
+        list: The moodboard slides, in order
     """
-    slide = prs.slides.add_slide(layout)
+    from pptx.dml.color import RGBColor
+    from pptx.util import Inches, Pt
+
+    from narrative_generator import generate_brand_narrative
+
+    # Lay out every page before building any of them
+    pages = layout_moodboard(len(image_prompts), grid)
+
+    # Match uploaded images to prompts by file_id/filename
+    with trace("asset_discovery") as span:
+        if image_paths is None:
+            image_paths = get_resolver(upload_roots).resolve_prompts(image_prompts)
+        resolved_images = list(image_paths)
+        span.set(resolved=sum(1 for p in resolved_images if p))
+
+    title = f"{dj_input['dj_name'].upper()} - OVERALL BRAND MOODBOARD"
+    slides = []
+    for page_number, page in enumerate(pages, 1):
+        slide = prs.slides.add_slide(layout)
+        slides.append(slide)
+
+        # Title (numbered when the moodboard spans several slides)
+        title_box = slide.shapes.add_textbox(
+            Inches(0.5), Inches(0.3), Inches(9), Inches(0.5)
+        )
+        title_frame = title_box.text_frame
+        title_frame.text = title if len(pages) == 1 else f"{title} ({page_number}/{len(pages)})"
+        title_paragraph = title_frame.paragraphs[0]
+        title_run = title_paragraph.runs[0]
+        title_run.font.name = "Fjalla One"
+        title_run.font.size = Pt(24)
+        title_run.font.bold = True
+        title_run.font.color.rgb = RGBColor(0, 0, 0)
+
+        for i, x, y, cell_width, cell_height in page["cells"]:
+            prompt = image_prompts[i]
+
+            # Add label
+            label_box = slide.shapes.add_textbox(x, y, cell_width, LABEL_HEIGHT)
+            label_frame = label_box.text_frame
+            label_frame.text = f"[{prompt['label']}]"
+            label_para = label_frame.paragraphs[0]
+            label_run = label_para.runs[0]
+            label_run.font.name = "Fjalla One"
+            label_run.font.size = Pt(10)
+            label_run.font.bold = True
+            label_run.font.color.rgb = RGBColor(102, 102, 102)
+
+            # Add image or text fallback
+            content_y = y + LABEL_SPACING
+            content_height = cell_height - LABEL_SPACING
+
+            # Use the uploaded (or local, for testing) image resolved for this prompt
+            image_path = resolved_images[i]
+            if image_path:
+                logger.debug("Using image for prompt %d: %s", i, image_path)
+                try:
+                    add_image_with_aspect_ratio(
+                        slide, image_path, x, content_y, cell_width, content_height,
+                        dpi=image_dpi, fit=image_fit, max_bytes=image_max_bytes, cache_dir=image_cache_dir
+                    )
+                except Exception as e:
+                    logger.error("Failed to add image %s: %s", image_path, e)
+                    add_text_fallback(slide, prompt['prompt'], x, content_y, cell_width, content_height)
+            else:
+                # No image available - show text prompt
+                logger.debug("No image found for prompt %d, using text fallback", i)
+                add_text_fallback(slide, prompt['prompt'], x, content_y, cell_width, content_height)
+
+        if page["narrative"] is None:
+            continue
+
+        # Brand narrative column (first slide only)
+        narrative_x, narrative_y, narrative_width, narrative_height = page["narrative"]
+        narrative = generate_brand_narrative(dj_input)
+
+        # Narrative title
+        narrative_title_box = slide.shapes.add_textbox(
+            narrative_x, narrative_y, narrative_width, Inches(0.25)
+        )
+        narrative_title_frame = narrative_title_box.text_frame
+        narrative_title_frame.text = "BRAND NARRATIVE"
+        narrative_title_para = narrative_title_frame.paragraphs[0]
+        narrative_title_run = narrative_title_para.runs[0]
+        narrative_title_run.font.name = "Fjalla One"
+        narrative_title_run.font.size = Pt(12)
+        narrative_title_run.font.bold = True
+        narrative_title_run.font.color.rgb = RGBColor(0, 0, 0)
+
+        # Narrative text (shrunk from 10pt if it would overflow its column)
+        narrative_text_height = narrative_height - Inches(0.3)
+        narrative_size = fit_font_size(narrative, narrative_width, narrative_text_height, 10, 7)
+        narrative_text_box = slide.shapes.add_textbox(
+            narrative_x, narrative_y + Inches(0.3), narrative_width, narrative_text_height
+        )
+        narrative_text_frame = narrative_text_box.text_frame
+        narrative_text_frame.text = narrative
+        narrative_text_frame.word_wrap = True
+        for paragraph in narrative_text_frame.paragraphs:
+            paragraph.font.name = "Helvetica Neue"
+            paragraph.font.size = Pt(narrative_size)
+            paragraph.font.color.rgb = RGBColor(51, 51, 51)
 
-    # Find uploaded images from the sandbox filesystem
-    uploaded_images = find_uploaded_images()
-    print(f"[DEBUG] Found {len(uploaded_images)} images for {len(image_prompts)} prompts")
+    return slides
 
-    # Title
-    dj_name = dj_input['dj_name']
-    title_box = slide.shapes.add_textbox(
-        Inches(0.5), Inches(0.3), Inches(9), Inches(0.5)
-    )
-    title_frame = title_box.text_frame
-    title_frame.text = f"{dj_name.upper()} - OVERALL BRAND MOODBOARD"
-    title_paragraph = title_frame.paragraphs[0]
-    title_run = title_paragraph.runs[0]
-    title_run.font.name = "Fjalla One"
-    title_run.font.size = Pt(24)
-    title_run.font.bold = True
-    title_run.font.color.rgb = RGBColor(0, 0, 0)
 
-    # Image/prompt boxes - 2-column grid layout
-    box_width = Inches(4.25)
-    box_height = Inches(2.0)
-    start_y = Inches(1.0)
-    left_x = Inches(0.5)
-    right_x = Inches(5.25)
-    gap = Inches(0.3)
-
-    # Loop through all prompts dynamically (supports arbitrary number)
-    for i, prompt in enumerate(image_prompts):
-        row = i // 2
-        col = i % 2
-        x = left_x if col == 0 else right_x
-        y = start_y + row * (box_height + gap)
-
-        # Add label
-        label_box = slide.shapes.add_textbox(x, y, box_width, Inches(0.3))
-        label_frame = label_box.text_frame
-        label_frame.text = f"[{prompt['label']}]"
-        label_para = label_frame.paragraphs[0]
-        label_run = label_para.runs[0]
-        label_run.font.name = "Fjalla One"
-        label_run.font.size = Pt(10)
-        label_run.font.bold = True
-        label_run.font.color.rgb = RGBColor(102, 102, 102)
-
-        # Add image or text fallback
-        content_y = y + Inches(0.35)
-        content_height = box_height - Inches(0.35)
-
-        # Try to use uploaded image from sandbox filesystem
-        # Images are added in order via container_upload, so index should match
-        if i < len(uploaded_images):
-            image_path = uploaded_images[i]
-            print(f"[DEBUG] Using uploaded image for prompt {i}: {image_path}")
-            try:
-                add_image_with_aspect_ratio(
-                    slide, image_path, x, content_y, box_width, content_height
-                )
-            except Exception as e:
-                print(f"[ERROR] Failed to add image {image_path}: {e}")
-                add_text_fallback(slide, prompt['prompt'], x, content_y, box_width, content_height)
-        elif 'path' in prompt and os.path.exists(prompt.get('path', '')):
-            # Local file path fallback (for testing)
-            add_image_with_aspect_ratio(
-                slide, prompt['path'], x, content_y, box_width, content_height
-            )
-        else:
-            # No image available - show text prompt
-            print(f"[DEBUG] No image found for prompt {i}, using text fallback")
-            add_text_fallback(slide, prompt['prompt'], x, content_y, box_width, content_height)
-
-    # Brand narrative paragraph (positioned below the last row)
-    num_rows = (len(image_prompts) + 1) // 2  # Ceiling division
-    last_row_y = start_y + (num_rows - 1) * (box_height + gap)
-    narrative_y = last_row_y + box_height + gap + Inches(0.3)
-    narrative = generate_brand_narrative(dj_input)
-
-    # Narrative title
-    narrative_title_box = slide.shapes.add_textbox(
-        right_x, narrative_y, box_width, Inches(0.25)
-    )
-    narrative_title_frame = narrative_title_box.text_frame
-    narrative_title_frame.text = "BRAND NARRATIVE"
-    narrative_title_para = narrative_title_frame.paragraphs[0]
-    narrative_title_run = narrative_title_para.runs[0]
-    narrative_title_run.font.name = "Fjalla One"
-    narrative_title_run.font.size = Pt(12)
-    narrative_title_run.font.bold = True
-    narrative_title_run.font.color.rgb = RGBColor(0, 0, 0)
-
-    # Narrative text
-    narrative_text_box = slide.shapes.add_textbox(
-        right_x, narrative_y + Inches(0.3), box_width, Inches(1.2)
-    )
-    narrative_text_frame = narrative_text_box.text_frame
-    narrative_text_frame.text = narrative
-    narrative_text_frame.word_wrap = True
-    for paragraph in narrative_text_frame.paragraphs:
-        paragraph.font.name = "Helvetica Neue"
-        paragraph.font.size = Pt(10)
-        paragraph.font.color.rgb = RGBColor(51, 51, 51)
+# How moodboard images fill their boxes (see add_image_with_aspect_ratio)
+IMAGE_FITS = ("contain", "cover")
 
 
-def add_image_with_aspect_ratio(slide, image_path, x, y, box_width, box_height):
+def _check_image_fit(fit):
+    """Raise ValueError for an unknown image fit mode."""
+    if fit not in IMAGE_FITS:
+        raise ValueError(f"Unknown image_fit {fit!r}; expected one of {sorted(IMAGE_FITS)}")
+
+
+def add_image_with_aspect_ratio(slide, image_path, x, y, box_width, box_height, dpi=DEFAULT_DPI, fit="contain",
+                                max_bytes=None, cache_dir=None):
     """
-    Add image to slide with 16:9 aspect ratio preservation and centering.
+    Add image to slide with aspect ratio preservation and centering.
+
+    The image's real aspect ratio is read from its file header. With
+    fit="contain" the whole image is fitted inside the box and centered;
+    with fit="cover" it fills the box and the overflow is centre-cropped.
+    The image is resampled to the placed size at `dpi` before embedding,
+    so large renders do not bloat the deck.
 
     Args:
         slide: Slide object
         image_path: Path to image file
         x, y: Top-left position
         box_width, box_height: Available space dimensions
+        dpi: Target resolution (None embeds the original file)
+        fit: "contain" (letterbox) or "cover" (centre-crop)
+        max_bytes: Optional size budget for the resampled image
+        cache_dir: Optional directory for persistent resampled images
+
+    Raises:
+        ValueError: If fit is not "contain" or "cover"
     """
-    image_aspect = 16 / 9
+    from media_cache import add_picture, get_image, payload_bytes
+
+    _check_image_fit(fit)
+
+    px_w, px_h = image_size(image_path)
+    image_aspect = px_w / px_h
     box_aspect = box_width / box_height
 
+    if fit == "cover":
+        # Fill the box; crop the overflowing dimension equally on both sides
+        if box_aspect > image_aspect:
+            img_w = box_width
+            img_h = img_w / image_aspect
+        else:
+            img_h = box_height
+            img_w = img_h * image_aspect
+        crop_x = (1 - box_width / img_w) / 2
+        crop_y = (1 - box_height / img_h) / 2
+
+        with trace("embed_image") as span:
+            image = get_image(image_path, img_w, img_h, dpi, max_bytes, cache_dir)
+            picture = add_picture(slide, image, x, y, box_width, box_height)
+            if is_tracing():
+                span.bytes = payload_bytes(image)
+        picture.crop_left = picture.crop_right = crop_x
+        picture.crop_top = picture.crop_bottom = crop_y
+        return picture
+
     if box_aspect > image_aspect:
-        # Box is wider than 16:9 - fit to height
+        # Box is wider than the image - fit to height
         img_h = box_height
         img_w = img_h * image_aspect
         img_x = x + (box_width - img_w) / 2  # Center horizontally
         img_y = y
     else:
-        # Box is taller than 16:9 - fit to width
+        # Box is taller than the image - fit to width
         img_w = box_width
         img_h = img_w / image_aspect
         img_x = x
         img_y = y + (box_height - img_h) / 2  # Center vertically
 
-    slide.shapes.add_picture(image_path, img_x, img_y, img_w, img_h)
+    with trace("embed_image") as span:
+        image = get_image(image_path, img_w, img_h, dpi, max_bytes, cache_dir)
+        picture = add_picture(slide, image, img_x, img_y, img_w, img_h)
+        if is_tracing():
+            span.bytes = payload_bytes(image)
+    return picture
 
 
 def add_text_fallback(slide, text, x, y, width, height):
@@ -246,6 +702,9 @@ def add_text_fallback(slide, text, x, y, width, height):
         x, y: Top-left position
         width, height: Box dimensions
     """
+    from pptx.dml.color import RGBColor
+    from pptx.util import Pt
+
     text_box = slide.shapes.add_textbox(x, y, width, height)
     text_frame = text_box.text_frame
     text_frame.text = text
@@ -281,6 +740,11 @@ def create_visual_pillars_slide(prs, layout, dj_input, visual_pillars):
         dj_input: DJ questionnaire data
         visual_pillars: List of pillar dicts with "name" key
     """
+    from pptx.dml.color import RGBColor
+    from pptx.enum.shapes import MSO_SHAPE
+    from pptx.enum.text import PP_ALIGN
+    from pptx.util import Inches, Pt
+
     slide = prs.slides.add_slide(layout)
 
     # Title
@@ -426,6 +890,11 @@ def create_color_palette_slide(prs, layout, dj_input, colors):
         dj_input: DJ questionnaire data
         colors: Dict with "primary" and "palette" keys
     """
+    from pptx.dml.color import RGBColor
+    from pptx.enum.shapes import MSO_SHAPE
+    from pptx.enum.text import PP_ALIGN
+    from pptx.util import Inches, Pt
+
     slide = prs.slides.add_slide(layout)
 
     # Title (centered)
@@ -456,6 +925,9 @@ def create_color_palette_slide(prs, layout, dj_input, colors):
     primary_fill.fore_color.rgb = RGBColor(*primary_rgb)
     primary_shape.line.fill.background()  # No border
 
+    # Overlay text in whichever of black or white contrasts most with the primary
+    primary_text_color = RGBColor(*hex_to_rgb(best_text_color(primary_hex)))
+
     # Primary color text overlay - label
     primary_label_box = slide.shapes.add_textbox(
         Inches(0.6), Inches(1.45), Inches(4.8), Inches(0.35)
@@ -467,7 +939,7 @@ def create_color_palette_slide(prs, layout, dj_input, colors):
     primary_label_run.font.name = "Fjalla One"
     primary_label_run.font.size = Pt(20)
     primary_label_run.font.bold = True
-    primary_label_run.font.color.rgb = RGBColor(255, 255, 255)
+    primary_label_run.font.color.rgb = primary_text_color
 
     # Primary color text overlay - hex + CMYK
     cmyk_text = f"{primary_hex} C: {primary_cmyk['c']}% M: {primary_cmyk['m']}% Y:{primary_cmyk['y']}% K:{primary_cmyk['k']}%"
@@ -480,7 +952,7 @@ def create_color_palette_slide(prs, layout, dj_input, colors):
     primary_info_run = primary_info_para.runs[0]
     primary_info_run.font.name = "Helvetica Neue"
     primary_info_run.font.size = Pt(12)
-    primary_info_run.font.color.rgb = RGBColor(255, 255, 255)
+    primary_info_run.font.color.rgb = primary_text_color
 
     # Palette colors - stacked rounded rectangles on right
     bar_width = Inches(3.6)
@@ -493,8 +965,7 @@ def create_color_palette_slide(prs, layout, dj_input, colors):
         color_hex = color_item['hex']
         color_rgb = hex_to_rgb(color_hex)
         cmyk = hex_to_cmyk(color_hex)
-        is_light = is_light_color(color_hex)
-        text_color = RGBColor(0, 0, 0) if is_light else RGBColor(255, 255, 255)
+        text_color = RGBColor(*hex_to_rgb(best_text_color(color_hex)))
 
         # Color bar
         bar_shape = slide.shapes.add_shape(
@@ -505,8 +976,8 @@ def create_color_palette_slide(prs, layout, dj_input, colors):
         bar_fill.solid()
         bar_fill.fore_color.rgb = RGBColor(*color_rgb)
 
-        # Border for light colors
-        if is_light:
+        # Border for colors too close to the white slide to stand out
+        if needs_outline(color_hex):
             bar_shape.line.color.rgb = RGBColor(204, 204, 204)
             bar_shape.line.width = Pt(1)
         else:
@@ -529,8 +1000,9 @@ def create_color_palette_slide(prs, layout, dj_input, colors):
 
         current_y += bar_height + bar_gap
 
-    # Color description blurb
+    # Color description blurb (shrunk from 8.5pt if it would overflow its box)
     description = colors.get('description', '')
+    blurb_size = fit_font_size(description, Inches(5.2), Inches(1.35), 8.5, 6.5)
 
     blurb_box = slide.shapes.add_textbox(
         Inches(0.4), Inches(3.6), Inches(5.2), Inches(1.35)
@@ -540,10 +1012,23 @@ def create_color_palette_slide(prs, layout, dj_input, colors):
     blurb_frame.word_wrap = True
     for paragraph in blurb_frame.paragraphs:
         paragraph.font.name = "Helvetica Neue"
-        paragraph.font.size = Pt(8.5)
+        paragraph.font.size = Pt(blurb_size)
         paragraph.font.color.rgb = RGBColor(0, 0, 0)
 
 
+# Renderers for the fixed-layout slides (see create_brand_guide)
+RENDERERS = ("pptx", "ooxml")
+
+
+def _slide_builders(renderer):
+    """Return the (visual pillars, color palette) slide builders for a renderer name."""
+    if renderer == "ooxml":
+        from ooxml_renderer import render_color_palette_slide, render_visual_pillars_slide
+
+        return render_visual_pillars_slide, render_color_palette_slide
+    return create_visual_pillars_slide, create_color_palette_slide
+
+
 if __name__ == "__main__":
     # Test with example data
     print("This module is designed to be imported and used within the DJ Brand Guide skill.")
@@ -0,0 +1,329 @@
+#!/usr/bin/env python3
+"""
+Slide previews for DJ Brand Guide Generator.
+Rasterises generated decks to PNG thumbnails with Pillow, without an office suite.
+
+Only the shapes this generator emits are drawn: rectangles, rounded
+rectangles, text boxes and pictures (with their crops). Text is set in
+Pillow's bundled font, wrapped with text_metrics so line breaks follow the
+deck's real font metrics. Previews are for checking layout at a glance,
+not a faithful render.
+
+Usage:
+    python3 preview.py deck.pptx [output_dir] [width]
+"""
+
+from collections import OrderedDict
+from functools import lru_cache
+import io
+import os
+import sys
+import threading
+
+from PIL import Image, ImageDraw, ImageFont
+from pptx import Presentation
+from pptx.enum.dml import MSO_COLOR_TYPE, MSO_FILL
+from pptx.enum.shapes import MSO_SHAPE, MSO_SHAPE_TYPE
+from pptx.enum.text import MSO_ANCHOR, PP_ALIGN
+
+from image_pipeline import decode_slot
+from text_metrics import LINE_SPACING, wrap_text
+
+# Default preview width in pixels (height follows the slide's aspect ratio)
+DEFAULT_PREVIEW_WIDTH = 640
+
+# EMU per point (python-pptx lengths are in EMU)
+EMU_PER_POINT = 12700
+
+# Size used by PowerPoint for text with no explicit size
+DEFAULT_FONT_SIZE = 18
+
+# Bound on decoded pictures kept between previews (bytes of pixel data)
+MAX_DECODED_BYTES = 64 * 1024 * 1024
+
+# (image SHA-1, longest side in pixels) -> decoded RGB(A) Image
+_decoded = OrderedDict()
+_decoded_bytes = 0
+_lock = threading.Lock()
+
+
+# Typographic punctuation missing from Pillow's bundled font, drawn as ASCII
+_ASCII_PUNCTUATION = str.maketrans({"\u2013": "-", "\u2014": "-", "\u2018": "'", "\u2019": "'",
+                                    "\u201c": '"', "\u201d": '"', "\u2026": "..."})
+
+
+@lru_cache(maxsize=64)
+def _font(pixels):
+    """
+    Pillow's bundled font at a pixel size.
+
+    Sized default fonts need Pillow 10.1; older versions fall back to the
+    fixed-size bitmap font, so text in those previews is not to scale.
+    """
+    try:
+        return ImageFont.load_default(size=max(pixels, 1))
+    except TypeError:
+        return ImageFont.load_default()
+
+
+@lru_cache(maxsize=4096)
+def _glyph(pixels, char):
+    """
+    A character rendered once at a pixel size: (mask, (dx, dy), advance).
+
+    FreeType renders a whole line per draw.text call; compositing cached
+    glyph masks instead makes repeat previews an order of magnitude faster.
+    """
+    font = _font(pixels)
+    left, top, right, bottom = font.getbbox(char)
+    mask = Image.new("L", (max(right - left, 1), max(bottom - top, 1)))
+    ImageDraw.Draw(mask).text((-left, -top), char, font=font, fill=255)
+    return mask, (left, top), font.getlength(char)
+
+
+def _line_length(line, pixels):
+    """Advance width of a line in pixels."""
+    return sum(_glyph(pixels, char)[2] for char in line)
+
+
+def _draw_line(draw, x, y, line, pixels, color):
+    """Draw one line of text from cached glyphs."""
+    for char in line:
+        mask, (dx, dy), advance = _glyph(pixels, char)
+        if not char.isspace():
+            draw.bitmap((round(x + dx), round(y + dy)), mask, fill=color)
+        x += advance
+
+
+def _rgb(color, default=None):
+    """An (r, g, b) tuple from a python-pptx color, or default for theme and unset colors."""
+    try:
+        if color.type == MSO_COLOR_TYPE.RGB:
+            return tuple(color.rgb)
+    except AttributeError:
+        pass
+    return default
+
+
+def _fill_rgb(fill):
+    """Solid fill color of a shape or line, or None."""
+    return _rgb(fill.fore_color) if fill.type == MSO_FILL.SOLID else None
+
+
+def decoded_image(image, longest_side):
+    """
+    Decode a picture's image for previews, reusing earlier decodes.
+
+    JPEGs are decoded in draft mode at reduced scale, and every image is
+    shrunk to longest_side before caching, so repeat previews of the same
+    deck (or decks sharing images) never decode a file twice.
+
+    Args:
+        image: python-pptx Image (picture.image)
+        longest_side: Largest width or height the picture is drawn at
+
+    Returns:
+        PIL.Image.Image: Shared RGB or RGBA image (do not modify)
+    """
+    global _decoded_bytes
+
+    key = (image.sha1, longest_side)
+    with _lock:
+        decoded = _decoded.get(key)
+        if decoded is not None:
+            _decoded.move_to_end(key)
+            return decoded
+
+    with decode_slot(), Image.open(io.BytesIO(image.blob)) as source:
+        source.draft("RGB", (longest_side, longest_side))
+        has_alpha = source.mode in ("RGBA", "LA", "PA") or "transparency" in source.info
+        decoded = source.convert("RGBA" if has_alpha else "RGB")
+        decoded.thumbnail((longest_side, longest_side))
+
+    with _lock:
+        if key not in _decoded:
+            _decoded[key] = decoded
+            _decoded_bytes += decoded.width * decoded.height * len(decoded.getbands())
+            while _decoded_bytes > MAX_DECODED_BYTES and len(_decoded) > 1:
+                _, evicted = _decoded.popitem(last=False)
+                _decoded_bytes -= evicted.width * evicted.height * len(evicted.getbands())
+    return decoded
+
+
+def clear_cache():
+    """Drop all decoded pictures."""
+    global _decoded_bytes
+    with _lock:
+        _decoded.clear()
+        _decoded_bytes = 0
+
+
+def _draw_box(draw, shape, box, scale):
+    """Draw a shape's solid fill and outline (rounded for rounded rectangles)."""
+    fill = _fill_rgb(shape.fill)
+    outline = _fill_rgb(shape.line.fill)
+    if fill is None and outline is None:
+        return
+    line_width = max(1, round((shape.line.width or EMU_PER_POINT) * scale)) if outline else 0
+
+    is_rounded = (shape.shape_type == MSO_SHAPE_TYPE.AUTO_SHAPE
+                  and shape.auto_shape_type == MSO_SHAPE.ROUNDED_RECTANGLE)
+    if is_rounded:
+        adjustment = shape.adjustments[0] if len(shape.adjustments) else 0.16667
+        radius = adjustment * min(box[2] - box[0], box[3] - box[1])
+        draw.rounded_rectangle(box, radius, fill=fill, outline=outline, width=line_width)
+    else:
+        draw.rectangle(box, fill=fill, outline=outline, width=line_width)
+
+
+def _paragraph_style(paragraph):
+    """(size in points, rgb, alignment) of a paragraph, from its first run or its default run properties."""
+    size = color = None
+    for font in [run.font for run in paragraph.runs[:1]] + [paragraph.font]:
+        if size is None and font.size is not None:
+            size = font.size.pt
+        if color is None:
+            color = _rgb(font.color)
+    return size or DEFAULT_FONT_SIZE, color or (0, 0, 0), paragraph.alignment
+
+
+def _draw_text(draw, shape, box, scale):
+    """Draw a text frame's paragraphs, wrapped and aligned within its insets."""
+    frame = shape.text_frame
+    left = box[0] + frame.margin_left * scale
+    right = box[2] - frame.margin_right * scale
+    top = box[1] + frame.margin_top * scale
+    bottom = box[3] - frame.margin_bottom * scale
+    line_width_pt = max(right - left, 1) / scale / EMU_PER_POINT
+
+    # Lay out every line first, so anchored text can be offset as a block
+    lines = []
+    for paragraph in frame.paragraphs:
+        size, color, alignment = _paragraph_style(paragraph)
+        text = paragraph.text.translate(_ASCII_PUNCTUATION)
+        wrapped = wrap_text(text, line_width_pt, size) if frame.word_wrap else text.split("\v")
+        line_height = size * LINE_SPACING * EMU_PER_POINT * scale
+        pixels = max(round(size * EMU_PER_POINT * scale), 1)
+        lines.extend((line, pixels, color, alignment, line_height) for line in wrapped)
+
+    text_height = sum(line[4] for line in lines)
+    if frame.vertical_anchor == MSO_ANCHOR.MIDDLE:
+        top += (bottom - top - text_height) / 2
+    elif frame.vertical_anchor == MSO_ANCHOR.BOTTOM:
+        top = bottom - text_height
+
+    y = top
+    for line, pixels, color, alignment, line_height in lines:
+        if line:
+            x = left
+            if alignment in (PP_ALIGN.CENTER, PP_ALIGN.RIGHT):
+                slack = right - left - _line_length(line, pixels)
+                x += slack / 2 if alignment == PP_ALIGN.CENTER else slack
+            _draw_line(draw, x, y, line, pixels, color)
+        y += line_height
+
+
+def _draw_picture(canvas, shape, box):
+    """Paste a picture, cropped as in the deck and scaled to its box."""
+    width, height = round(box[2] - box[0]), round(box[3] - box[1])
+    if width < 1 or height < 1:
+        return
+    crop = (shape.crop_left, shape.crop_top, shape.crop_right, shape.crop_bottom)
+    visible = (1 - crop[0] - crop[2], 1 - crop[1] - crop[3])
+    longest = round(max(width / max(visible[0], 0.01), height / max(visible[1], 0.01)))
+
+    image = decoded_image(shape.image, longest)
+    if any(crop):
+        image = image.crop((
+            round(crop[0] * image.width), round(crop[1] * image.height),
+            round((1 - crop[2]) * image.width), round((1 - crop[3]) * image.height),
+        ))
+    image = image.resize((width, height), Image.BILINEAR)
+    canvas.paste(image, (round(box[0]), round(box[1])), image if image.mode == "RGBA" else None)
+
+
+def render_slide(slide, slide_width, slide_height, width=DEFAULT_PREVIEW_WIDTH):
+    """
+    Rasterise one slide.
+
+    Args:
+        slide: python-pptx Slide
+        slide_width, slide_height: Slide size in EMU
+        width: Preview width in pixels
+
+    Returns:
+        PIL.Image.Image: RGB preview
+    """
+    scale = width / slide_width
+    canvas = Image.new("RGB", (width, round(slide_height * scale)), (255, 255, 255))
+    draw = ImageDraw.Draw(canvas)
+
+    for shape in slide.shapes:
+        if shape.left is None or shape.top is None:
+            continue
+        box = (shape.left * scale, shape.top * scale,
+               (shape.left + shape.width) * scale, (shape.top + shape.height) * scale)
+        if shape.shape_type == MSO_SHAPE_TYPE.PICTURE:
+            _draw_picture(canvas, shape, box)
+            continue
+        _draw_box(draw, shape, box, scale)
+        if shape.has_text_frame:
+            _draw_text(draw, shape, box, scale)
+    return canvas
+
+
+def render_previews(deck, width=DEFAULT_PREVIEW_WIDTH):
+    """
+    Rasterise every slide of a deck.
+
+    Args:
+        deck: Presentation, .pptx path, binary stream or bytes
+        width: Preview width in pixels
+
+    Returns:
+        list: One RGB PIL image per slide, in order
+    """
+    if isinstance(deck, (bytes, bytearray)):
+        deck = io.BytesIO(deck)
+    prs = deck if hasattr(deck, "slides") else Presentation(deck)
+    return [render_slide(slide, prs.slide_width, prs.slide_height, width) for slide in prs.slides]
+
+
+def save_previews(deck, output_dir, width=DEFAULT_PREVIEW_WIDTH, prefix="slide"):
+    """
+    Write a PNG preview of every slide of a deck.
+
+    Args:
+        deck: Presentation, .pptx path, binary stream or bytes
+        output_dir: Directory for the PNGs (created if missing)
+        width: Preview width in pixels
+        prefix: File name prefix (files are named slide_01.png, ...)
+
+    Returns:
+        list: Paths of the written PNGs, in slide order
+    """
+    os.makedirs(output_dir, exist_ok=True)
+    paths = []
+    for number, image in enumerate(render_previews(deck, width), 1):
+        path = os.path.join(output_dir, f"{prefix}_{number:02d}.png")
+        image.save(path, format="PNG", compress_level=1)
+        paths.append(path)
+    return paths
+
+
+def main(argv=None):
+    """Command-line entry point: python3 preview.py deck.pptx [output_dir] [width]"""
+    argv = sys.argv[1:] if argv is None else argv
+    if not argv:
+        print("Usage: python3 preview.py deck.pptx [output_dir] [width]")
+        return 1
+
+    output_dir = argv[1] if len(argv) > 1 else os.path.splitext(argv[0])[0] + "_preview"
+    width = int(argv[2]) if len(argv) > 2 else DEFAULT_PREVIEW_WIDTH
+    for path in save_previews(argv[0], output_dir, width):
+        print(f"✓ {path}")
+    return 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
@@ -0,0 +1,129 @@
+#!/usr/bin/env python3
+"""
+Test script for uploaded asset resolution.
+
+Usage:
+    python3 test_asset_resolver.py
+"""
+
+import os
+import sys
+import tempfile
+import time
+
+sys.path.insert(0, os.path.dirname(os.path.abspath(__file__)))
+
+from asset_resolver import AssetResolver
+
+
+def _touch(path):
+    with open(path, "wb") as f:
+        f.write(b"\x89PNG")
+
+
+def test_resolve_by_identity():
+    """Prompts map to their own uploads regardless of alphabetical order."""
+    print("\n=== Testing Identity Resolution ===")
+    with tempfile.TemporaryDirectory() as root:
+        for name in ("a_cosmic.png", "b_jellyfish.jpg", "file_xyz.png", "notes.txt"):
+            _touch(os.path.join(root, name))
+
+        resolver = AssetResolver([root])
+        prompts = [
+            {"label": "JELLYFISH", "path": "renders/b_jellyfish.jpg"},
+            {"label": "UPLOAD", "file_id": "file_xyz"},
+            {"label": "COSMIC", "image_path": "a_cosmic.png"},
+            {"label": "MISSING", "file_id": "file_missing"},
+        ]
+        resolved = resolver.resolve_prompts(prompts)
+        assert resolved == [
+            os.path.join(root, "b_jellyfish.jpg"),
+            os.path.join(root, "file_xyz.png"),
+            os.path.join(root, "a_cosmic.png"),
+            None,
+        ], f"Unexpected resolution: {resolved}"
+        assert len(resolver.images()) == 3, "Non-image files should not be indexed"
+    print("✓ Identity resolution test passed")
+
+
+def test_positional_fallback():
+    """Unmatched prompts stay empty by default and receive unclaimed uploads only on request."""
+    print("\n=== Testing Positional Fallback ===")
+    with tempfile.TemporaryDirectory() as root:
+        for name in ("1.png", "2.png", "3.png"):
+            _touch(os.path.join(root, name))
+
+        resolver = AssetResolver([root])
+        prompts = [{"label": "A"}, {"label": "B", "file_id": "1"}, {"label": "C"}, {"label": "D"}]
+        assert resolver.resolve_prompts(prompts) == [None, os.path.join(root, "1.png"), None, None]
+        resolved = [os.path.basename(p) if p else None
+                    for p in resolver.resolve_prompts(prompts, positional_fallback=True)]
+        assert resolved == ["2.png", "1.png", "3.png", None], f"Unexpected fallback: {resolved}"
+    print("✓ Positional fallback test passed")
+
+
+def test_mtime_invalidation():
+    """The index is reused until a root directory changes."""
+    print("\n=== Testing Index Invalidation ===")
+    with tempfile.TemporaryDirectory() as root:
+        _touch(os.path.join(root, "first.png"))
+        resolver = AssetResolver([root, os.path.join(root, "does-not-exist")])
+        assert len(resolver.images()) == 1
+
+        first_index = resolver._by_name
+        resolver.images()
+        assert resolver._by_name is first_index, "Unchanged roots should not be rebuilt"
+
+        _touch(os.path.join(root, "second.png"))
+        # Ensure the directory mtime moves even on coarse-grained filesystems
+        future = time.time() + 5
+        os.utime(root, (future, future))
+        assert len(resolver.images()) == 2, "New uploads should invalidate the index"
+        assert resolver.lookup("second") == os.path.join(root, "second.png")
+    print("✓ Index invalidation test passed")
+
+
+def test_deck_resolves_once():
+    """A deck resolves its prompts once and leaves unmatched prompts as placeholders."""
+    print("\n=== Testing Deck Resolution ===")
+    import zipfile
+    from PIL import Image
+    from pptx_generator import create_brand_guide
+
+    colors = {"primary": {"name": "Black", "hex": "#000000"},
+              "palette": [{"name": "White", "hex": "#FFFFFF"}], "description": "Dark."}
+    calls = []
+    real_resolve = AssetResolver.resolve_prompts
+
+    def counting_resolve(self, *args, **kwargs):
+        calls.append(args)
+        return real_resolve(self, *args, **kwargs)
+
+    with tempfile.TemporaryDirectory() as root:
+        Image.new("RGB", (32, 32), "red").save(os.path.join(root, "unrelated.png"))
+        prompts = [{"label": "A", "prompt": "Nothing uploaded for this.", "file_id": "file_missing"}]
+        output = os.path.join(root, "deck.pptx")
+        AssetResolver.resolve_prompts = counting_resolve
+        try:
+            create_brand_guide({"dj_name": "Resolve"}, prompts, colors, output, upload_roots=[root])
+        finally:
+            AssetResolver.resolve_prompts = real_resolve
+
+        assert len(calls) == 1, f"Prompts should be resolved once per deck, not {len(calls)} times"
+        with zipfile.ZipFile(output) as deck:
+            media = [name for name in deck.namelist() if name.startswith("ppt/media/")]
+        assert not media, "An unrelated upload should not fill an unmatched slot"
+    print("✓ Deck resolution test passed")
+
+
+def main():
+    """Run all tests."""
+    test_resolve_by_identity()
+    test_positional_fallback()
+    test_mtime_invalidation()
+    test_deck_resolves_once()
+    print("\n✓ All asset resolver tests passed!")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,208 @@
+#!/usr/bin/env python3
+"""
+Test script for the async generation API.
+Requires python-pptx to be installed.
+
+Usage:
+    python3 test_async.py
+"""
+
+import asyncio
+import io
+import os
+import sys
+import tempfile
+import threading
+import time
+
+sys.path.insert(0, os.path.dirname(os.path.abspath(__file__)))
+
+from pptx import Presentation
+
+import async_generator
+from async_generator import AsyncDeckBuilder, create_brand_guide_async
+
+DJ_INPUT = {"dj_name": "Aqua Voyager", "brand_positioning": "otherworldly explorer of sonic depths"}
+
+COLORS = {
+    "primary": {"name": "Deep Ocean Blue", "hex": "#0A1F44"},
+    "palette": [{"name": "Electric Cyan", "hex": "#00D9FF"}, {"name": "White", "hex": "#FFFFFF"}],
+    "description": "Deep and glowing.",
+}
+
+PROMPTS = [{"label": f"IMAGE {i}", "prompt": "Ethereal forms.", "file_id": None} for i in range(4)]
+
+
+class _BuildCounter:
+    """Wraps create_brand_guide to count builds and track how many run at once."""
+
+    def __init__(self, delay=0.0):
+        self.delay = delay
+        self.started = 0
+        self.active = 0
+        self.max_active = 0
+        self._lock = threading.Lock()
+        self._real = async_generator.create_brand_guide
+
+    def __call__(self, *args, **kwargs):
+        with self._lock:
+            self.started += 1
+            self.active += 1
+            self.max_active = max(self.max_active, self.active)
+        try:
+            time.sleep(self.delay)
+            return self._real(*args, **kwargs)
+        finally:
+            with self._lock:
+                self.active -= 1
+
+    def __enter__(self):
+        async_generator.create_brand_guide = self
+        return self
+
+    def __exit__(self, *exc):
+        async_generator.create_brand_guide = self._real
+
+
+def test_concurrent_builds():
+    """Many requests complete, never exceeding the concurrency limit, while the loop stays responsive."""
+    print("\n=== Testing Concurrent Async Builds ===")
+
+    async def run():
+        gaps = []
+
+        async def heartbeat(stop):
+            last = time.perf_counter()
+            while not stop.is_set():
+                await asyncio.sleep(0.005)
+                now = time.perf_counter()
+                gaps.append(now - last)
+                last = now
+
+        stop = asyncio.Event()
+        ticker = asyncio.create_task(heartbeat(stop))
+        async with AsyncDeckBuilder(max_concurrency=2) as builder:
+            decks = await asyncio.gather(*(
+                builder.create_brand_guide(DJ_INPUT, PROMPTS, COLORS, visual_pillars=[{"name": f"PILLAR {i}"}])
+                for i in range(6)
+            ))
+        stop.set()
+        await ticker
+        return decks, max(gaps)
+
+    with _BuildCounter(delay=0.02) as counter:
+        decks, worst_gap = asyncio.run(run())
+
+    assert counter.started == 6
+    assert counter.max_active <= 2, f"At most 2 builds should run at once, saw {counter.max_active}"
+    for i, deck in enumerate(decks):
+        prs = Presentation(io.BytesIO(deck))
+        assert len(prs.slides) == 3
+        assert prs.slides[0].shapes[5].text_frame.text == f"PILLAR {i}", "Results should match their requests"
+    print(f"  Longest event-loop stall: {worst_gap * 1000:.1f} ms")
+    assert worst_gap < 0.25, "Builds should not stall the event loop"
+    print("✓ Concurrent async build test passed")
+
+
+def test_output_path_and_default_builder():
+    """create_brand_guide_async writes to a path using the shared per-loop builder."""
+    print("\n=== Testing Async Output Path ===")
+    with tempfile.TemporaryDirectory() as tmp:
+        output_path = os.path.join(tmp, "deck.pptx")
+        result = asyncio.run(create_brand_guide_async(DJ_INPUT, PROMPTS, COLORS, output_path, renderer="ooxml"))
+        assert result == output_path
+        assert len(Presentation(output_path).slides) == 2
+        assert os.listdir(tmp) == ["deck.pptx"], "No temporary files should remain"
+    print("✓ Async output path test passed")
+
+
+def test_cancellation():
+    """Cancelling a queued request means its deck is never built or written."""
+    print("\n=== Testing Async Cancellation ===")
+
+    async def run(tmp):
+        async with AsyncDeckBuilder(max_concurrency=1) as builder:
+            first = asyncio.create_task(builder.create_brand_guide(DJ_INPUT, PROMPTS, COLORS))
+            queued_path = os.path.join(tmp, "queued.pptx")
+            queued = asyncio.create_task(builder.create_brand_guide(DJ_INPUT, PROMPTS, COLORS, queued_path))
+            await asyncio.sleep(0.01)
+            queued.cancel()
+            try:
+                await queued
+                assert False, "Cancelled request should raise CancelledError"
+            except asyncio.CancelledError:
+                pass
+            deck = await first
+        return deck, queued_path
+
+    with tempfile.TemporaryDirectory() as tmp, _BuildCounter(delay=0.1) as counter:
+        deck, queued_path = asyncio.run(run(tmp))
+        assert deck.startswith(b"PK")
+        assert counter.started == 1, "The cancelled request should never start building"
+        assert not os.path.exists(queued_path)
+    print("✓ Async cancellation test passed")
+
+
+def test_cancellation_during_write():
+    """A request cancelled while its deck is being written leaves no output or temporary file."""
+    print("\n=== Testing Async Cancellation During Write ===")
+    real_write = async_generator._write_temp
+    writing = threading.Event()
+    done = threading.Event()
+
+    def slow_write(*args):
+        writing.set()
+        time.sleep(0.1)
+        try:
+            return real_write(*args)
+        finally:
+            done.set()
+
+    async def run(output_path):
+        task = asyncio.create_task(create_brand_guide_async(DJ_INPUT, PROMPTS, COLORS, output_path, renderer="ooxml"))
+        while not writing.is_set():
+            await asyncio.sleep(0.005)
+        task.cancel()
+        try:
+            await task
+            assert False, "Cancelled request should raise CancelledError"
+        except asyncio.CancelledError:
+            pass
+
+    async_generator._write_temp = slow_write
+    try:
+        with tempfile.TemporaryDirectory() as tmp:
+            asyncio.run(run(os.path.join(tmp, "deck.pptx")))
+            assert done.wait(5)
+            assert os.listdir(tmp) == [], f"Nothing should be written: {os.listdir(tmp)}"
+    finally:
+        async_generator._write_temp = real_write
+    print("✓ Async write cancellation test passed")
+
+
+def test_default_builders_share_threads():
+    """Default builders on successive loops reuse one thread pool."""
+    print("\n=== Testing Default Builder Threads ===")
+
+    async def build():
+        await create_brand_guide_async(DJ_INPUT, PROMPTS, COLORS, renderer="ooxml")
+        return async_generator._default_builder(asyncio.get_running_loop())
+
+    builders = [asyncio.run(build()) for _ in range(3)]
+    assert len({id(builder._executor) for builder in builders}) == 1
+    assert len(async_generator._default_builders) <= 1, "Builders of closed loops should be dropped"
+    print("✓ Default builder threads test passed")
+
+
+def main():
+    """Run all tests."""
+    test_concurrent_builds()
+    test_output_path_and_default_builder()
+    test_cancellation()
+    test_cancellation_during_write()
+    test_default_builders_share_threads()
+    print("\n✓ All async tests passed!")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,104 @@
+#!/usr/bin/env python3
+"""
+Test script for batch brand guide generation.
+Requires python-pptx to be installed.
+
+Usage:
+    python3 test_batch.py
+"""
+
+import io
+import json
+import os
+import sys
+import tempfile
+
+sys.path.insert(0, os.path.dirname(os.path.abspath(__file__)))
+
+from batch_generator import generate_brand_guides, load_jobs
+
+
+def _sample_job(name):
+    return {
+        "dj_input": {
+            "dj_name": name,
+            "music_style": "Deep house",
+            "core_descriptors": ["oceanic", "mysterious", "hypnotic"],
+        },
+        "image_prompts": [
+            {"label": "JELLYFISH", "prompt": "Bioluminescent jellyfish.", "file_id": None},
+            {"label": "STRUCTURE", "prompt": "Underwater architecture.", "file_id": None},
+        ],
+        "colors": {
+            "primary": {"name": "Deep Ocean Blue", "hex": "#0A1F44"},
+            "palette": [
+                {"name": "Black", "hex": "#000000"},
+                {"name": "White", "hex": "#FFFFFF"},
+            ],
+            "description": "Deep and glowing.",
+        },
+        "visual_pillars": [{"name": "LIQUID GEOMETRY"}],
+    }
+
+
+def test_load_jobs_jsonl():
+    """JSONL streams are parsed line by line, skipping blanks."""
+    print("\n=== Testing JSONL Job Loading ===")
+    stream = io.StringIO(json.dumps(_sample_job("A")) + "\n\n" + json.dumps(_sample_job("B")) + "\n")
+    jobs = load_jobs(stream)
+    assert [j["dj_input"]["dj_name"] for j in jobs] == ["A", "B"], f"Unexpected jobs: {jobs}"
+    print("✓ load_jobs test passed")
+
+
+def test_generate_brand_guides():
+    """Batch renders every good job and isolates the failing one."""
+    print("\n=== Testing Batch Generation ===")
+    bad_job = _sample_job("Broken")
+    del bad_job["colors"]["primary"]
+    jobs = [_sample_job("Aqua Voyager"), bad_job, _sample_job("Ember")]
+
+    with tempfile.TemporaryDirectory() as output_dir:
+        summary = generate_brand_guides(jobs, output_dir, max_workers=2)
+
+        results = summary["results"]
+        assert [r["index"] for r in results] == [0, 1, 2], "Ordered results should follow input order"
+        assert summary["succeeded"] == 2 and summary["failed"] == 1, f"Unexpected summary: {summary}"
+        assert results[1]["error"].startswith("KeyError"), f"Expected KeyError, got {results[1]['error']}"
+        for r in (results[0], results[2]):
+            assert os.path.getsize(r["output_path"]) > 10000, f"Deck too small: {r['output_path']}"
+        assert summary["decks_per_second"] > 0
+
+    print(f"  Throughput: {summary['decks_per_second']:.2f} decks/sec")
+    print("✓ Batch generation test passed")
+
+
+def test_malformed_jsonl_line():
+    """A bad JSONL line fails its own job; the jobs around it still render."""
+    print("\n=== Testing Malformed JSONL Line ===")
+    with tempfile.TemporaryDirectory() as output_dir:
+        jobs_path = os.path.join(output_dir, "jobs.jsonl")
+        with open(jobs_path, "w", encoding="utf-8") as f:
+            f.write(json.dumps(_sample_job("A")) + "\n{not json\n[1, 2]\n" + json.dumps(_sample_job("B")) + "\n")
+
+        summary = generate_brand_guides(jobs_path, output_dir, max_workers=2)
+        results = summary["results"]
+        assert [r["index"] for r in results] == [0, 1, 2, 3]
+        assert summary["succeeded"] == 2 and summary["failed"] == 2, f"Unexpected summary: {summary}"
+        assert results[1]["error"].startswith("JSONDecodeError"), results[1]["error"]
+        assert results[2]["error"] == "ValueError: Job must be a JSON object", results[2]["error"]
+        assert results[1]["output_path"] is None
+        for r in (results[0], results[3]):
+            assert r["error"] is None and os.path.getsize(r["output_path"]) > 10000
+    print("✓ Malformed JSONL line test passed")
+
+
+def main():
+    """Run all tests."""
+    test_load_jobs_jsonl()
+    test_generate_brand_guides()
+    test_malformed_jsonl_line()
+    print("\n✓ All batch tests passed!")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,51 @@
+#!/usr/bin/env python3
+"""
+Test script for the benchmark suite.
+Requires python-pptx to be installed.
+
+Usage:
+    python3 test_benchmark.py
+"""
+
+import os
+import sys
+
+sys.path.insert(0, os.path.dirname(os.path.abspath(__file__)))
+
+from benchmark import SLIDE_STAGES, compare, make_inputs, run_case
+
+
+def test_make_inputs():
+    """Synthetic inputs follow the requested scale and the colors schema."""
+    print("\n=== Testing Synthetic Inputs ===")
+    dj_input, prompts, colors, pillars = make_inputs(16, 16)
+    assert len(prompts) == 16 and len(colors["palette"]) == 16 and len(pillars) == 4
+    assert colors["palette"][-2:] == [{"name": "Black", "hex": "#000000"}, {"name": "White", "hex": "#FFFFFF"}]
+    assert all("path" not in prompt for prompt in prompts), "Text-only inputs should not reference images"
+    print("✓ make_inputs test passed")
+
+
+def test_run_case_and_compare():
+    """A small case reports every metric, and compare() flags regressions."""
+    print("\n=== Testing Benchmark Case ===")
+    result = run_case(4, 6, with_images=False, repeats=1)
+    assert result["case"] == "4p-6c-text"
+    assert result["total_seconds"] > 0 and result["output_bytes"] > 10000 and result["peak_rss_bytes"] > 0
+    assert set(result["slide_seconds"]) == set(SLIDE_STAGES)
+
+    assert compare([result], {"results": [result]}) == [], "Identical results should not regress"
+    slower = dict(result, total_seconds=result["total_seconds"] * 2)
+    regressions = compare([slower], [result], tolerance=0.25)
+    assert len(regressions) == 1 and "total_seconds" in regressions[0], f"Unexpected: {regressions}"
+    print("✓ Benchmark case test passed")
+
+
+def main():
+    """Run all tests."""
+    test_make_inputs()
+    test_run_case_and_compare()
+    print("\n✓ All benchmark tests passed!")
+
+
+if __name__ == "__main__":
+    main()
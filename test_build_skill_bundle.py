@@ -0,0 +1,135 @@
+#!/usr/bin/env python3
+"""
+Test script for the skill bundle builder.
+Requires python-pptx to be installed.
+
+Usage:
+    python3 test_build_skill_bundle.py
+"""
+
+from pathlib import Path
+import os
+import subprocess
+import sys
+import tempfile
+
+sys.path.insert(0, os.path.dirname(os.path.abspath(__file__)))
+
+import build_skill_bundle
+import upload_skill
+
+GENERATOR_MODULES = [
+    "asset_resolver", "color_utils", "contrast", "deck_cache", "image_pipeline", "instrumentation",
+    "media_cache", "moodboard_layout", "narrative_generator", "ooxml_renderer", "pptx_generator", "text_metrics",
+]
+
+# Server-side tools the full REFERENCE.md documents but the bundle leaves out
+SERVER_MODULES = ["async_generator", "batch_generator", "benchmark", "palette_extractor", "preview", "worker"]
+
+
+def test_import_closure():
+    """The closure follows deferred imports and leaves out tests and tools."""
+    print("\n=== Testing Import Closure ===")
+    assert build_skill_bundle.import_closure() == GENERATOR_MODULES
+    assert "preview" in build_skill_bundle.import_closure(("pptx_generator", "preview"))
+    assert build_skill_bundle.linked_docs() == ["SKILL.md", "REFERENCE.md", "EXAMPLES.md"]
+    try:
+        build_skill_bundle.import_closure(("no_such_module",))
+    except ValueError:
+        pass
+    else:
+        raise AssertionError("Unknown entry modules should be rejected")
+    print("✓ Import closure test passed")
+
+
+def test_bundle_loads_bytecode():
+    """Bundled .pyc files are used even after unpacking changes file times."""
+    print("\n=== Testing Bundle Bytecode ===")
+    with tempfile.TemporaryDirectory() as tmp:
+        bundle_dir = Path(tmp) / "bundle"
+        files = build_skill_bundle.build_bundle(bundle_dir)
+        assert not any(Path(name).name.startswith("test_") for name in files)
+        assert sorted(name[:-3] for name in files if name.endswith(".py")) == GENERATOR_MODULES
+        pycs = sorted((bundle_dir / "__pycache__").glob("*.pyc"))
+        assert len(pycs) == len(GENERATOR_MODULES)
+        assert all(pyc.read_bytes()[4] == 0b11 for pyc in pycs), "Bytecode should be checked hash-based"
+
+        # Unpacking gives every source a new mtime, which timestamp-based .pyc files would not survive
+        for source in bundle_dir.glob("*.py"):
+            os.utime(source, (0, 0))
+        result = subprocess.run(
+            [sys.executable, "-B", "-v", "-c", "import pptx_generator, ooxml_renderer, media_cache"],
+            cwd=bundle_dir, capture_output=True, text=True, check=True,
+        )
+        loaded = [line for line in result.stderr.splitlines() if "code object from" in line and str(bundle_dir) in line]
+        assert len(loaded) == len(GENERATOR_MODULES) - 1, loaded  # narrative_generator loads on first deck
+
+        # Rebuilding over a bundle is allowed; over anything else it is not
+        build_skill_bundle.build_bundle(bundle_dir, compile_bytecode=False)
+        assert not (bundle_dir / "__pycache__").exists()
+        (Path(tmp) / "other").mkdir()
+        (Path(tmp) / "other" / "notes.txt").write_text("keep")
+        try:
+            build_skill_bundle.build_bundle(Path(tmp) / "other")
+        except ValueError:
+            pass
+        else:
+            raise AssertionError("Non-bundle directories should not be replaced")
+    print("✓ Bundle bytecode test passed")
+
+
+def test_bundle_docs_trimmed():
+    """Bundled docs keep the generator's sections and drop those of server-side tools."""
+    print("\n=== Testing Bundle Docs ===")
+    local_modules = [path.stem for path in Path(build_skill_bundle.SKILL_DIR).glob("*.py")]
+    reference = (Path(build_skill_bundle.SKILL_DIR) / "REFERENCE.md").read_text(encoding="utf-8")
+    assert set(SERVER_MODULES) <= build_skill_bundle.mentioned_modules(reference, local_modules)
+
+    with tempfile.TemporaryDirectory() as tmp:
+        bundle_dir = Path(tmp) / "bundle"
+        build_skill_bundle.build_bundle(bundle_dir, compile_bytecode=False)
+        for doc in build_skill_bundle.linked_docs():
+            text = (bundle_dir / doc).read_text(encoding="utf-8")
+            mentioned = build_skill_bundle.mentioned_modules(text, local_modules)
+            assert mentioned <= set(GENERATOR_MODULES), (doc, mentioned - set(GENERATOR_MODULES))
+            assert "---\n\n---" not in text
+        bundled_reference = (bundle_dir / "REFERENCE.md").read_text(encoding="utf-8")
+        assert "### pptx_generator" in bundled_reference and "### color_utils" in bundled_reference
+        assert "## Data Structure Schemas" in bundled_reference
+
+    doc = "## A\n\n### preview\n\nText.\n\n#### `render()`\n\n---\n\n### color_utils\n\n- `preview.py` item\n- kept\n"
+    trimmed = build_skill_bundle.trim_doc(doc, ["color_utils"], ["color_utils", "preview"])
+    assert trimmed == "## A\n\n---\n\n### color_utils\n\n- kept\n", trimmed
+    print("✓ Bundle docs test passed")
+
+
+def test_bundle_report_and_upload():
+    """The report compares the bundle with the folder upload, and the bundle uploads with its bytecode."""
+    print("\n=== Testing Bundle Report ===")
+    with tempfile.TemporaryDirectory() as tmp:
+        bundle_dir = Path(tmp) / upload_skill.SKILL_FOLDER_NAME
+        build_skill_bundle.build_bundle(bundle_dir)
+        report = build_skill_bundle.compare_with_folder(bundle_dir, runs=2)
+        print(build_skill_bundle.format_report(report))
+        assert report["after"]["files"] < report["before"]["files"]
+        for row in report.values():
+            for timing in (row["load_seconds"], row["import_seconds"]):
+                assert 0 < timing["min"] <= timing["median"] <= timing["max"]
+
+        paths = [path for path, _, _ in upload_skill.collect_skill_files(bundle_dir, include_bytecode=True)]
+        assert f"{upload_skill.SKILL_FOLDER_NAME}/__pycache__/pptx_generator.{sys.implementation.cache_tag}.pyc" in paths
+        assert f"{upload_skill.SKILL_FOLDER_NAME}/SKILL.md" in paths
+    print("✓ Bundle report test passed")
+
+
+def main():
+    """Run all tests."""
+    test_import_closure()
+    test_bundle_loads_bytecode()
+    test_bundle_docs_trimmed()
+    test_bundle_report_and_upload()
+    print("\n✓ All bundle tests passed!")
+
+
+if __name__ == "__main__":
+    main()
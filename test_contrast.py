@@ -0,0 +1,131 @@
+#!/usr/bin/env python3
+"""
+Test script for WCAG contrast scoring.
+Requires NumPy and python-pptx.
+
+Usage:
+    python3 test_contrast.py
+"""
+
+import os
+import subprocess
+import sys
+import time
+
+SKILL_DIR = os.path.dirname(os.path.abspath(__file__))
+sys.path.insert(0, SKILL_DIR)
+
+import numpy as np
+from lxml import etree
+
+import contrast
+from color_utils import rgb_to_hex
+from ooxml_renderer import render_color_palette_slide
+from pptx_generator import create_color_palette_slide, new_presentation
+
+PALETTE = ["#0A1F44", "#00D9FF", "#8B00FF", "#008B8B", "#001F3F", "#00FFFF", "#000000", "#FFFFFF"]
+
+
+def test_scalar_contrast():
+    """Ratios and text choices match the WCAG definitions."""
+    print("\n=== Testing Contrast Ratios ===")
+    assert round(contrast.contrast_ratio("#000000", "#FFFFFF"), 2) == 21.0
+    assert round(contrast.contrast_ratio("#777777", "#FFFFFF"), 2) == 4.48
+    assert contrast.contrast_ratio("#0A1F44", "#00D9FF") == contrast.contrast_ratio("#00D9FF", "#0A1F44")
+
+    # Mid grey took white text under the old 0.5 luma threshold, at under 4:1
+    assert contrast.best_text_color("#808080") == "#000000"
+    assert contrast.best_text_color("#0A1F44") == "#FFFFFF"
+    assert contrast.best_text_color("#00D9FF") == "#000000"
+    assert contrast.needs_outline("#FFFFFF") and contrast.needs_outline("#00FFFF")
+    assert not contrast.needs_outline("#0A1F44")
+
+    # Slide building never loads NumPy for this
+    code = "import contrast, sys; contrast.best_text_color('#808080'); print('numpy' in sys.modules)"
+    result = subprocess.run([sys.executable, "-c", code], cwd=SKILL_DIR, capture_output=True, text=True, check=True)
+    assert result.stdout.strip() == "False"
+    print("✓ Contrast ratio test passed")
+
+
+def test_vectorized_matches_scalar():
+    """The matrix and batch text choices agree with the scalar helpers."""
+    print("\n=== Testing Vectorized Contrast ===")
+    rng = np.random.default_rng(7)
+    rgb = rng.integers(0, 256, size=(500, 3), dtype=np.uint8)
+    hex_colors = [rgb_to_hex(*map(int, color)) for color in rgb]
+
+    luminance = contrast.relative_luminance_array(rgb)
+    assert np.allclose(luminance, [contrast.relative_luminance(h) for h in hex_colors])
+
+    choice, ratios = contrast.best_text_colors(hex_colors)
+    assert [contrast.TEXT_COLORS[i] for i in choice] == [contrast.best_text_color(h) for h in hex_colors]
+    assert ratios.min() >= contrast.AA_NORMAL, "Black or white always reaches 4.5:1"
+
+    matrix = contrast.contrast_matrix(PALETTE)
+    assert matrix.shape == (8, 8) and np.allclose(matrix, matrix.T) and np.allclose(np.diag(matrix), 1)
+    assert np.isclose(matrix[0, 1], contrast.contrast_ratio(PALETTE[0], PALETTE[1]))
+
+    failing = contrast.failing_pairs(PALETTE)
+    assert ("#0A1F44", "#001F3F") in [pair[:2] for pair in failing]
+    assert all(ratio < contrast.AA_NORMAL for _, _, ratio in failing)
+    assert [ratio for _, _, ratio in failing] == sorted(ratio for _, _, ratio in failing)
+    print("✓ Vectorized contrast test passed")
+
+
+def test_score_palettes_speed():
+    """Thousands of candidate palettes are scored in one pass, matching per-palette results."""
+    print("\n=== Testing Palette Scoring ===")
+    rng = np.random.default_rng(11)
+    palettes = rng.integers(0, 256, size=(5000, 8, 3), dtype=np.uint8)
+    contrast.score_palettes(palettes[:10])  # Build the lookup table
+
+    start = time.perf_counter()
+    scores = contrast.score_palettes(palettes)
+    elapsed = time.perf_counter() - start
+    print(f"  Scored {len(palettes)} palettes in {elapsed * 1000:.1f} ms")
+    assert elapsed < 0.25
+
+    for index in (0, 1234, 4999):
+        hex_colors = [rgb_to_hex(*map(int, color)) for color in palettes[index]]
+        matrix = contrast.contrast_matrix(hex_colors)
+        pair_ratios = matrix[np.triu_indices(8, k=1)]
+        assert np.isclose(scores["min_contrast"][index], pair_ratios.min())
+        assert scores["failing_pairs"][index] == len(contrast.failing_pairs(hex_colors))
+        assert np.isclose(scores["min_text_contrast"][index], contrast.best_text_colors(hex_colors)[1].min())
+    print("✓ Palette scoring test passed")
+
+
+def test_renderers_use_contrast():
+    """Both palette renderers pick the same WCAG text colors, including on the primary block."""
+    print("\n=== Testing Palette Slide Text Colors ===")
+    colors = {
+        "primary": {"name": "Sun", "hex": "#FFD700"},
+        "palette": [{"name": "Grey", "hex": "#808080"}, {"name": "Navy", "hex": "#0A1F44"},
+                    {"name": "White", "hex": "#FFFFFF"}],
+        "description": "Bright.",
+    }
+    xml = []
+    for builder in (create_color_palette_slide, render_color_palette_slide):
+        prs, layout = new_presentation()
+        builder(prs, layout, {"dj_name": "Contrast"}, colors)
+        shapes = list(prs.slides[0].shapes)
+        text_colors = {shape.text_frame.text.split()[0]: str(shape.text_frame.paragraphs[0].runs[0].font.color.rgb)
+                       for shape in shapes if shape.has_text_frame and shape.text_frame.text.startswith("#")}
+        assert text_colors == {"#FFD700": "000000", "#808080": "000000", "#0A1F44": "FFFFFF", "#FFFFFF": "000000"}
+        assert shapes[2].text_frame.paragraphs[0].runs[0].font.color.rgb == (0, 0, 0), "Label on a light primary"
+        xml.append(etree.tostring(prs.slides[0]._element))
+    assert xml[0] == xml[1]
+    print("✓ Palette slide text color test passed")
+
+
+def main():
+    """Run all tests."""
+    test_scalar_contrast()
+    test_vectorized_matches_scalar()
+    test_score_palettes_speed()
+    test_renderers_use_contrast()
+    print("\n✓ All contrast tests passed!")
+
+
+if __name__ == "__main__":
+    main()
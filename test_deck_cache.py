@@ -0,0 +1,139 @@
+#!/usr/bin/env python3
+"""
+Test script for deterministic output and the deck cache.
+Requires python-pptx to be installed.
+
+Usage:
+    python3 test_deck_cache.py
+"""
+
+import io
+import os
+import sys
+import tempfile
+import time
+
+sys.path.insert(0, os.path.dirname(os.path.abspath(__file__)))
+
+from PIL import Image
+
+from deck_cache import DeckCache
+from instrumentation import Tracer
+from pptx_generator import create_brand_guide, create_brand_guide_bytes
+
+DJ_INPUT = {"dj_name": "Aqua Voyager", "brand_positioning": "otherworldly explorer of sonic depths"}
+
+COLORS = {
+    "primary": {"name": "Deep Ocean Blue", "hex": "#0A1F44"},
+    "palette": [{"name": "Black", "hex": "#000000"}, {"name": "White", "hex": "#FFFFFF"}],
+    "description": "Deep and glowing.",
+}
+
+
+def test_deterministic_output():
+    """Identical inputs produce byte-identical decks, even across seconds."""
+    print("\n=== Testing Deterministic Output ===")
+    prompts = [{"label": "IMAGE 1", "prompt": "Ethereal forms.", "file_id": None}]
+    first = create_brand_guide_bytes(DJ_INPUT, prompts, COLORS, visual_pillars=[{"name": "LIQUID"}])
+    time.sleep(2.1)  # Zip timestamps have 2-second resolution
+    second = create_brand_guide_bytes(DJ_INPUT, prompts, COLORS, visual_pillars=[{"name": "LIQUID"}])
+    assert first == second, "Same inputs should produce identical bytes"
+    print("✓ Deterministic output test passed")
+
+
+def test_cache_hit_and_invalidation():
+    """Repeat requests are served from the cache; changed image contents miss."""
+    print("\n=== Testing Deck Cache ===")
+    with tempfile.TemporaryDirectory() as tmp:
+        image_path = os.path.join(tmp, "render.png")
+        Image.new("RGB", (320, 180), (0, 217, 255)).save(image_path)
+        prompts = [{"label": "RENDER", "prompt": "Cyan.", "path": image_path}]
+        cache = DeckCache(os.path.join(tmp, "cache"))
+
+        def build(output):
+            tracer = Tracer()
+            create_brand_guide(DJ_INPUT, prompts, COLORS, output, cache=cache, tracer=tracer,
+                               upload_roots=[tmp])
+            spans = {span["name"]: span for span in tracer.to_list()}
+            return spans["cache_lookup"]["hit"], tracer.totals()["create_brand_guide"]
+
+        miss_path = os.path.join(tmp, "miss.pptx")
+        hit, miss_seconds = build(miss_path)
+        assert not hit
+
+        hit_stream = io.BytesIO()
+        hit, hit_seconds = build(hit_stream)
+        assert hit, "Unchanged request should hit the cache"
+        with open(miss_path, "rb") as f:
+            assert hit_stream.getvalue() == f.read(), "Cached deck should match the original"
+        print(f"  Miss {miss_seconds * 1000:.1f} ms, hit {hit_seconds * 1000:.1f} ms")
+        assert hit_seconds < miss_seconds
+
+        # Same path, new pixels: the key must change
+        Image.new("RGB", (320, 180), (139, 0, 255)).save(image_path)
+        os.utime(image_path, ns=(time.time_ns(), time.time_ns() + 10 ** 9))
+        hit, _ = build(io.BytesIO())
+        assert not hit, "Changed image contents should miss the cache"
+    print("✓ Deck cache test passed")
+
+
+def test_cache_eviction():
+    """Least recently used decks are evicted once the cache exceeds its bound."""
+    print("\n=== Testing Cache Eviction ===")
+    with tempfile.TemporaryDirectory() as tmp:
+        cache = DeckCache(tmp, max_bytes=2500)
+        keys = [cache.key(DJ_INPUT, [], COLORS, options=i) for i in range(3)]
+        assert len(set(keys)) == 3, "Options should be part of the key"
+
+        cache.store(keys[0], b"0" * 1000)
+        cache.store(keys[1], b"1" * 1000)
+        # Make key 0 the most recently used before the store that overflows
+        os.utime(cache.path(keys[1]), ns=(0, 0))
+        assert cache.lookup(keys[0])
+        cache.store(keys[2], b"2" * 1000)
+
+        assert cache.lookup(keys[1]) is None, "Least recently used entry should be evicted"
+        assert cache.lookup(keys[0]) and cache.lookup(keys[2])
+        cache.clear()
+        assert cache.lookup(keys[0]) is None
+    print("✓ Cache eviction test passed")
+
+
+def test_entry_evicted_after_lookup():
+    """A deck evicted by another process between lookup and copy is rebuilt, not an error."""
+    print("\n=== Testing Concurrent Eviction ===")
+
+    class RacingCache(DeckCache):
+        stores = 0
+
+        def store(self, key, data):
+            self.stores += 1
+            return super().store(key, data)
+
+        def lookup(self, key):
+            path = super().lookup(key)
+            if path:
+                os.remove(path)  # Another process evicts the entry
+            return path
+
+    with tempfile.TemporaryDirectory() as tmp:
+        prompts = [{"label": "IMAGE 1", "prompt": "Ethereal forms.", "file_id": None}]
+        cache = RacingCache(tmp)
+        first = create_brand_guide_bytes(DJ_INPUT, prompts, COLORS, cache=cache)
+        second = create_brand_guide_bytes(DJ_INPUT, prompts, COLORS, cache=cache)
+        assert first == second
+        assert cache.stores == 2, "The evicted deck should be rebuilt and stored again"
+    print("✓ Concurrent eviction test passed")
+
+
+def main():
+    """Run all tests."""
+    test_deterministic_output()
+    test_cache_hit_and_invalidation()
+    test_cache_eviction()
+    test_entry_evicted_after_lookup()
+    print("\n✓ All deck cache tests passed!")
+
+
+if __name__ == "__main__":
+    main()
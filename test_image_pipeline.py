@@ -0,0 +1,236 @@
+#!/usr/bin/env python3
+"""
+Test script for image preprocessing.
+Requires Pillow (installed with python-pptx).
+
+Usage:
+    python3 test_image_pipeline.py
+"""
+
+import io
+import os
+import struct
+import sys
+import tempfile
+import zipfile
+
+sys.path.insert(0, os.path.dirname(os.path.abspath(__file__)))
+
+from PIL import Image
+
+from image_pipeline import clear_cache, image_size, prepare_image, target_pixels
+
+# Moodboard image box: 4.25" x 1.65"
+BOX_WIDTH = int(4.25 * 914400)
+BOX_HEIGHT = int(1.65 * 914400)
+
+
+def _write_gradient(path, size):
+    """Write a smooth RGB test image (compresses like a real render)."""
+    img = Image.linear_gradient("L").resize(size).convert("RGB")
+    img.save(path)
+
+
+def test_target_pixels():
+    """Box sizes convert to pixels at the requested DPI."""
+    print("\n=== Testing Target Pixels ===")
+    assert target_pixels(914400, 914400, 150) == (150, 150)
+    assert target_pixels(BOX_WIDTH, BOX_HEIGHT, 150) == (638, 248)
+    print("✓ target_pixels test passed")
+
+
+def test_prepare_image():
+    """Large renders are downsized; small images are embedded as-is."""
+    print("\n=== Testing Image Preprocessing ===")
+    clear_cache()
+    with tempfile.TemporaryDirectory() as tmp:
+        large_path = os.path.join(tmp, "render_4k.png")
+        _write_gradient(large_path, (3840, 2160))
+
+        derivative = prepare_image(large_path, BOX_WIDTH, BOX_HEIGHT)
+        data = derivative.getvalue()
+        assert len(data) < os.path.getsize(large_path), "Derivative should be smaller than the original"
+        with Image.open(derivative) as img:
+            assert img.width <= 638 and img.height <= 248, f"Unexpected size {img.size}"
+            assert img.format == "JPEG", "Opaque images should be re-encoded as JPEG"
+
+        # Cached by content hash + target size
+        assert prepare_image(large_path, BOX_WIDTH, BOX_HEIGHT).getvalue() == data
+
+        # Persistent cache survives an in-memory clear
+        cache_dir = os.path.join(tmp, "cache")
+        clear_cache()
+        prepare_image(large_path, BOX_WIDTH, BOX_HEIGHT, cache_dir=cache_dir)
+        clear_cache()
+        assert len(os.listdir(cache_dir)) == 1
+        assert prepare_image(large_path, BOX_WIDTH, BOX_HEIGHT, cache_dir=cache_dir).getvalue() == data
+
+        small_path = os.path.join(tmp, "small.png")
+        _write_gradient(small_path, (320, 180))
+        assert prepare_image(small_path, BOX_WIDTH, BOX_HEIGHT) == small_path, "Small images should pass through"
+    print("✓ prepare_image test passed")
+
+
+def test_image_size():
+    """Dimensions come from PNG/JPEG headers and are cached per file."""
+    print("\n=== Testing Header Probing ===")
+    with tempfile.TemporaryDirectory() as tmp:
+        cases = [
+            ("square.png", (512, 512), {}),
+            ("portrait.jpg", (600, 900), {}),
+            ("progressive.jpg", (1280, 720), {"progressive": True}),
+            ("palette.gif", (40, 30), {}),
+        ]
+        for name, size, options in cases:
+            path = os.path.join(tmp, name)
+            Image.new("RGB", size, (10, 31, 68)).save(path, **options)
+            assert image_size(path) == size, f"{name}: expected {size}, got {image_size(path)}"
+
+        # Rewriting the file invalidates the cached size
+        path = os.path.join(tmp, "square.png")
+        Image.new("RGB", (64, 32)).save(path)
+        os.utime(path, (0, 0))
+        assert image_size(path) == (64, 32)
+    print("✓ image_size test passed")
+
+
+def test_add_image_fit_modes():
+    """Moodboard images honour their real aspect ratio when contained or cropped."""
+    print("\n=== Testing Image Fit Modes ===")
+    from pptx_generator import add_image_with_aspect_ratio, new_presentation
+
+    with tempfile.TemporaryDirectory() as tmp:
+        path = os.path.join(tmp, "square.png")
+        Image.new("RGB", (400, 400), (0, 217, 255)).save(path)
+
+        prs, layout = new_presentation()
+        slide = prs.slides.add_slide(layout)
+
+        contained = add_image_with_aspect_ratio(slide, path, 0, 0, BOX_WIDTH, BOX_HEIGHT)
+        assert contained.width == contained.height == BOX_HEIGHT, "Square image should stay square"
+        assert contained.left == (BOX_WIDTH - BOX_HEIGHT) // 2, "Image should be centered horizontally"
+
+        covered = add_image_with_aspect_ratio(slide, path, 0, 0, BOX_WIDTH, BOX_HEIGHT, fit="cover")
+        assert (covered.width, covered.height) == (BOX_WIDTH, BOX_HEIGHT), "Cover should fill the box"
+        assert covered.crop_left == covered.crop_right == 0
+        visible = 1 - covered.crop_top - covered.crop_bottom
+        assert abs(visible - BOX_HEIGHT / BOX_WIDTH) < 1e-4, f"Unexpected crop: {visible}"
+
+        # A misspelt mode is an error, not a silent "contain"
+        from pptx_generator import create_brand_guide_bytes
+
+        colors = {"primary": {"name": "Black", "hex": "#000000"}, "palette": [], "description": "Dark."}
+        for build in (lambda: add_image_with_aspect_ratio(slide, path, 0, 0, BOX_WIDTH, BOX_HEIGHT, fit="cove"),
+                      lambda: create_brand_guide_bytes({"dj_name": "Fit"}, [], colors, image_fit="fill")):
+            try:
+                build()
+            except ValueError:
+                pass
+            else:
+                raise AssertionError("Unknown fit modes should raise ValueError")
+    print("✓ Fit mode test passed")
+
+
+def test_exif_orientation():
+    """Rotated phone photos are measured, resized and embedded upright, keeping their filename."""
+    print("\n=== Testing EXIF Orientation ===")
+    from pptx_generator import add_image_with_aspect_ratio, new_presentation
+
+    clear_cache()
+    with tempfile.TemporaryDirectory() as tmp:
+        # Stored landscape, red on the left; orientation 6 displays it turned clockwise, red on top
+        img = Image.new("RGB", (1600, 800), (0, 0, 255))
+        img.paste((255, 0, 0), (0, 0, 800, 800))
+        exif = Image.Exif()
+        exif[0x0112] = 6
+        path = os.path.join(tmp, "portrait_photo.jpg")
+        img.save(path, exif=exif)
+        assert image_size(path) == (800, 1600), "Header probe should report the displayed size"
+
+        # A later APP1 segment (XMP) is skipped whole, even if its payload looks like a frame header
+        small = io.BytesIO()
+        Image.new("RGB", (300, 100)).save(small, format="JPEG", exif=exif)
+        data = small.getvalue()
+        exif_start = data.index(b"\xff\xe1")
+        exif_end = exif_start + 2 + struct.unpack(">H", data[exif_start + 2:exif_start + 4])[0]
+        payload = b"http://ns.adobe.com/xap/1.0/\x00" + b"\xff\xc0\x00\x11\x08\x00\x07\x00\x05"
+        xmp = b"\xff\xe1" + struct.pack(">H", len(payload) + 2) + payload
+        xmp_path = os.path.join(tmp, "xmp_photo.jpg")
+        with open(xmp_path, "wb") as f:
+            f.write(data[:exif_end] + xmp + data[exif_end:])
+        assert image_size(xmp_path) == (100, 300), image_size(xmp_path)
+
+        for box in ((BOX_WIDTH, BOX_HEIGHT), (BOX_WIDTH * 4, BOX_HEIGHT * 8)):  # downsized, and already fitting
+            with Image.open(prepare_image(path, *box)) as derivative:
+                assert derivative.height > derivative.width, "Derivative should be upright"
+                top = derivative.getpixel((derivative.width // 2, derivative.height // 4))
+                bottom = derivative.getpixel((derivative.width // 2, derivative.height * 3 // 4))
+            assert top[0] > 200 > top[2] and bottom[2] > 200 > bottom[0], (top, bottom)
+
+        prs, layout = new_presentation()
+        slide = prs.slides.add_slide(layout)
+        picture = add_image_with_aspect_ratio(slide, path, 0, 0, BOX_WIDTH, BOX_HEIGHT)
+        assert picture.height > picture.width
+        assert picture._element.nvPicPr.cNvPr.get("descr") == "portrait_photo.jpg"
+    clear_cache()
+    print("✓ EXIF orientation test passed")
+
+
+def test_image_budget_options():
+    """create_brand_guide passes its image size budget and disk cache down to prepare_image."""
+    print("\n=== Testing Image Budget Options ===")
+    import media_cache
+    from pptx_generator import create_brand_guide_bytes, slide_keys
+
+    colors = {"primary": {"name": "Black", "hex": "#000000"}, "palette": [], "description": "Dark."}
+
+    def media_sizes(deck):
+        with zipfile.ZipFile(io.BytesIO(deck)) as package:
+            return [info.file_size for info in package.infolist() if info.filename.startswith("ppt/media/")]
+
+    with tempfile.TemporaryDirectory() as tmp:
+        path = os.path.join(tmp, "noise.jpg")
+        Image.frombytes("RGB", (2000, 1500), os.urandom(2000 * 1500 * 3)).save(path, quality=95)
+        prompts = [{"label": "NOISE", "prompt": "Noise.", "path": path}]
+
+        clear_cache()
+        media_cache.clear_cache()
+        [unbudgeted] = media_sizes(create_brand_guide_bytes({"dj_name": "Budget"}, prompts, colors))
+        budget = unbudgeted * 2 // 3
+
+        cache_dir = os.path.join(tmp, "derivatives")
+        [budgeted] = media_sizes(create_brand_guide_bytes({"dj_name": "Budget"}, prompts, colors,
+                                                          image_max_bytes=budget, image_cache_dir=cache_dir))
+        assert budgeted <= budget < unbudgeted, (budgeted, budget, unbudgeted)
+        assert len(os.listdir(cache_dir)) == 1, "The derivative should be kept on disk"
+
+        # A new process (simulated by clearing the in-memory caches) reuses the derivative on disk
+        clear_cache()
+        media_cache.clear_cache()
+        [rebuilt] = media_sizes(create_brand_guide_bytes({"dj_name": "Budget"}, prompts, colors,
+                                                         image_max_bytes=budget, image_cache_dir=cache_dir))
+        assert rebuilt == budgeted and len(os.listdir(cache_dir)) == 1
+
+        # The budget changes the moodboard, so cached and reused slides must not be shared across budgets
+        keys = [slide_keys({"dj_name": "Budget"}, prompts, colors, image_paths=[path], image_max_bytes=limit)
+                for limit in (None, budget)]
+        assert keys[0]["moodboard"] != keys[1]["moodboard"]
+        assert keys[0]["color_palette"] == keys[1]["color_palette"]
+    clear_cache()
+    media_cache.clear_cache()
+    print("✓ Image budget options test passed")
+
+
+def main():
+    """Run all tests."""
+    test_target_pixels()
+    test_prepare_image()
+    test_image_size()
+    test_add_image_fit_modes()
+    test_exif_orientation()
+    test_image_budget_options()
+    print("\n✓ All image pipeline tests passed!")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,90 @@
+#!/usr/bin/env python3
+"""
+Test script for the cold-start import budget of the skill modules.
+Each entry point is imported in a fresh interpreter under -X importtime.
+
+Usage:
+    python3 test_import_budget.py
+"""
+
+import os
+import subprocess
+import sys
+
+SKILL_DIR = os.path.dirname(os.path.abspath(__file__))
+
+# Entry point -> (cumulative import budget in ms, modules it must not load).
+# Budgets leave 2-3x headroom over a warm-cache import on a laptop; python-pptx
+# alone costs ~170 ms, so an entry point that pulls it in eagerly fails.
+ENTRY_POINTS = {
+    "color_utils": (30, ("pptx", "PIL", "numpy")),
+    "narrative_generator": (15, ("pptx", "PIL", "numpy")),
+    "pptx_generator": (150, ("pptx", "PIL")),
+    "batch_generator": (200, ("pptx", "PIL")),
+    "async_generator": (250, ("pptx", "PIL")),
+    "worker": (200, ("pptx", "PIL")),
+}
+
+
+def import_profile(module):
+    """
+    Import a module in a fresh interpreter.
+
+    Returns:
+        tuple: (cumulative import time in ms, set of top-level packages loaded)
+    """
+    code = f"import sys, {module}; print(' '.join(sorted({{m.split('.')[0] for m in sys.modules}})))"
+    completed = subprocess.run(
+        [sys.executable, "-X", "importtime", "-c", code],
+        capture_output=True, text=True, cwd=SKILL_DIR, check=True,
+    )
+    cumulative_us = None
+    for line in completed.stderr.splitlines():
+        # "import time: self [us] | cumulative | imported package"; top level has no indent
+        fields = line.split("|")
+        if len(fields) == 3 and fields[2].rstrip() == f" {module}":
+            cumulative_us = int(fields[1])
+    assert cumulative_us is not None, f"No -X importtime entry for {module}"
+    return cumulative_us / 1000, set(completed.stdout.split())
+
+
+def test_import_budgets():
+    """Each entry point imports within its budget and without python-pptx or Pillow."""
+    print("\n=== Testing Import Budgets ===")
+    # Compile bytecode first so the budget measures imports, not compilation
+    import_profile("pptx_generator")
+
+    for module, (budget_ms, forbidden) in ENTRY_POINTS.items():
+        # Best of three, to ride out scheduling noise
+        elapsed_ms, loaded = min(import_profile(module) for _ in range(3))
+        print(f"  {module}: {elapsed_ms:.1f} ms (budget {budget_ms} ms)")
+        unexpected = loaded.intersection(forbidden)
+        assert not unexpected, f"import {module} should not load {sorted(unexpected)}"
+        assert elapsed_ms <= budget_ms, f"import {module} took {elapsed_ms:.1f} ms, budget {budget_ms} ms"
+    print("✓ Import budget test passed")
+
+
+def test_lazy_imports_still_render():
+    """The deferred imports load on first use and the deck still builds."""
+    print("\n=== Testing Deck Build After Lazy Import ===")
+    code = (
+        "import io, sys\n"
+        "from pptx_generator import create_brand_guide\n"
+        "assert 'pptx' not in sys.modules\n"
+        "colors = {'primary': {'name': 'Black', 'hex': '#000000'}, 'palette': []}\n"
+        "create_brand_guide({'dj_name': 'Lazy'}, [], colors, io.BytesIO(), renderer='ooxml')\n"
+        "assert 'pptx' in sys.modules\n"
+    )
+    subprocess.run([sys.executable, "-c", code], cwd=SKILL_DIR, check=True)
+    print("✓ Lazy import render test passed")
+
+
+def main():
+    """Run all tests."""
+    test_import_budgets()
+    test_lazy_imports_still_render()
+    print("\n✓ All import budget tests passed!")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,127 @@
+#!/usr/bin/env python3
+"""
+Test script for incremental slide re-rendering.
+Requires python-pptx to be installed.
+
+Usage:
+    python3 test_incremental.py
+"""
+
+import io
+import os
+import sys
+import tempfile
+
+sys.path.insert(0, os.path.dirname(os.path.abspath(__file__)))
+
+from lxml import etree
+from PIL import Image
+from pptx import Presentation
+
+from instrumentation import Tracer
+from pptx_generator import create_brand_guide_bytes
+
+DJ_INPUT = {"dj_name": "Aqua Voyager", "brand_positioning": "otherworldly explorer of sonic depths"}
+
+PILLARS = [{"name": "DOCUMENTED REALITY"}, {"name": "LIQUID GEOMETRY"}]
+
+COLORS = {
+    "primary": {"name": "Deep Ocean Blue", "hex": "#0A1F44"},
+    "palette": [{"name": "Electric Cyan", "hex": "#00D9FF"}, {"name": "White", "hex": "#FFFFFF"}],
+    "description": "Deep and glowing.",
+}
+
+BUILDERS = {"create_visual_pillars_slide", "create_moodboard_slide", "create_color_palette_slide"}
+
+
+def _build(tmp, prompts, colors, previous=None, visual_pillars=PILLARS):
+    tracer = Tracer()
+    deck = create_brand_guide_bytes(DJ_INPUT, prompts, colors, visual_pillars=visual_pillars,
+                                    upload_roots=[tmp], previous_deck=previous, tracer=tracer)
+    return deck, BUILDERS & set(tracer.totals())
+
+
+def _slides(deck):
+    prs = Presentation(io.BytesIO(deck))
+    return [(slide.name.split(" ")[0], etree.tostring(slide.shapes._spTree)) for slide in prs.slides]
+
+
+def _write_images(tmp):
+    paths = []
+    for i, color in enumerate([(10, 31, 68), (0, 217, 255), (139, 0, 255)]):
+        path = os.path.join(tmp, f"render_{i}.png")
+        Image.new("RGB", (1600, 900), color).save(path)
+        paths.append(path)
+    return paths
+
+
+def test_palette_only_rebuild():
+    """Changing colors rebuilds only the palette slide and keeps the others intact."""
+    print("\n=== Testing Palette-Only Rebuild ===")
+    with tempfile.TemporaryDirectory() as tmp:
+        paths = _write_images(tmp)
+        prompts = [{"label": f"IMAGE {i}", "prompt": "Forms.", "path": path} for i, path in enumerate(paths)]
+        first, built = _build(tmp, prompts, COLORS)
+        assert built == BUILDERS
+
+        # Unchanged inputs reuse every slide
+        same, built = _build(tmp, prompts, COLORS, previous=first)
+        assert not built, f"Nothing should be rebuilt, rebuilt {built}"
+        assert _slides(same) == _slides(first)
+
+        new_colors = dict(COLORS, primary={"name": "Bioluminescent Purple", "hex": "#8B00FF"})
+        second, built = _build(tmp, prompts, new_colors, previous=first)
+        assert built == {"create_color_palette_slide"}, f"Only the palette should be rebuilt, rebuilt {built}"
+
+        before, after = _slides(first), _slides(second)
+        assert [name for name, _ in after] == ["visual_pillars", "moodboard", "color_palette"]
+        assert after[:2] == before[:2], "Unchanged slides should be carried over as-is"
+        assert b"#8B00FF" in after[2][1]
+        assert after == _slides(_build(tmp, prompts, new_colors)[0]), "Should match a full rebuild"
+    print("✓ Palette-only rebuild test passed")
+
+
+def test_image_swap_rebuild():
+    """Replacing an image file rebuilds only the moodboard, even under the same path."""
+    print("\n=== Testing Image Swap Rebuild ===")
+    with tempfile.TemporaryDirectory() as tmp:
+        paths = _write_images(tmp)
+        prompts = [{"label": f"IMAGE {i}", "prompt": "Forms.", "path": path} for i, path in enumerate(paths[:2])]
+        first, _ = _build(tmp, prompts, COLORS)
+
+        Image.new("RGB", (1600, 900), (255, 120, 0)).save(paths[0])
+        stat = os.stat(paths[0])
+        os.utime(paths[0], ns=(stat.st_atime_ns, stat.st_mtime_ns + 10 ** 9))
+        second, built = _build(tmp, prompts, COLORS, previous=first)
+        assert built == {"create_moodboard_slide"}, f"Only the moodboard should be rebuilt, rebuilt {built}"
+
+        prs = Presentation(io.BytesIO(second))
+        partnames = [slide.part.partname for slide in prs.slides]
+        assert partnames == [f"/ppt/slides/slide{i}.xml" for i in (1, 2, 3)], partnames
+        assert len([p for p in prs.part.package.iter_parts() if p.partname.startswith("/ppt/media/")]) == 2, \
+            "Images from the replaced moodboard should be dropped"
+    print("✓ Image swap rebuild test passed")
+
+
+def test_added_section():
+    """A section missing from the previous deck is built and put in slide order."""
+    print("\n=== Testing Added Section ===")
+    with tempfile.TemporaryDirectory() as tmp:
+        prompts = [{"label": "IMAGE 1", "prompt": "Forms.", "file_id": None}]
+        first, _ = _build(tmp, prompts, COLORS, visual_pillars=None)
+        second, built = _build(tmp, prompts, COLORS, previous=first)
+        assert built == {"create_visual_pillars_slide"}
+        assert [name for name, _ in _slides(second)] == ["visual_pillars", "moodboard", "color_palette"]
+    print("✓ Added section test passed")
+
+
+def main():
+    """Run all tests."""
+    test_palette_only_rebuild()
+    test_image_swap_rebuild()
+    test_added_section()
+    print("\n✓ All incremental rebuild tests passed!")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,83 @@
+#!/usr/bin/env python3
+"""
+Test script for per-stage instrumentation.
+Requires python-pptx to be installed.
+
+Usage:
+    python3 test_instrumentation.py
+"""
+
+import io
+import json
+import os
+import sys
+import tempfile
+
+sys.path.insert(0, os.path.dirname(os.path.abspath(__file__)))
+
+from PIL import Image
+
+from instrumentation import Tracer, is_tracing, trace
+from pptx_generator import create_brand_guide
+
+COLORS = {
+    "primary": {"name": "Deep Ocean Blue", "hex": "#0A1F44"},
+    "palette": [{"name": "Black", "hex": "#000000"}, {"name": "White", "hex": "#FFFFFF"}],
+    "description": "Deep and glowing.",
+}
+
+
+def test_spans_for_each_stage():
+    """A traced build records a span for discovery, each builder, embedding and save."""
+    print("\n=== Testing Stage Spans ===")
+    with tempfile.TemporaryDirectory() as tmp:
+        image_path = os.path.join(tmp, "render.png")
+        Image.effect_noise((1600, 900), 40).convert("RGB").save(image_path)
+        prompts = [
+            {"label": "RENDER", "prompt": "Noise.", "path": image_path},
+            {"label": "MISSING", "prompt": "Text fallback."},
+        ]
+
+        finished = []
+        tracer = Tracer(trace_memory=True, callback=finished.append)
+        output = io.BytesIO()
+        create_brand_guide({"dj_name": "Aqua Voyager"}, prompts, COLORS, output,
+                           visual_pillars=[{"name": "LIQUID GEOMETRY"}], tracer=tracer)
+
+    spans = {span["name"]: span for span in tracer.to_list()}
+    for name in ("create_brand_guide", "new_presentation", "asset_discovery", "create_visual_pillars_slide",
+                 "create_moodboard_slide", "embed_image", "create_color_palette_slide", "save"):
+        assert name in spans, f"Missing span {name}"
+
+    assert spans["save"]["bytes"] == len(output.getvalue()), "Save span should record bytes written"
+    assert spans["embed_image"]["bytes"] > 0, "Embed span should record embedded bytes"
+    assert spans["embed_image"]["parent"] == "create_moodboard_slide"
+    assert spans["asset_discovery"]["resolved"] == 1
+    assert spans["create_brand_guide"]["peak_bytes"] >= spans["embed_image"]["peak_bytes"] > 0, \
+        "Parent peak should include child peaks"
+    assert len(finished) == len(tracer.spans), "Callback should see every span"
+    assert json.loads(tracer.to_json())[-1]["name"] == "create_brand_guide"
+    print(f"  Stage totals: { {k: round(v * 1000, 1) for k, v in tracer.totals().items()} } ms")
+    print("✓ Stage span test passed")
+
+
+def test_untraced_is_noop():
+    """Without a tracer, trace() is a shared no-op that ignores writes."""
+    print("\n=== Testing Untraced Path ===")
+    assert not is_tracing()
+    with trace("anything") as span:
+        span.bytes = 10
+        span.set(extra=1)
+    assert trace("a") is trace("b"), "No-op span should be shared"
+    print("✓ Untraced path test passed")
+
+
+def main():
+    """Run all tests."""
+    test_spans_for_each_stage()
+    test_untraced_is_noop()
+    print("\n✓ All instrumentation tests passed!")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,106 @@
+#!/usr/bin/env python3
+"""
+Test script for the process-wide media cache.
+Requires python-pptx and Pillow.
+
+Usage:
+    python3 test_media_cache.py
+"""
+
+import builtins
+import io
+import os
+import sys
+import tempfile
+
+sys.path.insert(0, os.path.dirname(os.path.abspath(__file__)))
+
+from PIL import Image
+
+import deck_cache
+import media_cache
+from pptx_generator import create_brand_guide
+
+COLORS = {
+    "primary": {"name": "Deep Ocean Blue", "hex": "#0A1F44"},
+    "palette": [{"name": "Black", "hex": "#000000"}, {"name": "White", "hex": "#FFFFFF"}],
+    "description": "Deep and glowing.",
+}
+
+
+def test_no_rereads_across_decks():
+    """Deck variants in one process neither re-read nor re-hash the same images."""
+    print("\n=== Testing Shared Media Across Decks ===")
+    media_cache.clear_cache()
+    with tempfile.TemporaryDirectory() as tmp:
+        paths = []
+        for i in range(3):
+            path = os.path.join(tmp, f"render_{i}.png")
+            Image.effect_noise((1600, 900), 30 + i).convert("RGB").save(path)
+            paths.append(path)
+        prompts = [{"label": f"IMAGE {i}", "prompt": "Noise.", "path": path} for i, path in enumerate(paths)]
+
+        first = io.BytesIO()
+        create_brand_guide({"dj_name": "Variant A"}, prompts, COLORS, first, upload_roots=[tmp])
+
+        opened = []
+        real_open = builtins.open
+
+        def counting_open(file, *args, **kwargs):
+            if file in paths:
+                opened.append(file)
+            return real_open(file, *args, **kwargs)
+
+        hashed_before = deck_cache._file_digest.cache_info().misses
+        builtins.open = counting_open
+        try:
+            second = io.BytesIO()
+            create_brand_guide({"dj_name": "Variant B"}, prompts, COLORS, second, upload_roots=[tmp])
+        finally:
+            builtins.open = real_open
+
+        assert not opened, f"Images should not be re-read, read {opened}"
+        assert deck_cache._file_digest.cache_info().misses == hashed_before, "Images should not be re-hashed"
+        assert len(media_cache._images) == 3
+    print("✓ Shared media test passed")
+
+
+def test_shared_payload_and_eviction():
+    """Repeat lookups return the same payload; the cache stays within its byte bound."""
+    print("\n=== Testing Media Cache Eviction ===")
+    media_cache.clear_cache()
+    original_limit = media_cache.MAX_MEDIA_BYTES
+    with tempfile.TemporaryDirectory() as tmp:
+        paths = []
+        for i in range(4):
+            path = os.path.join(tmp, f"render_{i}.png")
+            Image.effect_noise((400, 300), 40 + i).convert("RGB").save(path)
+            paths.append(path)
+
+        size = 914400 * 2  # 2 inches
+        first = media_cache.get_image(paths[0], size, size, 150)
+        assert media_cache.get_image(paths[0], size, size, 150) is first
+        assert media_cache.get_image(paths[0], size // 2, size // 2, 150) is not first, \
+            "Different placed sizes need different payloads"
+
+        media_cache.MAX_MEDIA_BYTES = len(first.blob) * 2
+        try:
+            for path in paths:
+                media_cache.get_image(path, size, size, 150)
+            assert media_cache._image_bytes <= media_cache.MAX_MEDIA_BYTES
+            assert sum(len(image.blob) for image in media_cache._images.values()) == media_cache._image_bytes
+        finally:
+            media_cache.MAX_MEDIA_BYTES = original_limit
+            media_cache.clear_cache()
+    print("✓ Media cache eviction test passed")
+
+
+def main():
+    """Run all tests."""
+    test_no_rereads_across_decks()
+    test_shared_payload_and_eviction()
+    print("\n✓ All media cache tests passed!")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,114 @@
+#!/usr/bin/env python3
+"""
+Test script for the moodboard layout engine and multi-slide moodboards.
+Requires python-pptx and Pillow.
+
+Usage:
+    python3 test_moodboard_layout.py
+"""
+
+import io
+import os
+import sys
+import tempfile
+
+sys.path.insert(0, os.path.dirname(os.path.abspath(__file__)))
+
+from PIL import Image
+from pptx import Presentation
+
+from moodboard_layout import SLIDE_HEIGHT, SLIDE_WIDTH, layout_moodboard
+from pptx_generator import create_brand_guide_bytes
+
+DJ_INPUT = {"dj_name": "Aqua Voyager", "brand_positioning": "otherworldly explorer of sonic depths"}
+
+COLORS = {
+    "primary": {"name": "Deep Ocean Blue", "hex": "#0A1F44"},
+    "palette": [{"name": "Electric Cyan", "hex": "#00D9FF"}, {"name": "White", "hex": "#FFFFFF"}],
+    "description": "Deep and glowing.",
+}
+
+
+def _prompts(count):
+    return [{"label": f"IMAGE {i}", "prompt": "Ethereal forms.", "file_id": None} for i in range(count)]
+
+
+def _on_canvas(x, y, width, height):
+    return x >= 0 and y >= 0 and x + width <= SLIDE_WIDTH and y + height <= SLIDE_HEIGHT
+
+
+def test_layout_pages():
+    """Prompts are dealt across pages in order, every box on the slide, narrative on page one."""
+    print("\n=== Testing Moodboard Layout ===")
+    pages = layout_moodboard(4)
+    assert len(pages) == 1, "The standard four prompts fit one slide"
+    assert pages[0]["narrative"] is not None and _on_canvas(*pages[0]["narrative"])
+
+    for count, grid, expected_pages in ((0, (2, 2), 1), (9, (2, 2), 3), (200, (4, 3), 17)):
+        pages = layout_moodboard(count, grid)
+        assert len(pages) == expected_pages
+        indexes = [cell[0] for page in pages for cell in page["cells"]]
+        assert indexes == list(range(count))
+        assert all(_on_canvas(*cell[1:]) for page in pages for cell in page["cells"])
+        assert [page["narrative"] is not None for page in pages] == [True] + [False] * (expected_pages - 1)
+
+    # Cells never overlap the narrative column
+    narrative_x = pages[0]["narrative"][0]
+    assert all(x + width <= narrative_x for _, x, _, width, _ in pages[0]["cells"])
+
+    for grid in ((0, 2), (2, 0), (8, 2), (2, 8)):
+        try:
+            layout_moodboard(4, grid)
+            assert False, f"Grid {grid} should be rejected"
+        except ValueError:
+            pass
+    print("✓ Moodboard layout test passed")
+
+
+def test_paginated_deck():
+    """A long prompt list becomes several numbered moodboard slides with every shape on the slide."""
+    print("\n=== Testing Paginated Moodboard Deck ===")
+    with tempfile.TemporaryDirectory() as tmp:
+        prompts = _prompts(10)
+        for i in range(5):
+            path = os.path.join(tmp, f"render_{i}.png")
+            Image.new("RGB", (320, 180), (40 * i, 80, 160)).save(path)
+            # Each image is used twice, so identical media must be shared
+            prompts[i]["path"] = prompts[i + 5]["path"] = path
+
+        deck = create_brand_guide_bytes(DJ_INPUT, prompts, COLORS, upload_roots=[tmp], moodboard_grid=(2, 2))
+        prs = Presentation(io.BytesIO(deck))
+
+        moodboard = [slide for slide in prs.slides if slide.name.startswith("moodboard ")]
+        assert len(moodboard) == 3 and len(prs.slides) == 4
+        titles = [slide.shapes[0].text_frame.text for slide in moodboard]
+        assert titles == [f"AQUA VOYAGER - OVERALL BRAND MOODBOARD ({n}/3)" for n in (1, 2, 3)]
+
+        for slide in moodboard:
+            for shape in slide.shapes:
+                assert _on_canvas(shape.left, shape.top, shape.width, shape.height), \
+                    f"{shape.name} on {slide.name} is off the slide"
+        assert any(shape.has_text_frame and shape.text_frame.text == "BRAND NARRATIVE"
+                   for shape in moodboard[0].shapes)
+
+        media = {part.partname for part in prs.part.package.iter_parts() if part.partname.startswith("/ppt/media/")}
+        assert len(media) == 5, f"Five distinct images should be embedded once each, found {len(media)}"
+
+        # An edit elsewhere keeps all three moodboard slides
+        recolored = dict(COLORS, description="Now brighter.")
+        rebuilt = create_brand_guide_bytes(DJ_INPUT, prompts, recolored, upload_roots=[tmp], moodboard_grid=(2, 2),
+                                           previous_deck=deck)
+        names = [slide.name.split(" ")[0] for slide in Presentation(io.BytesIO(rebuilt)).slides]
+        assert names == ["moodboard"] * 3 + ["color_palette"]
+    print("✓ Paginated moodboard deck test passed")
+
+
+def main():
+    """Run all tests."""
+    test_layout_pages()
+    test_paginated_deck()
+    print("\n✓ All moodboard layout tests passed!")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,132 @@
+#!/usr/bin/env python3
+"""
+Test script for the direct OOXML renderer.
+Requires python-pptx to be installed.
+
+Usage:
+    python3 test_ooxml_renderer.py
+"""
+
+import io
+import os
+import sys
+import time
+
+sys.path.insert(0, os.path.dirname(os.path.abspath(__file__)))
+
+from lxml import etree
+from pptx import Presentation
+
+import ooxml_renderer
+from ooxml_renderer import render_color_palette_slide, render_visual_pillars_slide
+from pptx_generator import (
+    create_brand_guide,
+    create_color_palette_slide,
+    create_visual_pillars_slide,
+    new_presentation,
+)
+
+COLORS = {
+    "primary": {"name": "Deep Ocean Blue", "hex": "#0A1F44"},
+    "palette": [
+        {"name": "Electric Cyan", "hex": "#00D9FF"},
+        {"name": "Bioluminescent Purple", "hex": "8b00ff"},
+        {"name": "Black", "hex": "#000000"},
+        {"name": "White", "hex": "#FFFFFF"},
+    ],
+    # Escaping, multiple paragraphs, soft line breaks and control characters
+    "description": "Deep & <glowing>\n\nBlue\vcyan\x07 and\ttabs",
+}
+
+PILLARS = [{"name": "Documented Reality"}, "liquid\ngeometry", {"name": "Sensory\vArchaeology"},
+           {"name": "Post-Extractive"}, {"name": "Ignored fifth"}]
+
+
+def _slide_xml(builder, payload):
+    prs, layout = new_presentation()
+    builder(prs, layout, {"dj_name": "Aqua Voyager"}, payload)
+    return etree.tostring(prs.slides[0]._element), prs, layout
+
+
+def _per_slide_seconds(builder, payload, repeats=50):
+    prs, layout = new_presentation()
+    start = time.perf_counter()
+    for _ in range(repeats):
+        builder(prs, layout, {"dj_name": "Aqua Voyager"}, payload)
+    return (time.perf_counter() - start) / repeats
+
+
+def test_identical_xml():
+    """Both renderers produce byte-identical slide XML."""
+    print("\n=== Testing Identical Slide XML ===")
+    for pptx_builder, ooxml_builder, payload in (
+        (create_visual_pillars_slide, render_visual_pillars_slide, PILLARS),
+        (create_color_palette_slide, render_color_palette_slide, COLORS),
+    ):
+        expected, _, _ = _slide_xml(pptx_builder, payload)
+        actual, prs, _ = _slide_xml(ooxml_builder, payload)
+        assert actual == expected, f"{ooxml_builder.__name__} XML differs from {pptx_builder.__name__}"
+
+        # Shapes built from XML remain fully usable through the object API
+        shapes = prs.slides[0].shapes
+        assert len({shape.shape_id for shape in shapes}) == len(shapes)
+        shapes.add_textbox(0, 0, 100, 100).text_frame.text = "added later"
+    print("✓ Identical XML test passed")
+
+
+def test_ooxml_deck():
+    """A full deck renders with renderer="ooxml" and reopens cleanly."""
+    print("\n=== Testing OOXML Renderer Deck ===")
+    buffer = io.BytesIO()
+    prompts = [{"label": "IMAGE 1", "prompt": "Ethereal forms.", "file_id": None}]
+    create_brand_guide({"dj_name": "Aqua Voyager"}, prompts, COLORS, buffer,
+                       visual_pillars=PILLARS, renderer="ooxml")
+    prs = Presentation(io.BytesIO(buffer.getvalue()))
+    assert len(prs.slides) == 3
+    assert prs.slides[2].shapes[0].text_frame.text == "BRAND COLOR PALETTE"
+
+    try:
+        create_brand_guide({}, prompts, COLORS, io.BytesIO(), renderer="svg")
+        assert False, "Unknown renderer should raise"
+    except ValueError:
+        pass
+    print("✓ OOXML deck test passed")
+
+
+def test_ooxml_faster():
+    """The template renderer builds each slide's shapes in a single XML parse."""
+    print("\n=== Testing OOXML Renderer Speed ===")
+    parse_xml = ooxml_renderer.parse_xml
+    for pptx_builder, ooxml_builder, payload in (
+        (create_visual_pillars_slide, render_visual_pillars_slide, PILLARS),
+        (create_color_palette_slide, render_color_palette_slide, COLORS),
+    ):
+        _per_slide_seconds(ooxml_builder, payload, repeats=2)  # Warm-up
+        object_api = _per_slide_seconds(pptx_builder, payload)
+        templates = _per_slide_seconds(ooxml_builder, payload)
+        # Typically 5-15x; timings vary too much across machines to assert on
+        print(f"  {ooxml_builder.__name__}: {object_api * 1000:.2f} ms -> {templates * 1000:.2f} ms "
+              f"({object_api / templates:.1f}x)")
+
+        parses = []
+        ooxml_renderer.parse_xml = lambda xml: parses.append(xml) or parse_xml(xml)
+        try:
+            _, prs, _ = _slide_xml(ooxml_builder, payload)
+        finally:
+            ooxml_renderer.parse_xml = parse_xml
+        _, expected, _ = _slide_xml(pptx_builder, payload)
+        assert len(parses) == 1, f"{ooxml_builder.__name__} parsed {len(parses)} times"
+        assert len(prs.slides[0].shapes) == len(expected.slides[0].shapes) > 1
+    print("✓ OOXML speed test passed")
+
+
+def main():
+    """Run all tests."""
+    test_identical_xml()
+    test_ooxml_deck()
+    test_ooxml_faster()
+    print("\n✓ All OOXML renderer tests passed!")
+
+
+if __name__ == "__main__":
+    main()
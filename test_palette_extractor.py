@@ -0,0 +1,91 @@
+#!/usr/bin/env python3
+"""
+Test script for palette extraction from moodboard images.
+Requires NumPy and Pillow.
+
+Usage:
+    python3 test_palette_extractor.py
+"""
+
+import os
+import sys
+import tempfile
+import time
+
+sys.path.insert(0, os.path.dirname(os.path.abspath(__file__)))
+
+import numpy as np
+from PIL import Image
+
+from palette_extractor import extract_palette, reservoir_sample
+
+# Brand colors painted into the synthetic moodboard renders
+BRAND_COLORS = [(10, 31, 68), (0, 217, 255), (139, 0, 255), (27, 77, 92)]
+
+
+def _write_render(path, color, seed):
+    """Write a 2K render: a brand-colored block on a near-black background, with noise."""
+    pixels = np.full((1152, 2048, 3), (5, 5, 10), dtype=np.int16)
+    pixels[200:900, 300:1700] = color
+    noise = np.random.default_rng(seed).integers(-6, 7, pixels.shape)
+    Image.fromarray((pixels + noise).clip(0, 255).astype(np.uint8)).save(path)
+
+
+def _distance(hex_color, rgb):
+    value = tuple(int(hex_color[i:i + 2], 16) for i in (1, 3, 5))
+    return max(abs(a - b) for a, b in zip(value, rgb))
+
+
+def test_reservoir_sample():
+    """The reservoir never exceeds its size and keeps short inputs whole."""
+    print("\n=== Testing Reservoir Sample ===")
+    rng = np.random.default_rng(0)
+    chunks = [np.full((1000, 3), i, dtype=np.uint8) for i in range(10)]
+    sample = reservoir_sample(chunks, 500, rng)
+    assert sample.shape == (500, 3)
+    # Every chunk should be represented in a uniform sample
+    assert len(np.unique(sample[:, 0])) == 10, "Sample should cover all chunks"
+
+    short = reservoir_sample([np.zeros((20, 3), dtype=np.uint8)], 500, rng)
+    assert short.shape == (20, 3)
+    print("✓ reservoir_sample test passed")
+
+
+def test_extract_palette():
+    """Four 2K renders yield the brand colors in the colors schema."""
+    print("\n=== Testing Palette Extraction ===")
+    with tempfile.TemporaryDirectory() as tmp:
+        paths = []
+        for i, color in enumerate(BRAND_COLORS):
+            path = os.path.join(tmp, f"render_{i}.{'jpg' if i % 2 else 'png'}")
+            _write_render(path, color, seed=i)
+            paths.append(path)
+
+        start = time.perf_counter()
+        colors = extract_palette(paths, n_colors=7)
+        elapsed = time.perf_counter() - start
+        print(f"  Extracted in {elapsed * 1000:.0f} ms: {colors['primary']} + {len(colors['palette'])} colors")
+
+        assert set(colors) == {"primary", "palette", "description"}
+        assert _distance(colors["primary"]["hex"], (139, 0, 255)) < 12, "Most vivid color should be primary"
+        assert [c["hex"] for c in colors["palette"][-2:]] == ["#000000", "#FFFFFF"]
+        assert len(colors["palette"]) <= 7
+
+        extracted = [c["hex"] for c in colors["palette"]] + [colors["primary"]["hex"]]
+        for color in BRAND_COLORS:
+            assert any(_distance(h, color) < 12 for h in extracted), f"Missing brand color {color}"
+
+        assert extract_palette(paths, sample_size=5000) == extract_palette(paths, sample_size=5000), \
+            "Extraction should be deterministic for a given seed"
+    print("✓ extract_palette test passed")
+
+
+def main():
+    """Run all tests."""
+    test_reservoir_sample()
+    test_extract_palette()
+    print("\n✓ All palette extraction tests passed!")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,130 @@
+#!/usr/bin/env python3
+"""
+Test script for the Pillow slide preview rasteriser.
+Requires python-pptx and Pillow.
+
+Usage:
+    python3 test_preview.py
+"""
+
+import os
+import sys
+import tempfile
+import time
+
+sys.path.insert(0, os.path.dirname(os.path.abspath(__file__)))
+
+from PIL import Image
+
+import preview
+from pptx_generator import create_brand_guide_bytes
+
+DJ_INPUT = {"dj_name": "Aqua Voyager", "brand_positioning": "otherworldly explorer of sonic depths"}
+
+COLORS = {
+    "primary": {"name": "Deep Ocean Blue", "hex": "#0A1F44"},
+    "palette": [{"name": "Electric Cyan", "hex": "#00D9FF"}, {"name": "White", "hex": "#FFFFFF"}],
+    "description": "Deep and glowing.",
+}
+
+PILLARS = [{"name": "DOCUMENTED REALITY"}, {"name": "LIQUID GEOMETRY"}]
+
+
+def _deck(tmp):
+    prompts = []
+    for i, color in enumerate([(200, 30, 30), (30, 200, 30), (30, 30, 200), (200, 200, 30)]):
+        path = os.path.join(tmp, f"render_{i}.jpg")
+        Image.new("RGB", (1600, 900), color).save(path)
+        prompts.append({"label": f"IMAGE {i}", "prompt": "Ethereal forms.", "path": path})
+    return create_brand_guide_bytes(DJ_INPUT, prompts, COLORS, visual_pillars=PILLARS, upload_roots=[tmp])
+
+
+def _close(pixel, expected, tolerance=12):
+    return all(abs(a - b) <= tolerance for a, b in zip(pixel, expected))
+
+
+def test_previews_match_layout():
+    """Fills and pictures land where the deck places them."""
+    print("\n=== Testing Preview Content ===")
+    preview.clear_cache()
+    with tempfile.TemporaryDirectory() as tmp:
+        pillars, moodboard, palette = preview.render_previews(_deck(tmp), width=640)
+
+    assert pillars.size == moodboard.size == palette.size == (640, 360)
+    # Primary color block: 0.4"-5.6" x 1.15"-3.45"; its lower centre is clear of text
+    assert _close(palette.getpixel((192, 190)), (10, 31, 68))
+    # First moodboard image box starts 0.35" below the first cell; its centre shows the picture
+    assert _close(moodboard.getpixel((90, 120)), (200, 30, 30))
+    # Pillar grid divider line is drawn
+    assert _close(pillars.getpixel((200, 208)), (200, 200, 200), tolerance=40)
+    # Titles are drawn as dark text on white
+    assert pillars.crop((32, 20, 300, 50)).convert("L").getextrema()[0] < 60
+    print("✓ Preview content test passed")
+
+
+def test_font_fallback():
+    """Pillow versions without sized default fonts still render previews."""
+    print("\n=== Testing Font Fallback ===")
+    from PIL import ImageFont
+
+    real_load_default = ImageFont.load_default
+
+    def load_default(*args, **kwargs):
+        if args or kwargs:
+            raise TypeError("load_default() got an unexpected keyword argument 'size'")
+        return real_load_default()
+
+    preview._font.cache_clear()
+    preview._glyph.cache_clear()
+    ImageFont.load_default = load_default
+    try:
+        with tempfile.TemporaryDirectory() as tmp:
+            pillars, _, _ = preview.render_previews(_deck(tmp), width=640)
+    finally:
+        ImageFont.load_default = real_load_default
+        preview._font.cache_clear()
+        preview._glyph.cache_clear()
+
+    assert pillars.crop((32, 20, 300, 50)).convert("L").getextrema()[0] < 60, "Titles should still be drawn"
+    print("✓ Font fallback test passed")
+
+
+def test_preview_speed_and_cache():
+    """Repeat previews reuse decoded pictures instead of decoding them again."""
+    print("\n=== Testing Preview Cache ===")
+    preview.clear_cache()
+    with tempfile.TemporaryDirectory() as tmp:
+        deck = _deck(tmp)
+        start = time.perf_counter()
+        preview.render_previews(deck)
+        cold = time.perf_counter() - start
+        decoded = len(preview._decoded)
+
+        real_open = Image.open
+        opened = []
+        Image.open = lambda *args, **kwargs: opened.append(1) or real_open(*args, **kwargs)
+        try:
+            start = time.perf_counter()
+            preview.render_previews(deck)
+            warm = time.perf_counter() - start
+        finally:
+            Image.open = real_open
+
+        paths = preview.save_previews(deck, os.path.join(tmp, "previews"))
+        assert [os.path.basename(path) for path in paths] == ["slide_01.png", "slide_02.png", "slide_03.png"]
+
+    print(f"  Cold: {cold * 1000:.0f} ms, warm: {warm * 1000:.0f} ms per deck")
+    assert decoded == 4 and not opened, "Pictures should be decoded once"
+    print("✓ Preview cache test passed")
+
+
+def main():
+    """Run all tests."""
+    test_previews_match_layout()
+    test_font_fallback()
+    test_preview_speed_and_cache()
+    print("\n✓ All preview tests passed!")
+
+
+if __name__ == "__main__":
+    main()
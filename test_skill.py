@@ -159,6 +159,71 @@ def test_pptx_generator():
     return result
 
 
+def test_template_cache():
+    """Test that decks are cloned from a cached, pre-sized base template."""
+    print("\n=== Testing Template Cache ===")
+    from pptx_generator import load_base_template, new_presentation
+
+    base = load_base_template()
+    assert load_base_template() is base, "Base template should be parsed once per process"
+    assert len(base.slides) == 0 and len(base.slide_masters[0].slide_layouts) == 11  # fill python-pptx's caches
+
+    prs_a, layout_a = new_presentation()
+    prs_b, _ = new_presentation()
+    prs_a.slides.add_slide(layout_a)
+    prs_a.slides.add_slide(layout_a)
+    assert len(prs_a.slides) == 2 and len(prs_b.slides) == 0, "Clones should be independent"
+    partnames = [str(part.partname) for part in prs_a.part.package.iter_parts()]
+    assert len(partnames) == len(set(partnames)), "Cloned parts should have unique names"
+    assert len(base.slides) == 0, "Base template should never be modified"
+    assert (prs_b.slide_width, prs_b.slide_height) == (9144000, 5143500), "Clones should be 16:9"
+    # Collections on a clone wrap the clone's own XML, not detached copies
+    master = prs_b.slide_masters[0]
+    assert prs_b.slides._sldIdLst.getroottree().getroot() is prs_b._element
+    assert prs_b.slide_masters._sldMasterIdLst.getroottree().getroot() is prs_b._element
+    assert master.slide_layouts._sldLayoutIdLst.getroottree().getroot() is master._element
+    assert layout_a.part.package is prs_a.part.package
+    assert layout_a.name == "Blank"
+
+    # Custom templates keep their layouts but drop any sample slides
+    template_path = "test_template.pptx"
+    prs_a.save(template_path)
+    try:
+        custom, custom_layout = new_presentation(template_path)
+        assert len(custom.slides) == 0, "Template slides should be stripped"
+        custom.slides.add_slide(custom_layout)
+        assert str(custom.slides[0].part.partname) == "/ppt/slides/slide1.xml"
+    finally:
+        os.remove(template_path)
+    print("✓ Template cache test passed")
+
+
+def test_in_memory_output():
+    """Test writing decks to streams and bytes without touching disk."""
+    print("\n=== Testing In-Memory Output ===")
+    import io
+    import zipfile
+    from pptx_generator import create_brand_guide, create_brand_guide_bytes
+    from instrumentation import measure_peak_memory
+
+    colors = {
+        "primary": {"name": "Deep Ocean Blue", "hex": "#0A1F44"},
+        "palette": [{"name": "Black", "hex": "#000000"}, {"name": "White", "hex": "#FFFFFF"}],
+        "description": "Deep and glowing.",
+    }
+    prompts = [{"label": "JELLYFISH", "prompt": "Bioluminescent jellyfish.", "file_id": None}]
+
+    stream = io.BytesIO()
+    assert create_brand_guide({"dj_name": "Aqua Voyager"}, prompts, colors, stream) is stream
+    assert zipfile.is_zipfile(io.BytesIO(stream.getvalue())), "Stream should hold a valid .pptx"
+
+    deck, stats = measure_peak_memory(create_brand_guide_bytes, {"dj_name": "Aqua Voyager"}, prompts, colors)
+    assert isinstance(deck, bytes) and deck[:2] == b"PK", "Should return .pptx bytes"
+    assert stats["peak_bytes"] > 0 and stats["seconds"] > 0
+    print(f"  Deck: {len(deck):,} bytes, peak heap: {stats['peak_bytes']:,} bytes")
+    print("✓ In-memory output test passed")
+
+
 def main():
     """Run all tests."""
     print("=" * 60)
@@ -169,6 +234,8 @@ def main():
         test_color_utils()
         test_narrative_generator()
         output_file = test_pptx_generator()
+        test_template_cache()
+        test_in_memory_output()
 
         print("\n" + "=" * 60)
         print("✓ ALL TESTS PASSED")
@@ -0,0 +1,208 @@
+#!/usr/bin/env python3
+"""
+Test script for streaming image ingestion.
+Requires python-pptx and Pillow.
+
+Usage:
+    python3 test_streaming_media.py
+"""
+
+import os
+import sys
+import tempfile
+import threading
+import time
+import tracemalloc
+import zipfile
+
+sys.path.insert(0, os.path.dirname(os.path.abspath(__file__)))
+
+from PIL import Image
+
+import image_pipeline
+import media_cache
+from pptx_generator import create_brand_guide
+
+COLORS = {
+    "primary": {"name": "Deep Ocean Blue", "hex": "#0A1F44"},
+    "palette": [{"name": "Black", "hex": "#000000"}, {"name": "White", "hex": "#FFFFFF"}],
+    "description": "Deep and glowing.",
+}
+
+
+def _write_renders(directory, count, size=(800, 600)):
+    """Incompressible PNG renders, about 1.4 MB each."""
+    paths = []
+    for i in range(count):
+        path = os.path.join(directory, f"render_{i:02d}.png")
+        Image.frombytes("RGB", size, os.urandom(size[0] * size[1] * 3)).save(path, compress_level=1)
+        paths.append(path)
+    return paths
+
+
+def _prompts(paths):
+    return [{"label": f"IMAGE {i}", "prompt": "Noise.", "path": path} for i, path in enumerate(paths)]
+
+
+def test_originals_stream_into_deck():
+    """Original images are copied from disk when saving, byte for byte, without being held in memory."""
+    print("\n=== Testing Streamed Originals ===")
+    media_cache.clear_cache()
+    with tempfile.TemporaryDirectory() as tmp:
+        paths = _write_renders(tmp, 10)
+        total_bytes = sum(os.path.getsize(path) for path in paths)
+        output = os.path.join(tmp, "deck.pptx")
+
+        tracemalloc.start()
+        try:
+            create_brand_guide({"dj_name": "Stream"}, _prompts(paths), COLORS, output,
+                               upload_roots=[tmp], image_dpi=None)
+            peak = tracemalloc.get_traced_memory()[1]
+        finally:
+            tracemalloc.stop()
+        print(f"  Peak traced memory: {peak / 1e6:.1f} MB for {total_bytes / 1e6:.1f} MB of images")
+        assert peak < total_bytes / 3, "Image bytes should not accumulate in memory"
+        assert media_cache._image_bytes == 0
+
+        with zipfile.ZipFile(output) as deck:
+            assert deck.testzip() is None
+            media = sorted(name for name in deck.namelist() if name.startswith("ppt/media/"))
+            embedded = sorted(deck.read(name) for name in media)
+        sources = []
+        for path in paths:
+            with open(path, "rb") as f:
+                sources.append(f.read())
+        assert embedded == sorted(sources)
+
+        # Streaming writes the same bytes as writing the whole blob
+        with open(output, "rb") as f:
+            streamed = f.read()
+        write_to = media_cache.FileImagePart.write_to
+        media_cache.FileImagePart.write_to = None
+        try:
+            create_brand_guide({"dj_name": "Stream"}, _prompts(paths), COLORS, output,
+                               upload_roots=[tmp], image_dpi=None)
+        finally:
+            media_cache.FileImagePart.write_to = write_to
+        with open(output, "rb") as f:
+            assert f.read() == streamed
+    print("✓ Streamed originals test passed")
+
+
+def test_changed_file_is_detected():
+    """A file replaced between building and saving a deck is not silently embedded."""
+    print("\n=== Testing Changed Source Detection ===")
+    media_cache.clear_cache()
+    with tempfile.TemporaryDirectory() as tmp:
+        path, = _write_renders(tmp, 1, size=(64, 64))
+        image = media_cache.get_image(path, 914400, 914400, None)
+        assert isinstance(image, media_cache.FileImage) and image.ext == "png" and image.size == (64, 64)
+
+        os.utime(path, ns=(0, 0))
+        try:
+            image.blob
+        except ValueError:
+            pass
+        else:
+            raise AssertionError("A changed file should raise ValueError")
+    media_cache.clear_cache()
+    print("✓ Changed source test passed")
+
+
+def test_rewritten_file_is_reembedded():
+    """A file rewritten with the same bytes gets a fresh payload, and a stale one is never related."""
+    print("\n=== Testing Rewritten Source ===")
+    media_cache.clear_cache()
+    with tempfile.TemporaryDirectory() as tmp:
+        path, = _write_renders(tmp, 1, size=(64, 64))
+        output = os.path.join(tmp, "deck.pptx")
+        blob_reads = []
+        real_blob = media_cache.FileImage.blob
+        media_cache.FileImage.blob = property(lambda image: blob_reads.append(1) or real_blob.fget(image))
+        try:
+            for _ in range(2):
+                create_brand_guide({"dj_name": "Stream"}, _prompts([path]), COLORS, output,
+                                   upload_roots=[tmp], image_dpi=None)
+                with zipfile.ZipFile(output) as deck:
+                    assert any(name.startswith("ppt/media/") for name in deck.namelist())
+                # Same bytes, new modification time (a re-upload or touch)
+                os.utime(path, ns=(0, os.stat(path).st_mtime_ns + 10 ** 9))
+        finally:
+            media_cache.FileImage.blob = real_blob
+        assert not blob_reads, "Building a deck should never read a file-backed image whole"
+
+        stale = media_cache.FileImage(path)
+        os.utime(path, ns=(0, 0))
+        from pptx_generator import new_presentation
+
+        prs, layout = new_presentation()
+        slide = prs.slides.add_slide(layout)
+        rels_before = len(slide.part.rels)
+        try:
+            media_cache.add_picture(slide, stale, 0, 0, 914400, 914400)
+        except ValueError:
+            pass
+        else:
+            raise AssertionError("A changed file should raise ValueError")
+        assert len(slide.part.rels) == rels_before, "A stale image should not be related to the slide"
+    media_cache.clear_cache()
+    print("✓ Rewritten source test passed")
+
+
+def test_decode_backpressure():
+    """No more images are decoded at once than the configured cap."""
+    print("\n=== Testing Decode Cap ===")
+    image_pipeline.clear_cache()
+    real_resample = image_pipeline._resample
+    active = []
+    peak = [0]
+    lock = threading.Lock()
+
+    def slow_resample(*args):
+        with lock:
+            active.append(1)
+            peak[0] = max(peak[0], len(active))
+        time.sleep(0.02)
+        try:
+            return real_resample(*args)
+        finally:
+            with lock:
+                active.pop()
+
+    with tempfile.TemporaryDirectory() as tmp:
+        paths = _write_renders(tmp, 8, size=(400, 300))
+        image_pipeline.set_max_decodes(2)
+        image_pipeline._resample = slow_resample
+        try:
+            threads = [threading.Thread(target=image_pipeline.prepare_image, args=(path, 914400, 914400))
+                       for path in paths]
+            for thread in threads:
+                thread.start()
+            for thread in threads:
+                thread.join()
+        finally:
+            image_pipeline._resample = real_resample
+            image_pipeline.set_max_decodes(image_pipeline.DEFAULT_MAX_DECODES)
+            image_pipeline.clear_cache()
+
+    assert peak[0] == 2, f"Expected at most 2 decodes in flight, saw {peak[0]}"
+    try:
+        image_pipeline.set_max_decodes(0)
+    except ValueError:
+        pass
+    else:
+        raise AssertionError("A cap below 1 should be rejected")
+    print("✓ Decode cap test passed")
+
+
+def main():
+    """Run all tests."""
+    test_originals_stream_into_deck()
+    test_changed_file_is_detected()
+    test_rewritten_file_is_reembedded()
+    test_decode_backpressure()
+    print("\n✓ All streaming media tests passed!")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,92 @@
+#!/usr/bin/env python3
+"""
+Test script for font-metric text fitting.
+Requires python-pptx to be installed.
+
+Usage:
+    python3 test_text_metrics.py
+"""
+
+import json
+import os
+import sys
+import time
+
+SKILL_DIR = os.path.dirname(os.path.abspath(__file__))
+sys.path.insert(0, SKILL_DIR)
+
+from lxml import etree
+
+from ooxml_renderer import render_color_palette_slide
+from pptx_generator import create_color_palette_slide, new_presentation
+from text_metrics import INSET_X, fit_text, glyph_widths, text_width, wrap_text
+
+COLORS = {
+    "primary": {"name": "Deep Ocean Blue", "hex": "#0A1F44"},
+    "palette": [{"name": "Electric Cyan", "hex": "#00D9FF"}, {"name": "White", "hex": "#FFFFFF"}],
+}
+
+with open(os.path.join(SKILL_DIR, "aqua_voyager_colors.json"), encoding="utf-8") as f:
+    DESCRIPTION = json.load(f)["description"]
+
+
+def test_glyph_widths():
+    """Widths come from the Helvetica AFM metrics, with accents taking their base letter's width."""
+    print("\n=== Testing Glyph Widths ===")
+    widths = glyph_widths("Helvetica Neue")
+    assert widths is glyph_widths("Helvetica Neue"), "Tables should be built once"
+    assert widths.itemsize == 2
+    assert (widths[ord("i")], widths[ord("W")], widths[ord("é")]) == (222, 944, 556)
+    assert glyph_widths("Helvetica Neue", bold=True)[ord("b")] == 611
+    assert abs(text_width("Hello World", 10) - 51.67) < 1e-9
+    assert text_width("界", 10) == 10.0, "Wide glyphs are a full em"
+    print("✓ Glyph width test passed")
+
+
+def test_wrap_and_fit():
+    """Wrapped lines fit their width, and fitting shrinks only as far as needed."""
+    print("\n=== Testing Wrap and Fit ===")
+    width = 5.2 * 72 - 2 * INSET_X
+    lines = wrap_text(DESCRIPTION, width, 8.5)
+    assert " ".join(line for line in lines if line) == " ".join(DESCRIPTION.split())
+    assert all(text_width(line, 8.5) <= width for line in lines)
+
+    # Short text keeps its size; longer text gets smaller, never below min_size
+    assert fit_text("Deep and glowing.", 5.2 * 72, 1.35 * 72, 8.5, 6.5) == (8.5, True)
+    sizes = [fit_text(DESCRIPTION[:length], 5.2 * 72, 1.35 * 72, 8.5, 6.5)[0] for length in (200, 400, 682)]
+    assert sizes == sorted(sizes, reverse=True) and sizes[-1] < 8.5
+    assert fit_text(DESCRIPTION * 3, 5.2 * 72, 1.35 * 72, 8.5, 6.5) == (6.5, False)
+
+    start = time.perf_counter()
+    for _ in range(100):
+        fit_text(DESCRIPTION, 5.2 * 72, 1.35 * 72, 8.5, 6.5)
+    per_fit = (time.perf_counter() - start) / 100
+    print(f"  fit_text on {len(DESCRIPTION)} characters: {per_fit * 1e6:.0f} µs")
+    print("✓ Wrap and fit test passed")
+
+
+def test_renderers_shrink_blurb():
+    """Both palette renderers shrink a long description identically."""
+    print("\n=== Testing Description Fitting in Both Renderers ===")
+    colors = dict(COLORS, description=DESCRIPTION + "\n\n" + DESCRIPTION[:300])
+    xml = []
+    for builder in (create_color_palette_slide, render_color_palette_slide):
+        prs, layout = new_presentation()
+        builder(prs, layout, {"dj_name": "Aqua Voyager"}, colors)
+        blurb = prs.slides[0].shapes[-1]
+        assert blurb.text_frame.paragraphs[0].font.size.pt < 8.5
+        xml.append(etree.tostring(prs.slides[0]._element))
+    assert xml[0] == xml[1]
+    print("✓ Description fitting test passed")
+
+
+def main():
+    """Run all tests."""
+    test_glyph_widths()
+    test_wrap_and_fit()
+    test_renderers_shrink_blurb()
+    print("\n✓ All text metrics tests passed!")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,306 @@
+#!/usr/bin/env python3
+"""
+Test script for the manifest-based skill upload and skill lookup.
+Runs offline, against a fake skills client and a local stand-in API server.
+Requires the anthropic SDK for the server tests.
+
+Usage:
+    python3 test_upload_skill.py
+"""
+
+from http.server import BaseHTTPRequestHandler, ThreadingHTTPServer
+from pathlib import Path
+from types import SimpleNamespace
+from urllib.parse import parse_qs, urlparse
+import contextlib
+import io
+import json
+import os
+import sys
+import tempfile
+import threading
+
+sys.path.insert(0, os.path.dirname(os.path.abspath(__file__)))
+
+import upload_skill
+
+
+class FakeSkillsClient:
+    """In-memory stand-in for client.beta.skills that records every call."""
+
+    def __init__(self):
+        self.skills = {}
+        self.calls = []
+        versions = SimpleNamespace(create=self._create_version)
+        skills = SimpleNamespace(list=self._list, create=self._create, retrieve=self._retrieve, versions=versions)
+        self.beta = SimpleNamespace(skills=skills)
+
+    def _list(self, **params):
+        self.calls.append("list")
+        return list(self.skills.values())
+
+    def _create(self, display_title, files, betas):
+        self.calls.append("create")
+        skill = SimpleNamespace(id=f"skill_{len(self.skills) + 1}", display_title=display_title,
+                                latest_version="1", files=files)
+        self.skills[skill.id] = skill
+        return skill
+
+    def _create_version(self, skill_id, files, betas):
+        self.calls.append("versions.create")
+        skill = self.skills[skill_id]
+        skill.latest_version = str(int(skill.latest_version) + 1)
+        skill.files = files
+        return SimpleNamespace(version=skill.latest_version)
+
+    def _retrieve(self, skill_id, betas):
+        self.calls.append("retrieve")
+        if skill_id not in self.skills:
+            error = LookupError(skill_id)
+            error.status_code = 404
+            raise error
+        return self.skills[skill_id]
+
+
+class SkillsAPIServer(ThreadingHTTPServer):
+    """
+    Local stand-in for the skills endpoints the lookup uses (list and retrieve).
+
+    Records each request's path and the client port it arrived on, and can
+    answer the first few requests with a retryable 503.
+    """
+
+    daemon_threads = True
+
+    def __init__(self, skills, page_size=3, fail_first=0, status=None):
+        super().__init__(("127.0.0.1", 0), _SkillsAPIHandler)
+        self.skills = skills
+        self.page_size = page_size
+        self.fail_first = fail_first
+        self.status = status
+        self.requests = []
+        self.client_ports = set()
+        self.thread = threading.Thread(target=self.serve_forever, daemon=True)
+
+    @property
+    def url(self):
+        return f"http://127.0.0.1:{self.server_address[1]}"
+
+    def __enter__(self):
+        self.thread.start()
+        return self
+
+    def __exit__(self, *exc):
+        self.shutdown()
+        self.server_close()
+
+
+class _SkillsAPIHandler(BaseHTTPRequestHandler):
+    protocol_version = "HTTP/1.1"
+
+    def log_message(self, *args):
+        pass
+
+    def _reply(self, status, body, headers=()):
+        payload = json.dumps(body).encode()
+        self.send_response(status)
+        self.send_header("Content-Type", "application/json")
+        self.send_header("Content-Length", str(len(payload)))
+        for name, value in headers:
+            self.send_header(name, value)
+        self.end_headers()
+        self.wfile.write(payload)
+
+    def do_GET(self):
+        server = self.server
+        url = urlparse(self.path)
+        server.requests.append(url.path + ("?" + url.query if url.query else ""))
+        server.client_ports.add(self.client_address[1])
+
+        if server.fail_first:
+            server.fail_first -= 1
+            return self._reply(503, {"type": "error", "error": {"type": "overloaded_error", "message": "busy"}},
+                               [("retry-after-ms", "1")])
+        if server.status:
+            return self._reply(server.status, {"type": "error", "error": {"type": "error", "message": "denied"}})
+
+        if url.path == "/v1/skills":
+            query = parse_qs(url.query)
+            start = int(query.get("page", ["0"])[0])
+            end = start + server.page_size
+            return self._reply(200, {
+                "data": server.skills[start:end],
+                "has_more": end < len(server.skills),
+                "next_page": str(end) if end < len(server.skills) else None,
+            })
+
+        skill_id = url.path.rsplit("/", 1)[-1]
+        for skill in server.skills:
+            if skill["id"] == skill_id:
+                return self._reply(200, skill)
+        return self._reply(404, {"type": "error", "error": {"type": "not_found_error", "message": skill_id}})
+
+
+def _api_skills(count, title_at=None):
+    skills = [{"id": f"skill_{i:02d}", "type": "skill", "source": "custom", "latest_version": "1",
+               "display_title": f"Other Skill {i}"} for i in range(count)]
+    if title_at is not None:
+        skills[title_at]["display_title"] = upload_skill.SKILL_TITLE
+    return skills
+
+
+def _find(client, cache_path):
+    with contextlib.redirect_stdout(io.StringIO()):
+        return upload_skill.find_existing_skill(client, upload_skill.SKILL_TITLE, cache_path)
+
+
+def _skill_folder(tmp):
+    skill_dir = Path(tmp)
+    (skill_dir / "SKILL.md").write_text("# Skill\n")
+    (skill_dir / "pptx_generator.py").write_text("print('deck')\n")
+    (skill_dir / "example_colors.json").write_text("{}")  # example data, never uploaded
+    (skill_dir / "__pycache__").mkdir()
+    return skill_dir
+
+
+def _upload(client, skill_dir, **kwargs):
+    with contextlib.redirect_stdout(io.StringIO()):
+        return upload_skill.upload_skill(client, skill_dir, **kwargs)
+
+
+def test_collect_skill_files():
+    """Files are read in a stable order, without excluded files, the manifest or leftover temporary files."""
+    print("\n=== Testing File Collection ===")
+    with tempfile.TemporaryDirectory() as tmp:
+        skill_dir = _skill_folder(tmp)
+        (skill_dir / upload_skill.MANIFEST_NAME).write_text("{}")
+        (skill_dir / f"{upload_skill.MANIFEST_NAME}.k2j8x1.tmp").write_text("{")  # left by an interrupted run
+        files = upload_skill.collect_skill_files(skill_dir, max_workers=2)
+
+    assert files == [
+        ("dj-brand-guide-generator/SKILL.md", b"# Skill\n", "text/markdown"),
+        ("dj-brand-guide-generator/pptx_generator.py", b"print('deck')\n", "text/x-python"),
+    ]
+    print("✓ File collection test passed")
+
+
+def test_unchanged_upload_is_skipped():
+    """A second run with nothing changed creates no new version."""
+    print("\n=== Testing Manifest Skip ===")
+    client = FakeSkillsClient()
+    with tempfile.TemporaryDirectory() as tmp:
+        skill_dir = _skill_folder(tmp)
+
+        skill, action, _ = _upload(client, skill_dir)
+        assert action == "created" and client.calls == ["list", "create"]
+        manifest = upload_skill.load_manifest(skill_dir / upload_skill.MANIFEST_NAME)
+        assert manifest["skill_id"] == skill.id and manifest["version"] == "1"
+        assert len(manifest["files"]) == 2
+
+        client.calls.clear()
+        skill, action, changes = _upload(client, skill_dir)
+        assert action == "skipped" and client.calls == ["retrieve"], "Cached ID should skip listing"
+        assert not any(changes.values())
+
+        client.calls.clear()
+        _, action, _ = _upload(client, skill_dir, force=True)
+        assert action == "updated" and client.calls == ["retrieve", "versions.create", "retrieve"]
+    print("✓ Manifest skip test passed")
+
+
+def test_changes_create_new_version():
+    """Edited, added and removed files each trigger a full-snapshot upload."""
+    print("\n=== Testing Changed Uploads ===")
+    client = FakeSkillsClient()
+    with tempfile.TemporaryDirectory() as tmp:
+        skill_dir = _skill_folder(tmp)
+        _upload(client, skill_dir)
+
+        (skill_dir / "pptx_generator.py").write_text("print('new deck')\n")
+        (skill_dir / "color_utils.py").write_text("pass\n")
+        (skill_dir / "SKILL.md").unlink()
+        skill, action, changes = _upload(client, skill_dir)
+
+        assert action == "updated" and skill.latest_version == "2"
+        assert changes == {
+            "added": ["dj-brand-guide-generator/color_utils.py"],
+            "changed": ["dj-brand-guide-generator/pptx_generator.py"],
+            "removed": ["dj-brand-guide-generator/SKILL.md"],
+        }
+        assert [path for path, _, _ in skill.files] == [
+            "dj-brand-guide-generator/color_utils.py",
+            "dj-brand-guide-generator/pptx_generator.py",
+        ]
+        assert upload_skill.load_manifest(skill_dir / upload_skill.MANIFEST_NAME)["version"] == "2"
+
+        # A version uploaded from elsewhere makes the local manifest stale
+        client.skills[skill.id].latest_version = "3"
+        client.calls.clear()
+        _, action, _ = _upload(client, skill_dir)
+        assert action == "updated" and "versions.create" in client.calls
+    print("✓ Changed upload test passed")
+
+
+def test_lookup_pages_and_cache():
+    """Listing stops at the page holding the skill; later lookups are one retrieve call."""
+    print("\n=== Testing Paginated Lookup and ID Cache ===")
+    with tempfile.TemporaryDirectory() as tmp, SkillsAPIServer(_api_skills(15, title_at=7)) as server:
+        cache_path = Path(tmp) / upload_skill.SKILL_ID_CACHE_NAME
+        client = upload_skill.make_client("test-key", base_url=server.url)
+
+        skill = _find(client, cache_path)
+        assert skill.id == "skill_07"
+        assert [request.split("?")[0] for request in server.requests] == ["/v1/skills"] * 3, \
+            "Pages after the match should not be fetched"
+        assert "source=custom" in server.requests[0] and "page=3" in server.requests[1]
+        assert upload_skill._load_json(cache_path) == {upload_skill.SKILL_TITLE: "skill_07"}
+
+        server.requests.clear()
+        assert _find(client, cache_path).id == "skill_07"
+        assert [request.split("?")[0] for request in server.requests] == ["/v1/skills/skill_07"]
+
+        # Deleted skill: the stale ID is dropped and the lookup lists again
+        server.skills = _api_skills(4)
+        server.requests.clear()
+        assert _find(client, cache_path) is None
+        assert server.requests[0].startswith("/v1/skills/skill_07?") and len(server.requests) == 3
+        assert upload_skill._load_json(cache_path) == {}
+        assert len(server.client_ports) == 1, "Requests should reuse one connection"
+    print("✓ Paginated lookup test passed")
+
+
+def test_lookup_retries_and_errors():
+    """Transient failures are retried; other API errors are raised, not taken as a missing skill."""
+    print("\n=== Testing Lookup Retries and Errors ===")
+    with tempfile.TemporaryDirectory() as tmp:
+        cache_path = Path(tmp) / upload_skill.SKILL_ID_CACHE_NAME
+
+        with SkillsAPIServer(_api_skills(2, title_at=1), fail_first=2) as server:
+            client = upload_skill.make_client("test-key", base_url=server.url)
+            assert _find(client, cache_path).id == "skill_01"
+            assert len(server.requests) == 3
+
+        with SkillsAPIServer(_api_skills(2, title_at=1), status=401) as server:
+            client = upload_skill.make_client("test-key", base_url=server.url)
+            for path in (None, cache_path):
+                try:
+                    _find(client, path)
+                except Exception as e:
+                    assert getattr(e, "status_code", None) == 401
+                else:
+                    raise AssertionError("Lookup errors should be raised")
+    print("✓ Lookup retry test passed")
+
+
+def main():
+    """Run all tests."""
+    test_collect_skill_files()
+    test_unchanged_upload_is_skipped()
+    test_changes_create_new_version()
+    test_lookup_pages_and_cache()
+    test_lookup_retries_and_errors()
+    print("\n✓ All upload tests passed!")
+
+
+if __name__ == "__main__":
+    main()
@@ -1,4 +1,4 @@
-from color_utils import hex_to_cmyk, hex_to_rgb, is_light_color
+from color_utils import convert_colors, hex_to_cmyk, hex_to_rgb, hex_to_rgb_array, is_light_color
 
 # Test hex_to_cmyk
 cmyk = hex_to_cmyk("#0A1F44")
@@ -16,4 +16,24 @@ assert is_light_color("#000000") == False, "Black should be dark"
 print("is_light_color('#FFFFFF'): True")
 print("is_light_color('#000000'): False")
 
+# Test batch conversion matches the scalar helpers
+palette = ["#0A1F44", "00d9ff", "#8B00FF", "#000000", "#FFFFFF"]
+batch = convert_colors(palette)
+assert batch["rgb"].tolist() == [list(hex_to_rgb(h)) for h in palette], f"Batch RGB failed: {batch['rgb']}"
+assert batch["cmyk"].tolist() == [list(hex_to_cmyk(h).values()) for h in palette], f"Batch CMYK failed: {batch['cmyk']}"
+assert batch["is_light"].tolist() == [is_light_color(h) for h in palette], f"Batch luminance failed: {batch['is_light']}"
+print(f"convert_colors({len(palette)} colors): cmyk={batch['cmyk'].tolist()}")
+
+# Test batch validation
+for bad in (["#12345"], ["#GGGGGG"]):
+    try:
+        hex_to_rgb_array(bad)
+        raise AssertionError(f"Expected ValueError for {bad}")
+    except ValueError:
+        pass
+
+# Memoized helpers return fresh dicts
+hex_to_cmyk("#0A1F44")["c"] = -1
+assert hex_to_cmyk("#0A1F44")["c"] == 85, "Cached CMYK must not be shared mutable state"
+
 print("\n✓ All color utility tests passed!")
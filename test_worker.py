@@ -0,0 +1,115 @@
+#!/usr/bin/env python3
+"""
+Test script for the resident JSONL worker.
+Requires python-pptx to be installed.
+
+Usage:
+    python3 test_worker.py
+"""
+
+import io
+import json
+import os
+import socket
+import subprocess
+import sys
+import tempfile
+import threading
+
+SKILL_DIR = os.path.dirname(os.path.abspath(__file__))
+sys.path.insert(0, SKILL_DIR)
+
+from pptx import Presentation
+
+from worker import make_socket_server, serve_stream
+
+
+def _example_job(job_id, output_path=None):
+    """A job built from the bundled Aqua Voyager example files."""
+    job = {"id": job_id}
+    for key, name in (("dj_input", "input"), ("image_prompts", "prompts"), ("colors", "colors")):
+        with open(os.path.join(SKILL_DIR, f"aqua_voyager_{name}.json"), encoding="utf-8") as f:
+            job[key] = json.load(f)
+    if output_path:
+        job["output_path"] = output_path
+    return job
+
+
+def test_stream_worker():
+    """Each job line yields one result line; bad lines are reported, not fatal."""
+    print("\n=== Testing Stream Worker ===")
+    with tempfile.TemporaryDirectory() as tmp:
+        lines = [
+            json.dumps(_example_job("first")),
+            "",
+            "{not json",
+            json.dumps({"id": "no-colors", "dj_input": {}, "image_prompts": []}),
+            json.dumps(dict(_example_job("second"), options={"renderer": "ooxml"})),
+        ]
+        output = io.StringIO()
+        failed = serve_stream(lines, output, tmp)
+
+        results = [json.loads(line) for line in output.getvalue().splitlines()]
+        assert [r["id"] for r in results] == ["first", None, "no-colors", "second"]
+        assert failed == 2
+        assert results[1]["error"].startswith("JSONDecodeError")
+        assert results[2]["error"] == "KeyError: 'colors'"
+        for result in (results[0], results[3]):
+            assert result["error"] is None and result["seconds"] > 0
+            assert len(Presentation(result["output_path"]).slides) == 2
+    print("✓ Stream worker test passed")
+
+
+def test_socket_worker():
+    """Jobs sent over a Unix socket are answered on the same connection."""
+    print("\n=== Testing Socket Worker ===")
+    with tempfile.TemporaryDirectory() as tmp:
+        socket_path = os.path.join(tmp, "worker.sock")
+        server = make_socket_server(socket_path, tmp)
+        thread = threading.Thread(target=server.serve_forever, daemon=True)
+        thread.start()
+        try:
+            with socket.socket(socket.AF_UNIX, socket.SOCK_STREAM) as client:
+                client.connect(socket_path)
+                jobs = [_example_job(f"job-{i}", os.path.join(tmp, f"deck_{i}.pptx")) for i in range(2)]
+                client.sendall("".join(json.dumps(job) + "\n" for job in jobs).encode("utf-8"))
+                client.shutdown(socket.SHUT_WR)
+                with client.makefile("r", encoding="utf-8") as replies:
+                    results = [json.loads(line) for line in replies]
+        finally:
+            server.shutdown()
+            server.server_close()
+
+        assert [r["id"] for r in results] == ["job-0", "job-1"]
+        assert all(r["error"] is None and os.path.exists(r["output_path"]) for r in results)
+    print("✓ Socket worker test passed")
+
+
+def test_worker_cli():
+    """The CLI warms up, renders stdin jobs and writes results to stdout."""
+    print("\n=== Testing Worker CLI ===")
+    with tempfile.TemporaryDirectory() as tmp:
+        jobs = "".join(json.dumps(_example_job(f"cli-{i}")) + "\n" for i in range(3))
+        completed = subprocess.run(
+            [sys.executable, os.path.join(SKILL_DIR, "worker.py"), "--output-dir", tmp],
+            input=jobs, capture_output=True, text=True, timeout=120, cwd=tmp,
+        )
+        assert completed.returncode == 0, completed.stderr
+        assert "Worker ready" in completed.stderr
+        results = [json.loads(line) for line in completed.stdout.splitlines()]
+        assert [r["id"] for r in results] == ["cli-0", "cli-1", "cli-2"]
+        latencies = ", ".join(f"{r['seconds'] * 1000:.0f} ms" for r in results)
+        print(f"  Warm job latency: {latencies}")
+    print("✓ Worker CLI test passed")
+
+
+def main():
+    """Run all tests."""
+    test_stream_worker()
+    test_socket_worker()
+    test_worker_cli()
+    print("\n✓ All worker tests passed!")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,262 @@
+"""
+Text measurement for DJ Brand Guide Generator.
+Wraps and shrinks text to fit its box using cached glyph advance widths.
+
+Widths are the Adobe Helvetica AFM metrics (1/1000 em), which Arial shares
+exactly; PowerPoint substitutes Arial when Helvetica Neue is not installed,
+so these are the metrics most viewers lay the deck out with. Each font's
+table is expanded once, on first use, into an array indexed by code point.
+"""
+
+from array import array
+from functools import lru_cache
+from itertools import accumulate
+import logging
+import unicodedata
+
+logger = logging.getLogger(__name__)
+
+# Advance widths of printable ASCII (U+0020-U+007E), 1/1000 em
+_ASCII_WIDTHS = {
+    "Helvetica": (
+        278, 278, 355, 556, 556, 889, 667, 191, 333, 333, 389, 584, 278, 333, 278, 278,
+        556, 556, 556, 556, 556, 556, 556, 556, 556, 556, 278, 278, 584, 584, 584, 556,
+        1015, 667, 667, 722, 722, 667, 611, 778, 722, 278, 500, 667, 556, 833, 722, 778,
+        667, 778, 722, 667, 611, 722, 667, 944, 667, 667, 611, 278, 278, 278, 469, 556,
+        333, 556, 556, 500, 556, 556, 278, 556, 556, 222, 222, 500, 222, 833, 556, 556,
+        556, 556, 333, 500, 278, 556, 500, 722, 500, 500, 500, 334, 260, 334, 584,
+    ),
+    "Helvetica-Bold": (
+        278, 333, 474, 556, 556, 889, 722, 238, 333, 333, 389, 584, 278, 333, 278, 278,
+        556, 556, 556, 556, 556, 556, 556, 556, 556, 556, 333, 333, 584, 584, 584, 611,
+        975, 722, 722, 722, 722, 667, 611, 778, 722, 278, 556, 722, 611, 833, 722, 778,
+        667, 778, 722, 667, 611, 722, 667, 944, 667, 667, 611, 333, 278, 333, 584, 556,
+        333, 556, 611, 556, 611, 556, 333, 611, 611, 278, 278, 556, 278, 889, 611, 611,
+        611, 611, 389, 556, 333, 611, 556, 778, 556, 556, 500, 389, 280, 389, 584,
+    ),
+}
+
+# Widths of common non-ASCII punctuation, as (regular, bold)
+_PUNCTUATION_WIDTHS = {
+    "\u00a0": (278, 278), "·": (278, 278), "©": (737, 737), "®": (737, 737),
+    "°": (400, 400), "×": (584, 584), "«": (556, 556), "»": (556, 556),
+    "–": (556, 556), "—": (1000, 1000), "‘": (222, 278), "’": (222, 278),
+    "“": (333, 500), "”": (333, 500), "•": (350, 350), "…": (1000, 1000),
+}
+
+# Code points covered by the width tables (Latin blocks and General Punctuation)
+TABLE_SIZE = 0x2070
+
+# Width for anything else: average lowercase width, or a full em for wide (CJK) glyphs
+DEFAULT_WIDTH = 556
+WIDE_WIDTH = 1000
+
+# Fonts the deck uses -> the metrics they are measured with
+FONT_METRICS = {
+    "Helvetica Neue": "Helvetica",
+    "Helvetica": "Helvetica",
+    "Arial": "Helvetica",
+}
+
+# Line height as a multiple of font size (PowerPoint single spacing)
+LINE_SPACING = 1.2
+
+# EMU per point (python-pptx lengths are in EMU)
+EMU_PER_POINT = 12700
+
+# python-pptx text box insets, in points (0.1" left/right, 0.05" top/bottom)
+INSET_X = 7.2
+INSET_Y = 3.6
+
+
+@lru_cache(maxsize=None)
+def glyph_widths(font="Helvetica Neue", bold=False):
+    """
+    Return the advance widths (1/1000 em) of a font, indexed by code point.
+
+    Accented Latin letters take the width of their base letter. Built once
+    per font and weight.
+
+    Args:
+        font: Font name (fonts without metrics fall back to Helvetica)
+        bold: Bold weight
+
+    Returns:
+        array: Unsigned 16-bit widths for code points below TABLE_SIZE
+    """
+    metrics = FONT_METRICS.get(font, "Helvetica") + ("-Bold" if bold else "")
+    ascii_widths = _ASCII_WIDTHS[metrics]
+
+    widths = array("H", [DEFAULT_WIDTH]) * TABLE_SIZE
+    widths[0x20:0x7F] = array("H", ascii_widths)
+    for code in range(0xA0, TABLE_SIZE):
+        base = unicodedata.normalize("NFD", chr(code))[0]
+        if " " <= base <= "~":
+            widths[code] = ascii_widths[ord(base) - 0x20]
+    for char, (regular, bold_width) in _PUNCTUATION_WIDTHS.items():
+        widths[ord(char)] = bold_width if bold else regular
+    return widths
+
+
+def _char_width(char, widths):
+    """Width of one character, including those outside the table."""
+    code = ord(char)
+    if code < TABLE_SIZE:
+        return widths[code]
+    return WIDE_WIDTH if unicodedata.east_asian_width(char) in ("W", "F") else DEFAULT_WIDTH
+
+
+def _units(text, widths):
+    """Total advance width of text in 1/1000 em."""
+    try:
+        return sum(map(widths.__getitem__, map(ord, text)))
+    except IndexError:
+        return sum(_char_width(char, widths) for char in text)
+
+
+def text_width(text, size, font="Helvetica Neue", bold=False):
+    """
+    Measure the width of a single line of text.
+
+    Args:
+        text: Text to measure
+        size: Font size in points
+        font, bold: Font face
+
+    Returns:
+        float: Width in points
+    """
+    return _units(text, glyph_widths(font, bold)) * size / 1000
+
+
+def _paragraphs(text):
+    """Split box text into paragraphs (newlines and vertical tabs both break lines)."""
+    return text.replace("\r\n", "\n").replace("\v", "\n").split("\n")
+
+
+def _word_units(paragraph, widths):
+    """Widths of a paragraph's words (1/1000 em), from one pass over its characters."""
+    try:
+        offsets = [0, *accumulate(map(widths.__getitem__, map(ord, paragraph)))]
+    except IndexError:
+        offsets = [0, *accumulate(_char_width(char, widths) for char in paragraph)]
+    units = []
+    start = 0
+    for word in paragraph.split(" "):
+        end = start + len(word)
+        if word:
+            units.append(offsets[end] - offsets[start])
+        start = end + 1
+    return units
+
+
+def _count_lines(paragraphs, space, limit):
+    """Number of lines greedy word wrap produces; paragraphs hold word widths, all in 1/1000 em."""
+    lines = 0
+    for words in paragraphs:
+        lines += 1
+        used = None
+        for word in words:
+            if used is None:
+                used = word
+            elif used + space + word <= limit:
+                used += space + word
+            else:
+                lines += 1
+                used = word
+            # A word longer than the line breaks across lines
+            while used > limit:
+                lines += 1
+                used -= limit
+    return lines
+
+
+def wrap_text(text, width, size, font="Helvetica Neue", bold=False):
+    """
+    Break text into the lines a text box of the given width shows.
+
+    Paragraphs (newlines) always start a new line; words wrap greedily at
+    spaces, as PowerPoint does. A word wider than the line stays whole on
+    its own line here (PowerPoint breaks it; fit_text counts those lines).
+
+    Args:
+        text: Text to wrap
+        width: Line width in points (inside the box insets)
+        size: Font size in points
+        font, bold: Font face
+
+    Returns:
+        list: Lines of text
+    """
+    widths = glyph_widths(font, bold)
+    limit = width * 1000 / size
+    lines = []
+    for paragraph in _paragraphs(text):
+        line, used = [], 0
+        for word in paragraph.split(" "):
+            if not word:
+                continue
+            word_width = _units(word, widths)
+            if line and used + widths[0x20] + word_width > limit:
+                lines.append(" ".join(line))
+                line, used = [], 0
+            used += (widths[0x20] if line else 0) + word_width
+            line.append(word)
+        lines.append(" ".join(line))
+    return lines
+
+
+def fit_text(text, width, height, size, min_size=6.0, font="Helvetica Neue", bold=False, step=0.5):
+    """
+    Find the largest font size, up to `size`, at which text fits a text box.
+
+    Word widths are measured once; each candidate size only re-runs the
+    line count, so fitting a paragraph takes microseconds.
+
+    Args:
+        text: Box text (newlines separate paragraphs)
+        width, height: Text box size in points (insets are subtracted here)
+        size: Preferred font size in points
+        min_size: Smallest size to shrink to
+        font, bold: Font face
+        step: Size decrement in points
+
+    Returns:
+        tuple: (font size in points, fits); fits is False if the text
+            overflows even at min_size, which is then returned
+    """
+    widths = glyph_widths(font, bold)
+    paragraphs = [_word_units(paragraph, widths) for paragraph in _paragraphs(text)]
+    inner_width = width - 2 * INSET_X
+    inner_height = height - 2 * INSET_Y
+
+    candidate = size
+    while candidate >= min_size:
+        lines = _count_lines(paragraphs, widths[0x20], inner_width * 1000 / candidate)
+        if lines * candidate * LINE_SPACING <= inner_height:
+            return candidate, True
+        candidate -= step
+    return min_size, False
+
+
+def fit_font_size(text, width, height, size, min_size, font="Helvetica Neue", bold=False):
+    """
+    Font size for a fixed-size text box: `size`, shrunk as far as `min_size` to fit.
+
+    Text that overflows even at min_size is logged and set at min_size, so
+    nothing is cut; the box then overflows as before.
+
+    Args:
+        text: Box text
+        width, height: Text box size in EMU
+        size, min_size: Preferred and smallest font size in points
+        font, bold: Font face
+
+    Returns:
+        float: Font size in points
+    """
+    fitted, fits = fit_text(text, width / EMU_PER_POINT, height / EMU_PER_POINT, size, min_size, font, bold)
+    if not fits:
+        logger.warning("%d characters of text overflow a %.2f\" x %.2f\" box even at %gpt",
+                       len(text), width / EMU_PER_POINT / 72, height / EMU_PER_POINT / 72, min_size)
+    return fitted
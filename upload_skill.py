@@ -2,12 +2,32 @@
 """
 Upload the DJ Brand Guide skill to Anthropic Skills API.
 Run this script to get your SKILL_ID for the FastAPI .env file.
+
+A manifest of the uploaded files' content hashes is kept next to this
+script, so a run with nothing changed since the last upload is skipped
+instead of creating a redundant skill version.
+
+With --bundle, the minimal precompiled bundle from build_skill_bundle.py
+is uploaded instead of the whole folder.
+
+Usage:
+    ANTHROPIC_API_KEY=your_key python3 upload_skill.py [--force] [--bundle]
 """
 
-from anthropic import Anthropic
+from concurrent.futures import ThreadPoolExecutor
 from pathlib import Path
+import argparse
+import hashlib
+import json
 import os
 import sys
+import tempfile
+
+# Local record of the last upload (never uploaded itself)
+MANIFEST_NAME = '.skill_manifest.json'
+
+# Local title -> skill ID cache, so most runs look the skill up with one request
+SKILL_ID_CACHE_NAME = '.skill_ids.json'
 
 # Directories and files to exclude from upload
 EXCLUDE_PATTERNS = {
@@ -15,26 +35,55 @@ EXCLUDE_PATTERNS = {
     '.git', '.gitignore', '.gitignore_skill', 'node_modules',
     '.DS_Store', '.env', '.claude',
     'upload_skill.py',  # Don't upload the upload script itself
+    MANIFEST_NAME, SKILL_ID_CACHE_NAME,
     'README.md', 'CLAUDE.md',  # Project docs, not skill docs
 }
 
-# File extensions to exclude (example data)
-EXCLUDE_EXTENSIONS = {'.png', '.pptx', '.json'}
+# File extensions to exclude (example data, and temporary files left by interrupted runs)
+EXCLUDE_EXTENSIONS = {'.png', '.pptx', '.json', '.tmp'}
+
+# Threads reading files (reads are I/O bound, so this helps on network and cold disks)
+READ_WORKERS = 8
+
+SKILLS_BETA = "skills-2025-10-02"
+
+# Skills fetched per page when listing
+LIST_PAGE_SIZE = 100
+
+# Retries (with exponential backoff) before an API request fails
+MAX_RETRIES = 4
 
 
 SKILL_FOLDER_NAME = "dj-brand-guide-generator"
 
 
-def collect_skill_files(skill_dir: Path):
+def _mime_type(suffix):
+    """MIME type the Skills API expects for a file extension."""
+    if suffix == '.py':
+        return 'text/x-python'
+    elif suffix == '.md':
+        return 'text/markdown'
+    elif suffix == '.txt':
+        return 'text/plain'
+    elif suffix == '.json':
+        return 'application/json'
+    return 'application/octet-stream'
+
+
+def collect_skill_files(skill_dir: Path, max_workers=READ_WORKERS, include_bytecode=False):
     """
     Collect files from skill directory, excluding venv, __pycache__, and example data.
 
+    Files are read in parallel and returned sorted by name, so the same
+    folder always produces the same payload. With include_bytecode (for
+    bundles from build_skill_bundle.py), __pycache__/*.pyc is included.
+
     Returns list of tuples: (filepath, file_content, mime_type)
     Note: filepath must include a directory prefix (e.g., "skill/SKILL.md")
     """
-    files = []
+    paths = []
 
-    for item in skill_dir.iterdir():
+    for item in sorted(skill_dir.iterdir()):
         # Skip excluded directories and files
         if item.name in EXCLUDE_PATTERNS:
             continue
@@ -47,48 +96,243 @@ def collect_skill_files(skill_dir: Path):
         if item.suffix.lower() in EXCLUDE_EXTENSIONS:
             continue
 
-        # Read file content
-        content = item.read_bytes()
-
-        # Determine mime type
-        if item.suffix == '.py':
-            mime_type = 'text/x-python'
-        elif item.suffix == '.md':
-            mime_type = 'text/markdown'
-        elif item.suffix == '.txt':
-            mime_type = 'text/plain'
-        elif item.suffix == '.json':
-            mime_type = 'application/json'
-        else:
-            mime_type = 'application/octet-stream'
+        paths.append(item)
+
+    if include_bytecode and (skill_dir / '__pycache__').is_dir():
+        paths.extend(sorted((skill_dir / '__pycache__').glob('*.pyc')))
+
+    with ThreadPoolExecutor(max_workers=max_workers) as executor:
+        contents = list(executor.map(Path.read_bytes, paths))
+
+    # Files must have a directory prefix for the API
+    return [
+        (f"{SKILL_FOLDER_NAME}/{item.relative_to(skill_dir).as_posix()}", content, _mime_type(item.suffix))
+        for item, content in zip(paths, contents)
+    ]
+
+
+def build_manifest(skill_files):
+    """
+    Hash each file of an upload payload.
+
+    Returns:
+        dict: filepath -> SHA-256 hex digest
+    """
+    return {filepath: hashlib.sha256(content).hexdigest() for filepath, content, _ in skill_files}
+
+
+def _load_json(path: Path):
+    """Return a local JSON file's contents, or None if it is missing or unreadable."""
+    try:
+        with open(path, encoding='utf-8') as f:
+            return json.load(f)
+    except (OSError, ValueError):
+        return None
+
+
+def _save_json(path: Path, data):
+    """Write a local JSON file atomically, so an interrupted run never leaves half a file."""
+    fd, tmp_path = tempfile.mkstemp(dir=path.parent, prefix=f'{path.name}.', suffix='.tmp')
+    try:
+        with os.fdopen(fd, 'w', encoding='utf-8') as f:
+            f.write(json.dumps(data, indent=2, sort_keys=True) + '\n')
+        os.replace(tmp_path, path)
+    except BaseException:
+        os.remove(tmp_path)
+        raise
+
+
+def load_manifest(manifest_path: Path):
+    """Return the manifest of the last upload, or None if there is none (or it is unreadable)."""
+    return _load_json(manifest_path)
+
+
+def save_manifest(manifest_path: Path, skill, version, files):
+    """Record what was uploaded."""
+    _save_json(manifest_path, {'skill_id': skill.id, 'version': version, 'files': files})
+
 
-        # Files must have a directory prefix for the API
-        filepath = f"{SKILL_FOLDER_NAME}/{item.name}"
-        files.append((filepath, content, mime_type))
+def diff_manifest(previous_files, files):
+    """
+    Compare two manifests' file hashes.
 
-    return files
+    Returns:
+        dict: "added", "changed" and "removed" lists of filepaths
+    """
+    previous_files = previous_files or {}
+    return {
+        'added': sorted(set(files) - set(previous_files)),
+        'changed': sorted(path for path in files if path in previous_files and files[path] != previous_files[path]),
+        'removed': sorted(set(previous_files) - set(files)),
+    }
 
 
 SKILL_TITLE = "DJ Brand Guide Generator"
 
 
-def find_existing_skill(client, title: str):
+def make_client(api_key, base_url=None, max_retries=MAX_RETRIES):
+    """
+    Create the API client for a run.
+
+    One client serves every request: it keeps a pool of keep-alive
+    connections and retries connection errors, 408/409/429 and 5xx
+    responses with exponential backoff (honouring Retry-After).
+
+    Args:
+        api_key: Anthropic API key
+        base_url: API URL (defaults to ANTHROPIC_BASE_URL or the public API)
+        max_retries: Retries per request
+
+    Returns:
+        Anthropic: Client
+    """
+    from anthropic import Anthropic
+
+    return Anthropic(api_key=api_key, base_url=base_url, max_retries=max_retries)
+
+
+def remember_skill_id(cache_path: Path, title: str, skill_id):
+    """Store (or, with skill_id None, forget) a title's skill ID in the local cache."""
+    if cache_path is None:
+        return
+    skill_ids = _load_json(cache_path) or {}
+    if skill_ids.get(title) == skill_id:
+        return
+    if skill_id is None:
+        skill_ids.pop(title, None)
+    else:
+        skill_ids[title] = skill_id
+    _save_json(cache_path, skill_ids)
+
+
+def find_existing_skill(client, title: str, cache_path: Path = None):
     """
     Find an existing skill by display_title.
 
+    A cached skill ID is checked with a single retrieve call. Without one
+    (or if the skill was deleted or renamed), custom skills are listed
+    page by page until the title is found, and the match is cached.
+    API errors other than a stale cached ID are raised, so a failed lookup
+    never passes for a missing skill (which would create a duplicate).
+
+    Args:
+        client: Anthropic client (or any object with the same beta.skills API)
+        title: Skill display title
+        cache_path: Title -> skill ID cache file, or None to always list
+
     Returns skill object if found, None otherwise.
     """
-    try:
-        skills = client.beta.skills.list(betas=["skills-2025-10-02"])
-        for skill in skills.data:
-            if skill.display_title == title:
-                return skill
-    except Exception as e:
-        print(f"Warning: Could not list skills: {e}")
+    cached_id = (_load_json(cache_path) or {}).get(title) if cache_path is not None else None
+    if cached_id:
+        try:
+            skill = client.beta.skills.retrieve(skill_id=cached_id, betas=[SKILLS_BETA])
+        except Exception as e:
+            if getattr(e, 'status_code', None) != 404:
+                raise
+            skill = None
+        if skill is not None and skill.display_title == title:
+            return skill
+        print(f"Cached skill ID {cached_id} is stale; listing skills...")
+
+    # Iterating the page fetches the next page only when it is reached
+    for skill in client.beta.skills.list(source="custom", limit=LIST_PAGE_SIZE, betas=[SKILLS_BETA]):
+        if skill.display_title == title:
+            remember_skill_id(cache_path, title, skill.id)
+            return skill
+
+    if cached_id:
+        remember_skill_id(cache_path, title, None)
     return None
 
 
-def main():
+def upload_skill(client, skill_dir: Path, force=False, state_dir: Path = None, include_bytecode=False):
+    """
+    Upload the skill folder unless it is unchanged since the last upload.
+
+    The upload is skipped when the manifest's file hashes match the folder
+    and its skill is still the existing skill at the version it recorded.
+    Each skill version is a complete snapshot, so a changed folder is
+    always uploaded in full; the manifest only decides whether to upload.
+
+    Args:
+        client: Anthropic client (or any object with the same beta.skills API)
+        skill_dir: Skill folder (or bundle) to upload
+        force: Upload even if nothing changed
+        state_dir: Folder for the manifest and skill ID cache (default: skill_dir)
+        include_bytecode: Upload __pycache__/*.pyc too (for bundles)
+
+    Returns:
+        tuple: (skill, action, changes) where action is "created", "updated"
+            or "skipped" and changes is diff_manifest's result
+    """
+    state_dir = state_dir or skill_dir
+    manifest_path = state_dir / MANIFEST_NAME
+    cache_path = state_dir / SKILL_ID_CACHE_NAME
+    skill_files = collect_skill_files(skill_dir, include_bytecode=include_bytecode)
+    files = build_manifest(skill_files)
+    previous = load_manifest(manifest_path) or {}
+    changes = diff_manifest(previous.get('files'), files)
+
+    print(f"Uploading skill from: {skill_dir}")
+    print("\nFiles to upload:")
+    for filepath, content, _ in skill_files:
+        status = next((name for name in ('added', 'changed') if filepath in changes[name]), None)
+        print(f"  - {filepath} ({len(content)} bytes)" + (f" [{status}]" if status and previous else ""))
+    for filepath in changes['removed']:
+        print(f"  - {filepath} [removed]")
+
+    # Check for existing skill
+    print(f"\nChecking for existing skill '{SKILL_TITLE}'...")
+    existing_skill = find_existing_skill(client, SKILL_TITLE, cache_path)
+
+    if existing_skill:
+        unchanged = previous.get('skill_id') == existing_skill.id and not any(changes.values())
+        latest = getattr(existing_skill, 'latest_version', None)
+        if unchanged and latest is not None and str(latest) != str(previous.get('version')):
+            # Someone uploaded another version since; restore ours
+            unchanged = False
+        if unchanged and not force:
+            print(f"No changes since version {previous.get('version')}; skipping upload.")
+            return existing_skill, "skipped", changes
+
+        # Create new version of existing skill
+        print(f"Found existing skill: {existing_skill.id}")
+        print("Creating new version...")
+        new_version = client.beta.skills.versions.create(
+            skill_id=existing_skill.id,
+            files=skill_files,
+            betas=[SKILLS_BETA]
+        )
+        # Retrieve updated skill info
+        skill = client.beta.skills.retrieve(
+            skill_id=existing_skill.id,
+            betas=[SKILLS_BETA]
+        )
+        version = new_version.version
+        action = "updated"
+    else:
+        # Create new skill
+        print("No existing skill found. Creating new skill...")
+        skill = client.beta.skills.create(
+            display_title=SKILL_TITLE,
+            files=skill_files,
+            betas=[SKILLS_BETA]
+        )
+        version = getattr(skill, 'latest_version', None)
+        action = "created"
+        remember_skill_id(cache_path, SKILL_TITLE, skill.id)
+
+    save_manifest(manifest_path, skill, version, files)
+    return skill, action, changes
+
+
+def main(argv=None):
+    parser = argparse.ArgumentParser(description="Upload the DJ Brand Guide skill to the Anthropic Skills API.")
+    parser.add_argument("--force", action="store_true", help="Upload even if nothing changed since the last upload")
+    parser.add_argument("--bundle", action="store_true",
+                        help="Upload a minimal precompiled bundle (see build_skill_bundle.py)")
+    args = parser.parse_args(argv)
+
     # Check for API key
     api_key = os.environ.get("ANTHROPIC_API_KEY")
     if not api_key:
@@ -96,63 +340,39 @@ def main():
         print("Usage: ANTHROPIC_API_KEY=your_key python3 upload_skill.py")
         sys.exit(1)
 
-    # Initialize client
-    client = Anthropic(api_key=api_key)
+    # Initialize client (the SDK is imported there, so the helpers above work without it)
+    client = make_client(api_key)
 
     # Skill directory (current directory where this script lives)
     skill_dir = Path(__file__).parent
 
-    # Collect files (excluding venv, __pycache__, etc.)
-    skill_files = collect_skill_files(skill_dir)
-
-    print(f"Uploading skill from: {skill_dir}")
-    print("\nFiles to upload:")
-    for filepath, content, _ in skill_files:
-        print(f"  - {filepath} ({len(content)} bytes)")
-
     try:
-        # Check for existing skill
-        print(f"\nChecking for existing skill '{SKILL_TITLE}'...")
-        existing_skill = find_existing_skill(client, SKILL_TITLE)
-
-        if existing_skill:
-            # Create new version of existing skill
-            print(f"Found existing skill: {existing_skill.id}")
-            print("Creating new version...")
-            new_version = client.beta.skills.versions.create(
-                skill_id=existing_skill.id,
-                files=skill_files,
-                betas=["skills-2025-10-02"]
-            )
-            # Retrieve updated skill info
-            skill = client.beta.skills.retrieve(
-                skill_id=existing_skill.id,
-                betas=["skills-2025-10-02"]
-            )
-            action = f"updated (new version: {new_version.version})"
+        if args.bundle:
+            from build_skill_bundle import build_bundle
+
+            with tempfile.TemporaryDirectory() as tmp:
+                bundle_dir = Path(tmp) / SKILL_FOLDER_NAME
+                build_bundle(bundle_dir)
+                skill, action, _ = upload_skill(client, bundle_dir, force=args.force, state_dir=skill_dir,
+                                                include_bytecode=True)
         else:
-            # Create new skill
-            print("No existing skill found. Creating new skill...")
-            skill = client.beta.skills.create(
-                display_title=SKILL_TITLE,
-                files=skill_files,
-                betas=["skills-2025-10-02"]
-            )
-            action = "created"
-
-        print("\n" + "="*60)
-        print(f"✓ Skill {action} successfully!")
-        print("="*60)
-        print(f"\nSkill ID: {skill.id}")
-        print(f"Display Title: {skill.display_title}")
-        print(f"\n🔑 Add this to your FastAPI .env file:")
-        print(f"SKILL_ID={skill.id}")
-        print("="*60)
-
+            skill, action, _ = upload_skill(client, skill_dir, force=args.force)
     except Exception as e:
         print(f"\n❌ Error uploading skill: {e}")
         sys.exit(1)
 
+    print("\n" + "="*60)
+    if action == "skipped":
+        print("✓ Skill is up to date; no new version created")
+    else:
+        print(f"✓ Skill {action} successfully!")
+    print("="*60)
+    print(f"\nSkill ID: {skill.id}")
+    print(f"Display Title: {skill.display_title}")
+    print(f"\n🔑 Add this to your FastAPI .env file:")
+    print(f"SKILL_ID={skill.id}")
+    print("="*60)
+
 
 if __name__ == "__main__":
     main()
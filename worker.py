@@ -0,0 +1,151 @@
+#!/usr/bin/env python3
+"""
+Resident worker for DJ Brand Guide Generator.
+Keeps imports, templates and caches warm and renders JSONL jobs as they arrive.
+
+Each input line is a job in the batch_generator format ("dj_input",
+"image_prompts", "colors", optional "visual_pillars", "output_path",
+"options") plus an optional "id" that is echoed back. Each job produces one
+result line: {"id", "index", "output_path", "error", "seconds"}.
+
+Usage:
+    python3 worker.py [--output-dir DIR] < jobs.jsonl       # Jobs on stdin, results on stdout
+    python3 worker.py --socket /tmp/brand-guide.sock         # Serve a local Unix socket
+"""
+
+import argparse
+import io
+import itertools
+import json
+import os
+import socketserver
+import sys
+import time
+
+sys.path.insert(0, os.path.dirname(os.path.abspath(__file__)))
+
+from batch_generator import parse_job, render_job
+from pptx_generator import create_brand_guide, load_base_template
+
+
+def warm_up(template_path=None):
+    """
+    Pay one-off costs before the first job: parse the base template and
+    build a throwaway deck so every code path is imported and initialised.
+
+    Returns:
+        float: Seconds spent warming up
+    """
+    start = time.perf_counter()
+    load_base_template(template_path)
+    create_brand_guide(
+        {"dj_name": "Warm Up"},
+        [{"label": "WARM UP", "prompt": "Warm up.", "file_id": None}],
+        {"primary": {"name": "Black", "hex": "#000000"}, "palette": [{"name": "White", "hex": "#FFFFFF"}]},
+        io.BytesIO(),
+        visual_pillars=[{"name": "WARM UP"}],
+        template_path=template_path,
+    )
+    return time.perf_counter() - start
+
+
+def handle_line(line, index, output_dir):
+    """
+    Render the job on one JSONL line.
+
+    Returns:
+        dict: Result record
+    """
+    try:
+        job = parse_job(line)
+    except ValueError as e:
+        return {"id": None, "index": index, "output_path": None, "error": f"{type(e).__name__}: {e}",
+                "seconds": 0.0}
+
+    result = render_job(index, job, output_dir)
+    return {"id": job.get("id"), **result}
+
+
+def serve_stream(lines, output, output_dir=".", counter=None):
+    """
+    Render jobs from an iterable of lines, writing one result line per job.
+
+    Args:
+        lines: Iterable of JSONL lines (e.g. sys.stdin)
+        output: Text stream for result lines (flushed after each job)
+        output_dir: Directory for jobs without an explicit "output_path"
+        counter: Optional itertools.count shared across streams for job indexes
+
+    Returns:
+        int: Number of jobs that failed
+    """
+    counter = counter if counter is not None else itertools.count()
+    failed = 0
+    for line in lines:
+        if not line.strip():
+            continue
+        result = handle_line(line, next(counter), output_dir)
+        failed += bool(result["error"])
+        output.write(json.dumps(result) + "\n")
+        output.flush()
+    return failed
+
+
+class _JobHandler(socketserver.StreamRequestHandler):
+    """One client connection: JSONL jobs in, JSONL results out."""
+
+    def handle(self):
+        lines = (line.decode("utf-8") for line in self.rfile)
+        output = io.TextIOWrapper(self.wfile, encoding="utf-8", write_through=True)
+        try:
+            serve_stream(lines, output, self.server.output_dir, self.server.counter)
+        finally:
+            output.detach()
+
+
+def make_socket_server(socket_path, output_dir="."):
+    """
+    Create a Unix socket server that renders jobs from each connection.
+
+    Connections are served one at a time, so jobs never compete for the CPU
+    or the warm caches. A stale socket file from a previous run is replaced.
+
+    Returns:
+        socketserver.UnixStreamServer: Call serve_forever() to start serving
+    """
+    if os.path.exists(socket_path):
+        os.unlink(socket_path)
+    server = socketserver.UnixStreamServer(socket_path, _JobHandler)
+    server.output_dir = output_dir
+    server.counter = itertools.count()
+    return server
+
+
+def main(argv=None):
+    parser = argparse.ArgumentParser(description="Render brand guide jobs from JSONL in a warm, resident process.")
+    parser.add_argument("--socket", metavar="PATH", help="Serve a Unix socket instead of stdin/stdout")
+    parser.add_argument("--output-dir", default=".", help="Directory for jobs without an output_path")
+    parser.add_argument("--template", metavar="PATH", help="Template .pptx to pre-load")
+    args = parser.parse_args(argv)
+
+    os.makedirs(args.output_dir, exist_ok=True)
+    seconds = warm_up(args.template)
+    print(f"Worker ready (warm-up {seconds * 1000:.0f} ms)", file=sys.stderr)
+
+    if not args.socket:
+        return 1 if serve_stream(sys.stdin, sys.stdout, args.output_dir) else 0
+
+    server = make_socket_server(args.socket, args.output_dir)
+    print(f"Listening on {args.socket}", file=sys.stderr)
+    try:
+        server.serve_forever()
+    except KeyboardInterrupt:
+        pass
+    finally:
+        server.server_close()
+        os.unlink(args.socket)
+    return 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())